@@ -0,0 +1,198 @@
+"""Benchmark of the config classes serialization
+
+Compares the cached serializers of BaseAttrs (json and msgpack) with the previous reflective implementation (attrs.asdict + recursive serialization, per key lookups and type checks on load) on the largest config classes.
+
+Usage:
+    python3 benchmarks/config_serialization.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from copy import deepcopy
+from functools import partial
+from types import GenericAlias, NoneType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Union,
+    _GenericAlias,
+    get_args,
+    get_origin,
+)
+
+import numpy as np
+from attrs import asdict, fields_dict
+
+from ros_sugar.config import BaseComponentConfig, QoSConfig
+from ros_sugar.config.base_attrs import BaseAttrs, skip_no_init
+from ros_sugar.io.topic import Topic
+from ros_sugar.tf import TFListenerConfig
+
+
+def _legacy_serialize_list(list_items: List) -> List:
+    """Previous BaseAttrs.__list_to_serialized_list"""
+    serialized_list = []
+    for item in list_items:
+        if isinstance(item, np.ndarray):
+            item = item.tolist()
+        if isinstance(item, BaseAttrs):
+            serialized_list.append(legacy_to_json(item))
+        elif isinstance(item, List):
+            serialized_list.append(_legacy_serialize_list(item))
+        elif isinstance(item, tuple):
+            serialized_list.append(tuple(_legacy_serialize_list(list(item))))
+        elif isinstance(item, Dict):
+            serialized_list.append(_legacy_serialize_dict(item))
+        elif type(item) not in [float, int, str, bool]:
+            serialized_list.append(str(item))
+        else:
+            serialized_list.append(item)
+    return serialized_list
+
+
+def _legacy_serialize_dict(dictionary: Dict) -> Dict:
+    """Previous BaseAttrs.__dict_to_serialized_dict"""
+    for name, value in dictionary.items():
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        if isinstance(value, List):
+            dictionary[name] = _legacy_serialize_list(value)
+        elif isinstance(value, tuple):
+            dictionary[name] = tuple(_legacy_serialize_list(list(value)))
+        elif isinstance(value, Dict):
+            dictionary[name] = _legacy_serialize_dict(value)
+        elif type(value) not in [float, int, str, bool, NoneType]:
+            dictionary[name] = str(value)
+    return dictionary
+
+
+def legacy_to_json(config: BaseAttrs) -> str:
+    """Previous BaseAttrs.to_json"""
+    return json.dumps(_legacy_serialize_dict(asdict(config, filter=skip_no_init)))
+
+
+def _legacy_setattr(config: BaseAttrs, name: str, value: Any) -> None:
+    """Previous BaseAttrs.__setattr__ (validators lookup on each set)"""
+    for attribute in [
+        a for a in getattr(config.__class__, "__attrs_attrs__", []) if a.name == name
+    ]:
+        if attribute.validator is not None:
+            attribute.validator(config, attribute, value)
+    object.__setattr__(config, name, value)
+
+
+def _legacy_check_value(key: str, value: Any, attribute_type: Any) -> Any:
+    """Previous BaseAttrs.__check_value_against_attr_type"""
+    if getattr(attribute_type, "__origin__", None) is Union:
+        _types = [
+            get_origin(t) if isinstance(t, (GenericAlias, _GenericAlias)) else t
+            for t in get_args(attribute_type)
+        ]
+        if not any(isinstance(value, t) for t in _types):
+            raise TypeError(f"Incompatible type for attribute {key}")
+    elif isinstance(value, List) and attribute_type is np.ndarray:
+        value = np.array(value)
+    else:
+        _attribute_type = (
+            get_origin(attribute_type)
+            if isinstance(attribute_type, (GenericAlias, _GenericAlias))
+            else attribute_type
+        )
+        if not isinstance(value, _attribute_type):
+            raise TypeError(f"Incompatible type for attribute {key}")
+    return value
+
+
+def _legacy_parse_list(list_attr: List, value: List) -> List:
+    """Previous BaseAttrs.__parse_from_serialized_list"""
+    new_list = []
+    attr_val = list_attr[0]
+    for val in value:
+        if hasattr(attr_val, "__attrs_attrs__"):
+            if not isinstance(val, Dict):
+                raise TypeError("Incompatible type, expecting a list of dictionaries")
+            legacy_from_dict(attr_val, val)
+        new_list.append(deepcopy(attr_val))
+    return new_list
+
+
+def legacy_from_dict(config: BaseAttrs, dict_obj: Dict) -> None:
+    """Previous BaseAttrs.from_dict"""
+    for key, value in dict_obj.items():
+        if key not in asdict(config).keys():
+            continue
+        attribute_to_set = getattr(config, key)
+        attribute_type = fields_dict(config.__class__)[key].type
+        if hasattr(attribute_to_set, "__attrs_attrs__"):
+            if not isinstance(value, Dict):
+                raise TypeError(f"Incompatible type for attribute {key}")
+            legacy_from_dict(attribute_to_set, value)
+        elif isinstance(attribute_to_set, List):
+            _legacy_setattr(config, key, _legacy_parse_list(attribute_to_set, value))
+        else:
+            if attribute_type is Any:
+                continue
+            elif attribute_type:
+                value = _legacy_check_value(key, value, attribute_type)
+            _legacy_setattr(config, key, value)
+
+
+def legacy_from_json(config: BaseAttrs, json_obj: str) -> None:
+    """Previous BaseAttrs.from_json"""
+    legacy_from_dict(config, json.loads(json_obj))
+
+
+def _time(method: Callable, number: int) -> float:
+    """Mean execution time (microseconds)"""
+    return timeit.timeit(method, number=number) / number * 1e6
+
+
+def run(number: int) -> None:
+    """Run the benchmark on the config classes
+
+    :param number: Number of executions of each method
+    :type number: int
+    """
+    configs: Dict[str, BaseAttrs] = {
+        "BaseComponentConfig": BaseComponentConfig(loop_rate=50.0),
+        "Topic": Topic(name="/image", msg_type="Image", qos_profile=QoSConfig()),
+        "TFListenerConfig": TFListenerConfig(),
+        "QoSConfig": QoSConfig(),
+    }
+
+    print(
+        f"{'config':<22}{'legacy json':>14}{'to_json':>10}{'to_msgpack':>12}"
+        f"{'legacy load':>14}{'from_json':>12}{'from_msgpack':>14}   (us)"
+    )
+    for name, config in configs.items():
+        json_obj = config.to_json()
+        msgpack_obj = config.to_msgpack()
+        # All the load methods include parsing the serialized form
+        results = (
+            _time(partial(legacy_to_json, config), number),
+            _time(config.to_json, number),
+            _time(config.to_msgpack, number),
+            _time(partial(legacy_from_json, config, json_obj), number),
+            _time(partial(config.from_json, json_obj), number),
+            _time(partial(config.from_msgpack, msgpack_obj), number),
+        )
+        print(
+            f"{name:<22}{results[0]:>14.2f}{results[1]:>10.2f}{results[2]:>12.2f}"
+            f"{results[3]:>14.2f}{results[4]:>12.2f}{results[5]:>14.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Config serialization benchmark")
+    parser.add_argument(
+        "--number", type=int, default=10000, help="Number of executions per method"
+    )
+    args = parser.parse_args()
+    run(args.number)
+
+
+if __name__ == "__main__":
+    main()
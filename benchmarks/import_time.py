@@ -0,0 +1,126 @@
+"""Benchmark of the ros_sugar import (startup) time
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters, reports the median cumulative import time of the module, the slowest imported modules and checks that the optional heavy dependencies (loaded on first use) are not imported eagerly.
+
+The benchmark fails (exit code 1) if the median import time exceeds the given budget or if a lazy dependency is imported.
+
+Usage:
+    python3 benchmarks/import_time.py [--module ros_sugar] [--runs N] [--budget MS] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Optional heavy dependencies which should only be imported on first use
+LAZY_MODULES = ("cv2", "PIL", "jinja2", "msgpack_numpy", "quaternion")
+
+
+def _parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """Parse the output of `python -X importtime`
+
+    :param output: Interpreter stderr
+    :type output: str
+
+    :return: Imported modules {name: (self time, cumulative time)} (microseconds)
+    :rtype: Dict[str, Tuple[int, int]]
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def _run_once(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import a module in a fresh interpreter
+
+    :param module: Module name
+    :type module: str
+
+    :return: Imported modules {name: (self time, cumulative time)} (microseconds)
+    :rtype: Dict[str, Tuple[int, int]]
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Cannot import '{module}': {result.stderr[-2000:]}")
+    return _parse_importtime(result.stderr)
+
+
+def run(module: str, runs: int, budget: float, top: int) -> bool:
+    """Run the benchmark
+
+    :param module: Module to import
+    :type module: str
+    :param runs: Number of fresh interpreter runs
+    :type runs: int
+    :param budget: Import time budget (milliseconds)
+    :type budget: float
+    :param top: Number of slowest modules to report
+    :type top: int
+
+    :return: If the import is within the budget without eager lazy dependencies
+    :rtype: bool
+    """
+    cumulative_times: List[float] = []
+    modules: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        modules = _run_once(module)
+        cumulative_times.append(modules[module][1] / 1e3)
+
+    median_time = statistics.median(cumulative_times)
+    print(
+        f"import {module}: median {median_time:.1f} ms "
+        f"(min {min(cumulative_times):.1f}, max {max(cumulative_times):.1f}, "
+        f"{runs} runs, budget {budget:.1f} ms), {len(modules)} modules"
+    )
+
+    print(f"\n{'self (ms)':>10}{'cumulative (ms)':>17}  module")
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_time, cumulative_time) in slowest[:top]:
+        print(f"{self_time / 1e3:>10.1f}{cumulative_time / 1e3:>17.1f}  {name}")
+
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print(f"\nLazy dependencies imported eagerly: {', '.join(eager)}")
+
+    within_budget = median_time <= budget
+    if not within_budget:
+        print(f"\nImport time exceeds the budget by {median_time - budget:.1f} ms")
+    return within_budget and not eager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time benchmark")
+    parser.add_argument(
+        "--module", type=str, default="ros_sugar", help="Module to import"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Number of fresh interpreter runs"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1000.0,
+        help="Import time budget (milliseconds)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of slowest modules to report"
+    )
+    args = parser.parse_args()
+    sys.exit(0 if run(args.module, args.runs, args.budget, args.top) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 """ROS Service/Action Client Wrapper"""
 
+import threading
 import time as rostime
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Callable, Optional, Set
 
 import rclpy
 from attrs import Factory, define, field
 from rclpy.action.client import ActionClient
 from rclpy.callback_groups import CallbackGroup, ReentrantCallbackGroup
 from rclpy.executors import Executor
+from rclpy.task import Future
 
 from .config import BaseAttrs, base_validators
 from .core import BaseNode
@@ -27,6 +30,15 @@ class ServiceClientConfig(BaseAttrs):
     attempt_period_secs: float = field(
         default=0.1, validator=base_validators.in_range(min_value=1e-9, max_value=1e9)
     )  # time period to attempt to call the service again
+    response_timeout_secs: float = field(
+        default=10.0, validator=base_validators.in_range(min_value=1e-9, max_value=1e9)
+    )  # timeout when waiting for the service response
+    availability_cache_secs: float = field(
+        default=1.0, validator=base_validators.in_range(min_value=0.0, max_value=1e9)
+    )  # time during which the service availability is not checked again
+    callback_group: CallbackGroup = field(
+        default=Factory(ReentrantCallbackGroup)
+    )  # callback group for the service responses
 
 
 @define
@@ -49,11 +61,56 @@ class ActionClientConfig(BaseAttrs):
     feedback_check_timeout: float = field(
         default=5.0, validator=base_validators.in_range(min_value=1e-9, max_value=1e9)
     )  # timeout if feedback is not recieved after x seconds
+    availability_cache_secs: float = field(
+        default=1.0, validator=base_validators.in_range(min_value=0.0, max_value=1e9)
+    )  # time during which the server availability is not checked again
     callback_group: CallbackGroup = field(
         default=Factory(ReentrantCallbackGroup)
     )  # callback group for the feedback callback of the action
 
 
+def _send_when_available(
+    handler: Any, send_method: Callable[[], Future], future: Future, timeout: float
+) -> None:
+    """
+    Sends a request once the service/action server of a client handler is available, without blocking. Availability is checked with a timer every 'attempt_period_secs' and the request is dropped after the given timeout
+
+    :param handler: Service or action client handler
+    :type handler: ServiceClientHandler | ActionClientHandler
+    :param send_method: Method sending the request and returning the request future
+    :type send_method: Callable[[], Future]
+    :param future: Future returned to the caller, done with the result of the request future (None if the request is dropped)
+    :type future: Future
+    :param timeout: Timeout (seconds) for the service/server to become available
+    :type timeout: float
+    """
+    start_time = rostime.monotonic()
+    timer = None
+
+    def _forward_result(request_future: Future) -> None:
+        future.set_result(request_future.result())
+
+    def _attempt() -> None:
+        if future.done():
+            handler.node.destroy_timer(timer)
+            return
+        if handler.is_available():
+            handler.node.destroy_timer(timer)
+            send_method().add_done_callback(_forward_result)
+        elif rostime.monotonic() - start_time > timeout:
+            handler.node.destroy_timer(timer)
+            handler.node.get_logger().warn(
+                f"{handler.config.name} is not available after {timeout} secs, Cancelling"
+            )
+            future.set_result(None)
+
+    timer = handler.node.create_timer(
+        handler.config.attempt_period_secs,
+        _attempt,
+        callback_group=handler.config.callback_group,
+    )
+
+
 class ServiceClientHandler:
     """
     General purpose service client class
@@ -75,12 +132,12 @@ class ServiceClientHandler:
         :type srv_name: ServiceClientConfig
 
         """
-        if not config and (srv_name and srv_type):
+        if not config:
+            if not (srv_name and srv_type):
+                raise ValueError(
+                    "Cannot initialize service client. Provide a valid config or a valid service name and service type"
+                )
             config = ServiceClientConfig(name=srv_name, srv_type=srv_type)
-        else:
-            raise ValueError(
-                "Cannot initialize service client. Provide a valid config or a valid service name and service type"
-            )
 
         # If config is provided plus additional name or type -> update name or type
         if srv_name:
@@ -94,7 +151,89 @@ class ServiceClientHandler:
         self.node.get_logger().debug(
             f"creating client for {self.config.name} of type {self.config.srv_type}"
         )
-        self.client = self.node.create_client(self.config.srv_type, self.config.name)
+        self.client = self.node.create_client(
+            self.config.srv_type,
+            self.config.name,
+            callback_group=self.config.callback_group,
+        )
+
+        # Last time the service was found available (cached availability)
+        self._available_time: Optional[float] = None
+        # Requests in flight
+        self._pending_futures: Set[Future] = set()
+        self.future: Optional[Future] = None
+
+    @property
+    def pending_requests(self) -> int:
+        """
+        Number of sent requests waiting for a response
+
+        :return: Requests count
+        :rtype: int
+        """
+        return len(self._pending_futures)
+
+    def is_available(self) -> bool:
+        """
+        Checks if the service is available without blocking. A positive check is cached for 'availability_cache_secs'
+
+        :return: Service is available
+        :rtype: bool
+        """
+        now = rostime.monotonic()
+        if (
+            self._available_time is not None
+            and now - self._available_time < self.config.availability_cache_secs
+        ):
+            return True
+        if self.client.service_is_ready():
+            self._available_time = now
+            return True
+        self._available_time = None
+        return False
+
+    def send_request_async(
+        self, req_msg, done_callback: Optional[Callable[[Future], Any]] = None
+    ) -> Optional[Future]:
+        """
+        Sends a request to the service without waiting for the response. Several requests can be in flight at the same time
+
+        :param req_msg: Service request msg
+        :type req_msg: Any
+        :param done_callback: Method executed with the request future when the response is received, defaults to None
+        :type done_callback: Optional[Callable[[Future], Any]], optional
+
+        :return: Request future (the future result is the service response), None if the request is invalid. If the service is not available yet, the request is sent once it is available and the future result is None if it is not available after 'timeout_secs'
+        :rtype: Optional[Future]
+        """
+        # Check request type
+        if not isinstance(req_msg, self.config.srv_type.Request):
+            self.node.get_logger().error(
+                f"Invalid request message for service '{self.config.name}'. Service takes request message of type '{self.config.srv_type.Request}', got '{type(req_msg)}'"
+            )
+            return None
+
+        self.request = req_msg
+        if self.is_available():
+            future = self.client.call_async(req_msg)
+        else:
+            # Keep the request until the service is discovered
+            self.node.get_logger().debug(
+                f"Service {self.config.name} not available yet, request is sent when available"
+            )
+            future = Future()
+            _send_when_available(
+                self,
+                partial(self.client.call_async, req_msg),
+                future,
+                self.config.timeout_secs,
+            )
+        self._pending_futures.add(future)
+        future.add_done_callback(self._pending_futures.discard)
+        if done_callback:
+            future.add_done_callback(done_callback)
+        self.future = future
+        return future
 
     def send_request(self, req_msg, executor: Optional[Executor] = None):
         """
@@ -103,13 +242,15 @@ class ServiceClientHandler:
 
         :param req_msg: Service request msg
         :type req_msg: Any
+        :param executor: Executor used to spin the client node if the node is not already spinning, defaults to None
+        :type executor: Optional[Executor], optional
         :return: Service result
         :rtype: Any
         """
         _timeout_count: float = 0.0  # timeout counter
 
         # Check if the service is available every attempt_period_secs
-        while not self.client.wait_for_service(
+        while not self.is_available() and not self.client.wait_for_service(
             timeout_sec=self.config.attempt_period_secs
         ):
             # If the service is not available give warning
@@ -126,32 +267,34 @@ class ServiceClientHandler:
                 return None
 
         # Service is available
+        self._available_time = rostime.monotonic()
         self.node.get_logger().debug(
             f"Service {self.config.name} is available, Sending request..."
         )
 
-        # Check request type
-        if not isinstance(req_msg, self.config.srv_type.Request):
-            self.node.get_logger().error(
-                f"Invalid request message for service '{self.config.name}'. Service takes request message of type '{self.config.srv_type.Request}', got '{type(req_msg)}'"
-            )
+        future = self.send_request_async(req_msg)
+        if not future:
             return None
 
-        # send request
-        self.request = req_msg
-        self.future = self.client.call_async(self.request)
-
-        # Spin until response
-        if executor:
-            while not self.future:
-                rclpy.spin_once(
-                    self.node, executor=executor, timeout_sec=self.node.config.loop_rate
+        if self.node.executor is not None:
+            # The node is already spinning -> wait for the response callback
+            response_event = threading.Event()
+            future.add_done_callback(lambda _: response_event.set())
+            if not response_event.wait(timeout=self.config.response_timeout_secs):
+                self.node.get_logger().warn(
+                    f"No response from service {self.config.name} after {self.config.response_timeout_secs} secs"
                 )
+                return None
         else:
-            rclpy.spin_until_future_complete(self.node, self.future)
+            rclpy.spin_until_future_complete(
+                self.node,
+                future,
+                executor=executor,
+                timeout_sec=self.config.response_timeout_secs,
+            )
 
         # return response
-        return self.future.result()
+        return future.result()
 
 
 class ActionClientHandler:
@@ -176,12 +319,12 @@ class ActionClientHandler:
         """
         self.reset()
 
-        if not config and (action_name and action_type):
+        if not config:
+            if not (action_name and action_type):
+                raise ValueError(
+                    "Cannot initialize action client. Provide a valid config or a valid action name and action type"
+                )
             config = ActionClientConfig(name=action_name, action_type=action_type)
-        else:
-            raise ValueError(
-                "Cannot initialize action client. Provide a valid config or a valid action name and action type"
-            )
 
         # If config is provided plus additional name or type -> update name or type
         if action_name:
@@ -199,6 +342,86 @@ class ActionClientHandler:
             callback_group=self.config.callback_group,
         )
 
+        # Last time the server was found available (cached availability)
+        self._available_time: Optional[float] = None
+        # Goals requests in flight
+        self._pending_futures: Set[Future] = set()
+
+    @property
+    def pending_requests(self) -> int:
+        """
+        Number of sent goals waiting for the server acceptance response
+
+        :return: Requests count
+        :rtype: int
+        """
+        return len(self._pending_futures)
+
+    def is_available(self) -> bool:
+        """
+        Checks if the action server is available without blocking. A positive check is cached for 'availability_cache_secs'
+
+        :return: Server is available
+        :rtype: bool
+        """
+        now = rostime.monotonic()
+        if (
+            self._available_time is not None
+            and now - self._available_time < self.config.availability_cache_secs
+        ):
+            return True
+        if self.client.server_is_ready():
+            self._available_time = now
+            return True
+        self._available_time = None
+        return False
+
+    def send_request_async(
+        self,
+        request_msg: Any,
+        feedback_callback: Optional[Callable] = None,
+        done_callback: Optional[Callable[[Future], Any]] = None,
+    ) -> Optional[Future]:
+        """
+        Sends a goal to the action server without waiting for the server response. Several goals can be in flight at the same time
+
+        :param request_msg: Action request message
+        :type request_msg: Action_Type.Goal
+        :param feedback_callback: Method executed on each goal feedback, defaults to None (feedback is handled by the client handler)
+        :type feedback_callback: Optional[Callable], optional
+        :param done_callback: Method executed with the goal future when the server accepts or rejects the goal, defaults to None
+        :type done_callback: Optional[Callable[[Future], Any]], optional
+
+        :return: Goal future (the future result is the goal handle), None if the request is invalid. If the server is not available yet, the goal is sent once it is available and the future result is None if it is not available after 'timeout_secs'
+        :rtype: Optional[Future]
+        """
+        # Check request type
+        if not isinstance(request_msg, self.config.action_type.Goal):
+            self.node.get_logger().error(
+                f"Invalid request message for action '{self.config.name}'. Service takes request message of type '{self.config.action_type.Goal}', got '{type(request_msg)}'"
+            )
+            return None
+
+        send_goal = partial(
+            self.client.send_goal_async,
+            request_msg,
+            feedback_callback=feedback_callback or self.action_feedback_callback,
+        )
+        if self.is_available():
+            future = send_goal()
+        else:
+            # Keep the goal until the server is discovered
+            self.node.get_logger().debug(
+                f"Action server {self.config.name} not available yet, goal is sent when available"
+            )
+            future = Future()
+            _send_when_available(self, send_goal, future, self.config.timeout_secs)
+        self._pending_futures.add(future)
+        future.add_done_callback(self._pending_futures.discard)
+        if done_callback:
+            future.add_done_callback(done_callback)
+        return future
+
     def reset(self):
         """
         Resst the client handler
@@ -227,7 +450,7 @@ class ActionClientHandler:
         # Making request to the server
         _path_timeout_count: float = 0.0
         # Wait until the server is available
-        while not self.client.wait_for_server(
+        while not self.is_available() and not self.client.wait_for_server(
             timeout_sec=self.config.attempt_period_secs
         ):
             self.node.get_logger().warning(
@@ -243,19 +466,14 @@ class ActionClientHandler:
                 )
                 return False
 
+        self._available_time = rostime.monotonic()
         self.node.get_logger().info(f"Sending request to {self.config.name}")
 
-        # Check request type
-        if not isinstance(request_msg, self.config.action_type.Goal):
-            self.node.get_logger().error(
-                f"Invalid request message for action '{self.config.name}'. Service takes request message of type '{self.config.action_type.Goal}', got '{type(request_msg)}'"
-            )
-            return False
-
         # If available, send request and get future response, and feedback callback method
-        self._send_goal_future = self.client.send_goal_async(
-            request_msg, feedback_callback=self.action_feedback_callback
-        )
+        send_goal_future = self.send_request_async(request_msg)
+        if not send_goal_future:
+            return False
+        self._send_goal_future = send_goal_future
 
         # Wait until the action returns the first feedback
         while wait_until_first_feedback and self.feedback_count <= 0:
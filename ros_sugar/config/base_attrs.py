@@ -1,10 +1,14 @@
 import json
+import os
+import threading
 from types import NoneType, GenericAlias
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     Optional,
+    Tuple,
     Union,
     get_args,
     List,
@@ -12,31 +16,192 @@ from typing import (
     _GenericAlias,
 )
 from copy import deepcopy
+import msgpack
 import numpy as np
-from attrs import asdict, define, fields_dict
+from attrs import asdict, define, fields, fields_dict
 from attrs import Attribute, has as attrs_has
-from omegaconf import OmegaConf
+from omegaconf import DictConfig, ListConfig, OmegaConf
 
 
 def skip_no_init(a: Attribute, _) -> bool:
     return a.init
 
 
+# Per class map of {attribute_name: (attribute, validator)} for attributes with validators
+_validators_cache: Dict[type, Dict[str, Tuple[Attribute, Callable]]] = {}
+
+# Per class and attribute name type (nested attributes are keyed on their own class)
+_attributes_types_cache: Dict[Tuple[type, str], Optional[type]] = {}
+
+# Per class and (nested) attribute name path: (parent attributes names, attribute name)
+_attributes_paths_cache: Dict[Tuple[type, str], Tuple[Tuple[str, ...], str]] = {}
+
+# Per class attributes {name: attribute}
+_fields_cache: Dict[type, Dict[str, Attribute]] = {}
+
+# Per class names of the attributes set in __init__ (serialized attributes)
+_init_fields_cache: Dict[type, Tuple[str, ...]] = {}
+
+# Parsed YAML files: {absolute_path: ((mtime_ns, size), parsed_config)}
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Union[DictConfig, ListConfig]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def _get_class_fields(cls: type) -> Dict[str, Attribute]:
+    """
+    Get the attributes of an attrs class (computed once per class)
+
+    :param cls: attrs class
+    :type cls: type
+
+    :return: Attribute name: attribute
+    :rtype: Dict[str, Attribute]
+    """
+    class_fields = _fields_cache.get(cls)
+    if class_fields is None:
+        class_fields = fields_dict(cls)
+        _fields_cache[cls] = class_fields
+    return class_fields
+
+
+def _get_init_fields(cls: type) -> Tuple[str, ...]:
+    """
+    Get the names of the attributes of an attrs class that are set in __init__ (computed once per class)
+
+    :param cls: attrs class
+    :type cls: type
+
+    :return: Attributes names
+    :rtype: Tuple[str, ...]
+    """
+    init_fields = _init_fields_cache.get(cls)
+    if init_fields is None:
+        init_fields = tuple(a.name for a in fields(cls) if a.init)
+        _init_fields_cache[cls] = init_fields
+    return init_fields
+
+
+def _to_dict_value(value: Any) -> Any:
+    """
+    Convert an attribute value to its dictionary form (same output as attrs.asdict): nested attrs classes are converted to dictionaries and collections are copied with their own type
+
+    :param value: Attribute value
+    :type value: Any
+
+    :return: Converted value
+    :rtype: Any
+    """
+    if isinstance(value, BaseAttrs):
+        return value._to_dict()
+    if attrs_has(value.__class__):
+        return asdict(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value.__class__([_to_dict_value(item) for item in value])
+    if isinstance(value, dict):
+        return {
+            _to_dict_value(key): _to_dict_value(item) for key, item in value.items()
+        }
+    return value
+
+
+def _to_serialized_value(value: Any) -> Any:
+    """
+    Convert an attribute value to a serializable (json/msgpack) value: nested attrs classes are converted to dictionaries, numpy arrays to lists and non basic types to strings
+
+    :param value: Attribute value
+    :type value: Any
+
+    :return: Serializable value
+    :rtype: Any
+    """
+    value_type = type(value)
+    if value_type in (float, int, str, bool, NoneType):
+        return value
+    if isinstance(value, BaseAttrs):
+        return value._to_serialized_dict()
+    if attrs_has(value.__class__):
+        return _to_serialized_value(asdict(value, filter=skip_no_init))
+    if isinstance(value, np.ndarray):
+        return _to_serialized_value(value.tolist())
+    if isinstance(value, List):
+        return [_to_serialized_value(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_to_serialized_value(item) for item in value)
+    if isinstance(value, Dict):
+        return {key: _to_serialized_value(item) for key, item in value.items()}
+    return str(value)
+
+
+def load_yaml_config(file_path: str) -> Union[DictConfig, ListConfig]:
+    """
+    Load a YAML file using OmegaConf. The parsed config is cached and the file is parsed again only if it is modified (modification time or size changed)
+
+    :param file_path: Path to config file (.yaml)
+    :type file_path: str
+
+    :return: Parsed config
+    :rtype: Union[DictConfig, ListConfig]
+    """
+    abs_path = os.path.abspath(file_path)
+    file_stat = os.stat(abs_path)
+    file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(abs_path)
+        if cached and cached[0] == file_key:
+            return cached[1]
+        raw_config = OmegaConf.load(abs_path)
+        _yaml_cache[abs_path] = (file_key, raw_config)
+        return raw_config
+
+
+def _get_class_validators(cls: type) -> Dict[str, Tuple[Attribute, Callable]]:
+    """
+    Get the validators of an attrs class attributes (computed once per class)
+
+    :param cls: attrs class
+    :type cls: type
+
+    :return: Attribute name: (attribute, validator)
+    :rtype: Dict[str, Tuple[Attribute, Callable]]
+    """
+    validators = _validators_cache.get(cls)
+    if validators is None:
+        validators = {
+            a.name: (a, a.validator)
+            for a in getattr(cls, "__attrs_attrs__", [])
+            if a.validator is not None
+        }
+        _validators_cache[cls] = validators
+    return validators
+
+
 @define
 class BaseAttrs:
     """
     Implements setattr method to re-use validators at set time
     """
 
+    # Run the attributes validators on every set (can be disabled for production)
+    _validate_on_setattr: ClassVar[bool] = True
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Call the validator when we set the field (by default it only runs on __init__)"""
-        for attribute in [
-            a for a in getattr(self.__class__, "__attrs_attrs__", []) if a.name == name
-        ]:
-            if attribute.validator is not None:
-                attribute.validator(self, attribute, value)
+        if self._validate_on_setattr:
+            validator = _get_class_validators(self.__class__).get(name)
+            if validator:
+                validator[1](self, validator[0], value)
         super().__setattr__(name, value)
 
+    @classmethod
+    def set_validation_on_setattr(cls, enabled: bool) -> None:
+        """
+        Enable/Disable running the attributes validators when setting a value for this class and its child classes (validators always run on __init__). Disabling the validation removes the set time overhead on configs that are validated and not expected to change (production mode)
+
+        :param enabled: Validate on set
+        :type enabled: bool
+        """
+        cls._validate_on_setattr = enabled
+
     def __str__(self) -> str:
         """
         Pretty print of class attributes/values
@@ -89,7 +254,33 @@ class BaseAttrs:
         """Convert class to dict.
         :rtype: dict
         """
-        return asdict(self, filter=filter)
+        if filter:
+            return asdict(self, filter=filter)
+        return self._to_dict()
+
+    def _to_dict(self) -> Dict:
+        """
+        Convert class to dict using the cached class attributes names
+
+        :return: Attribute name: value
+        :rtype: Dict
+        """
+        return {
+            name: _to_dict_value(getattr(self, name))
+            for name in _get_class_fields(self.__class__)
+        }
+
+    def _to_serialized_dict(self) -> Dict:
+        """
+        Convert the class attributes set in __init__ to a dictionary of serializable values
+
+        :return: Attribute name: serializable value
+        :rtype: Dict
+        """
+        return {
+            name: _to_serialized_value(getattr(self, name))
+            for name in _get_init_fields(self.__class__)
+        }
 
     def __check_value_against_attr_type(
         self, key: str, value: Any, attribute_to_set: Any, attribute_type: type
@@ -135,26 +326,32 @@ class BaseAttrs:
         return value
 
     def __parse_from_serialized_list(self, list_attr: List, value: List) -> List:
-        """Helper method to parse attribute value from a list of serialized values
+        """Helper method to parse attribute value from a list of serialized values. Serialized items of a list of attrs classes are parsed into new instances of the class of the existing items
 
-        :param list_attr: _description_
+        :param list_attr: Current attribute value
         :type list_attr: list
-        :param value: _description_
+        :param value: New serialized value
         :type value: list
-        :raises TypeError: _description_
-        :return: _description_
+        :raises TypeError: If the list contains attrs classes and a serialized item is not a dictionary
+        :return: Parsed list
         :rtype: list
         """
+        template = list_attr[0] if list_attr else None
+        if template is None or not hasattr(template, "__attrs_attrs__"):
+            return list(value)
         new_list = []
-        attr_val = list_attr[0]
         for val in value:
-            if hasattr(attr_val, "__attrs_attrs__"):
-                if not isinstance(val, Dict):
-                    raise TypeError(
-                        f"Trying to set with incompatible type. Attribute expecting list of dictionaries got list of '{type(val)}'"
-                    )
-                attr_val.from_dict(val)
-            new_list.append(deepcopy(attr_val))
+            if not isinstance(val, Dict):
+                raise TypeError(
+                    f"Trying to set with incompatible type. Attribute expecting list of dictionaries got list of '{type(val)}'"
+                )
+            try:
+                item = template.__class__()
+            except TypeError:
+                # Class without defaults for all attributes
+                item = deepcopy(template)
+            item.from_dict(val)
+            new_list.append(item)
         return new_list
 
     def from_dict(self, dict_obj: Dict) -> None:
@@ -167,11 +364,12 @@ class BaseAttrs:
         :raises ValueError: If attribute_name in dictionary does not exists in class attributes
         :raises TypeError: If attribute_value type in dictionary does not correspond to class attribute type
         """
+        class_fields = _get_class_fields(self.__class__)
         for key, value in dict_obj.items():
-            if key not in self.asdict().keys():
+            if key not in class_fields:
                 continue
             attribute_to_set = getattr(self, key)
-            attribute_type = fields_dict(self.__class__)[key].type
+            attribute_type = class_fields[key].type
             # Check for nested classes
             if hasattr(attribute_to_set, "__attrs_attrs__"):
                 if not isinstance(value, Dict):
@@ -209,8 +407,8 @@ class BaseAttrs:
         :param nested_root_name: Nested root name for the config, defaults to None
         :type nested_root_name: str | None, optional
         """
-        # Load the YAML file
-        raw_config = OmegaConf.load(file_path)
+        # Load the YAML file (parsed once and cached)
+        raw_config = load_yaml_config(file_path)
 
         # check for root name if given
         if nested_root_name:
@@ -223,33 +421,37 @@ class BaseAttrs:
             config = raw_config
             extra_config = None
 
+        self._from_parsed_config(config, extra_config)
+
+    def _from_parsed_config(self, config: Any, extra_config: Any = None) -> None:
+        """
+        Update class attributes from a parsed (OmegaConf) config. Nested configs are updated from their config subtree
+
+        :param config: Parsed config
+        :type config: Any
+        :param extra_config: Parsed common config used for the attributes missing in config, defaults to None
+        :type extra_config: Any, optional
+        """
         for attr in self.__attrs_attrs__:
-            # Check in config
+            # Check in config, then in the common config if present
             if hasattr(config, attr.name):
+                source = config
+            elif extra_config and hasattr(extra_config, attr.name):
+                source = extra_config
+            else:
+                continue
+            # Check to handle nested config
+            if attrs_has(attr.type):
                 attr_value = getattr(self, attr.name)
-                # Check to handle nested config
-                if attrs_has(attr.type):
-                    root_name = f"{nested_root_name}.{attr.name}"
-
-                    attr_value.from_yaml(file_path, root_name)
-
-                    setattr(self, attr.name, attr_value)
-                else:
-                    setattr(self, attr.name, getattr(config, attr.name))
-
-            # Check in the common config if present
-            elif extra_config:
-                if hasattr(extra_config, attr.name):
-                    attr_value = getattr(self, attr.name)
-                    # Check to handle nested config
-                    if attrs_has(attr.type):
-                        root_name = f"/**.{attr.name}"
-
-                        attr_value.from_yaml(file_path, root_name)
-
-                        setattr(self, attr.name, attr_value)
-                    else:
-                        setattr(self, attr.name, getattr(extra_config, attr.name))
+                attr_value._from_parsed_config(getattr(source, attr.name))
+                setattr(self, attr.name, attr_value)
+            else:
+                value = getattr(source, attr.name)
+                # Convert the cached OmegaConf nodes to plain containers
+                # to avoid sharing them between instances
+                if isinstance(value, (DictConfig, ListConfig)):
+                    value = OmegaConf.to_container(value, resolve=True)
+                setattr(self, attr.name, value)
 
     def to_json(self) -> Union[str, bytes, bytearray]:
         """
@@ -258,61 +460,25 @@ class BaseAttrs:
         :return: _description_
         :rtype: str | bytes | bytearray
         """
-        dictionary = self.asdict(filter=skip_no_init)
-        serialized_dict = self.__dict_to_serialized_dict(dictionary)
-        return json.dumps(serialized_dict)
+        return json.dumps(self._to_serialized_dict())
 
-    def __list_to_serialized_list(self, list_items: List) -> List:
-        """Serialize List object items
+    def to_msgpack(self) -> bytes:
+        """
+        Dump to msgpack binary form (compact and faster than json for large configs)
 
-        :param list_items: _description_
-        :type list_items: list
-        :return: _description_
-        :rtype: list
+        :return: Serialized config
+        :rtype: bytes
         """
-        serialized_list = []
-        for item in list_items:
-            # Convert numpy array to list
-            if isinstance(item, np.ndarray):
-                item = item.tolist()
-            if isinstance(item, BaseAttrs):
-                serialized_list.append(item.to_json())
-            elif isinstance(item, List):
-                serialized_list.append(self.__list_to_serialized_list(item))
-            elif isinstance(item, tuple):
-                serialized_list.append(
-                    tuple(self.__list_to_serialized_list(list(item)))
-                )
-            elif isinstance(item, Dict):
-                serialized_list.append(self.__dict_to_serialized_dict(item))
-            elif type(item) not in [float, int, str, bool]:
-                serialized_list.append(str(item))
-            else:
-                serialized_list.append(item)
-        return serialized_list
+        return msgpack.packb(self._to_serialized_dict())
 
-    def __dict_to_serialized_dict(self, dictionary):
-        """Serialize Dictionary object items
+    def from_msgpack(self, msgpack_obj: bytes) -> None:
+        """
+        Gets attributes values from given msgpack binary form
 
-        :param dictionary: _description_
-        :type dictionary: _type_
-        :return: _description_
-        :rtype: _type_
+        :param msgpack_obj: Serialized config
+        :type msgpack_obj: bytes
         """
-        for name, value in dictionary.items():
-            # Convert numpy array to list
-            if isinstance(value, np.ndarray):
-                value = value.tolist()
-
-            if isinstance(value, List):
-                dictionary[name] = self.__list_to_serialized_list(value)
-            elif isinstance(value, tuple):
-                dictionary[name] = tuple(self.__list_to_serialized_list(list(value)))
-            elif isinstance(value, Dict):
-                dictionary[name] = self.__dict_to_serialized_dict(value)
-            elif type(value) not in [float, int, str, bool, NoneType]:
-                dictionary[name] = str(value)
-        return dictionary
+        self.from_dict(msgpack.unpackb(msgpack_obj))
 
     def from_json(self, json_obj: Union[str, bytes, bytearray]) -> None:
         """
@@ -344,6 +510,62 @@ class BaseAttrs:
             obj_to_set = getattr(obj_to_set, name)
         return True
 
+    def _get_attribute_parent(self, attr_name: str) -> Tuple[Any, str]:
+        """
+        Gets the (nested) object containing a given attribute. The attribute name path is resolved once per class and attribute name
+
+        :param attr_name: Attribute name - can be nested name
+        :type attr_name: str
+
+        :raises AttributeError: If class does not have attribute with given name
+
+        :return: Object containing the attribute, attribute name in this object
+        :rtype: Tuple[Any, str]
+        """
+        cache_key = (self.__class__, attr_name)
+        path = _attributes_paths_cache.get(cache_key)
+        if path is None:
+            *parent_names, name = attr_name.split(".")
+            path = (tuple(parent_names), name)
+
+        parent = self
+        try:
+            for name in path[0]:
+                parent = getattr(parent, name)
+        except AttributeError as e:
+            raise AttributeError(
+                f"Class '{self.__class__.__name__}' does not have an attribute '{attr_name}'"
+            ) from e
+        # Raise an error if the name is not an attribute of the (nested) class
+        if not attrs_has(parent.__class__) or path[1] not in _get_class_fields(
+            parent.__class__
+        ):
+            raise AttributeError(
+                f"Class '{self.__class__.__name__}' does not have an attribute '{attr_name}'"
+            )
+        _attributes_paths_cache[cache_key] = path
+        return parent, path[1]
+
+    @staticmethod
+    def _get_class_attribute_type(obj_class: Any, name: str) -> Optional[type]:
+        """
+        Gets the type of an attribute of an attrs object (cached on the object class)
+
+        :param obj_class: attrs object containing the attribute
+        :type obj_class: Any
+        :param name: Attribute name
+        :type name: str
+
+        :return: Attribute type
+        :rtype: Optional[type]
+        """
+        cache_key = (obj_class.__class__, name)
+        if cache_key in _attributes_types_cache:
+            return _attributes_types_cache[cache_key]
+        attribute_type = _get_class_fields(obj_class.__class__)[name].type
+        _attributes_types_cache[cache_key] = attribute_type
+        return attribute_type
+
     def get_attribute_type(self, attr_name: str) -> Optional[type]:
         """
         Gets type of given attribute name
@@ -356,21 +578,7 @@ class BaseAttrs:
         :return: Attribute type
         :rtype: type
         """
-        # Get nested attributes if there
-        nested_names = attr_name.split(".")
-        name_to_set = nested_names[0]
-        obj_to_set = self
-        obj_class = self
-        for name_to_set in nested_names:
-            # Raise an error if the name does not exist in the class
-            if not hasattr(obj_to_set, name_to_set):
-                raise AttributeError(
-                    f"Class '{self.__class__.__name__}' does not have an attribute '{attr_name}'"
-                )
-            obj_class = obj_to_set
-            obj_to_set = getattr(obj_to_set, name_to_set)
-
-        return fields_dict(obj_class.__class__)[name_to_set].type
+        return self._get_class_attribute_type(*self._get_attribute_parent(attr_name))
 
     def update_value(self, attr_name: str, attr_value: Any) -> bool:
         """
@@ -387,21 +595,9 @@ class BaseAttrs:
         :return: If attribute value is updated
         :rtype: bool
         """
-        # Get nested attributes if there
-        nested_names = attr_name.split(".")
-        name_to_set = nested_names[0]
-        obj_to_set = self
-        obj_class = self
-        for name_to_set in nested_names:
-            # Raise an error if the name does not exist in the class
-            if not hasattr(obj_to_set, name_to_set):
-                raise AttributeError(
-                    f"Class '{self.__class__.__name__}' does not have an attribute '{attr_name}'"
-                )
-            obj_class = obj_to_set
-            obj_to_set = getattr(obj_to_set, name_to_set)
-
-        attribute_type = fields_dict(obj_class.__class__)[name_to_set].type
+        # Get the (nested) object containing the attribute
+        obj_class, name_to_set = self._get_attribute_parent(attr_name)
+        attribute_type = self._get_class_attribute_type(obj_class, name_to_set)
 
         if not attribute_type:
             raise TypeError(
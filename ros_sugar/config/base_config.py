@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Union, Optional
+from typing import Any, Union, Optional
 
 from attrs import define, field
 from rclpy import qos
@@ -188,6 +188,32 @@ def _get_str_from_callbackgroup(
     return callback_group
 
 
+def _loop_rate_bound_validator(instance: Any, attribute: Any, value: Optional[float]):
+    """
+    Validates an adaptive loop rate bound (min_loop_rate/max_loop_rate): the value must be within the loop_rate range and the minimum rate must not exceed the maximum rate (using the defaults of the unset bounds)
+
+    :param instance: Class instance
+    :type instance: Any
+    :param attribute: Class attribute
+    :type attribute: Any
+    :param value: Attribute value
+    :type value: Optional[float]
+
+    :raises ValueError: If the value is out of range or min_loop_rate > max_loop_rate
+    """
+    if value is None:
+        return
+    base_validators.in_range(min_value=1e-4, max_value=1e9)(instance, attribute, value)
+    min_rate = value if attribute.name == "min_loop_rate" else instance.min_loop_rate
+    max_rate = value if attribute.name == "max_loop_rate" else instance.max_loop_rate
+    min_rate = min_rate or instance.loop_rate / 10
+    max_rate = max_rate or instance.loop_rate
+    if min_rate > max_rate:
+        raise ValueError(
+            f"Value of min_loop_rate ({min_rate}) must not exceed max_loop_rate ({max_rate})"
+        )
+
+
 @define(kw_only=True)
 class BaseComponentConfig(BaseConfig):
     """
@@ -197,10 +223,22 @@ class BaseComponentConfig(BaseConfig):
     :type use_without_launcher: bool
     :param layer_id: Component layer ID. Refers to the component 'start' or 'activate' priority. Zero is equivalent to no-priority
     :type layer_id: int
-    :param fallback_rate: Rate (Hz) in which the component checks for Fallbacks and executes actions if a failure is detected
+    :param fallback_rate: Rate (Hz) in which the component retries the Fallbacks while a detected failure persists. Fallbacks are executed immediately when a failure is detected
     :type fallback_rate: float
     :param run_type: Component run type
     :type run_type: ComponentRunType
+    :param enable_loop_profiling: To record the execution loop timing statistics (for TIMED components)
+    :type enable_loop_profiling: bool
+    :param diagnostics_rate: Rate (Hz) in which the execution loop statistics are published on the '/diagnostics' topic. Publishing is disabled if zero
+    :type diagnostics_rate: float
+    :param adaptive_loop_rate: To adapt the loop rate of TIMED components at runtime: the rate is decreased when the execution steps overrun the loop period and recovered when there is enough headroom
+    :type adaptive_loop_rate: bool
+    :param min_loop_rate: Minimum loop rate (Hz) when using an adaptive loop rate. Defaults to 10% of loop_rate if not provided
+    :type min_loop_rate: Optional[float]
+    :param max_loop_rate: Maximum loop rate (Hz) when using an adaptive loop rate. Defaults to loop_rate if not provided
+    :type max_loop_rate: Optional[float]
+    :param status_heartbeat_rate: Rate (Hz) in which the health status is re-published when unchanged (heartbeat). The status is always published immediately on change. Heartbeat is disabled if zero
+    :type status_heartbeat_rate: float
     """
 
     use_without_launcher: bool = field(default=False)
@@ -218,6 +256,26 @@ class BaseComponentConfig(BaseConfig):
         default=ComponentRunType.TIMED, converter=_convert_runtype_to_enum
     )
 
+    enable_loop_profiling: bool = field(default=True)
+
+    diagnostics_rate: float = field(
+        default=0.0, validator=base_validators.in_range(min_value=0.0, max_value=1e3)
+    )
+
+    adaptive_loop_rate: bool = field(default=False)
+
+    min_loop_rate: Optional[float] = field(
+        default=None, validator=_loop_rate_bound_validator
+    )
+
+    max_loop_rate: Optional[float] = field(
+        default=None, validator=_loop_rate_bound_validator
+    )
+
+    status_heartbeat_rate: float = field(
+        default=1.0, validator=base_validators.in_range(min_value=0.0, max_value=1e3)
+    )
+
     _callback_group: Optional[Union[ros_callback_groups.CallbackGroup, str]] = field(
         default=None, converter=_get_str_from_callbackgroup, alias='_callback_group'
     )
@@ -44,7 +44,11 @@ class Action:
     """
 
     def __init__(
-        self, method: Callable, args: tuple = (), kwargs: Optional[Dict] = None
+        self,
+        method: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict] = None,
+        max_concurrency: int = 1,
     ) -> None:
         """
         Action
@@ -55,6 +59,8 @@ class Action:
         :type args: tuple, optional
         :param kwargs: function keyword arguments, defaults to {}
         :type kwargs: dict, optional
+        :param max_concurrency: Maximum number of concurrent executions of the action when executed asynchronously by an Event, defaults to 1
+        :type max_concurrency: int, optional
         """
         self.__component_action: bool = False
         self.__parent_component: Optional[str] = None
@@ -64,6 +70,7 @@ class Action:
         self._function = method
         self._args = args
         self._kwargs = kwargs if kwargs else {}
+        self.max_concurrency: int = max_concurrency
 
         # Check if it is a component action and update parent and keyname
         if hasattr(self._function, "__self__"):
@@ -224,6 +231,7 @@ class Action:
             "parent_name": self.parent_component,
             "args": self.args,
             "kwargs": self.kwargs,
+            "max_concurrency": self.max_concurrency,
         }
 
     @property
@@ -0,0 +1,204 @@
+"""Actions Pool"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+class ActionStats:
+    """Execution statistics of one action in the ActionsPool"""
+
+    __slots__ = (
+        "submitted",
+        "executed",
+        "coalesced",
+        "dropped",
+        "failed",
+        "total_latency",
+        "max_latency",
+        "total_duration",
+        "max_duration",
+    )
+
+    def __init__(self) -> None:
+        self.submitted: int = 0
+        self.executed: int = 0
+        self.coalesced: int = 0
+        self.dropped: int = 0
+        self.failed: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+        self.total_duration: float = 0.0
+        self.max_duration: float = 0.0
+
+    @property
+    def dictionary(self) -> Dict[str, float]:
+        """
+        Statistics as a dictionary
+
+        :return: Counters, mean/max queuing latency and mean/max execution duration (seconds)
+        :rtype: Dict[str, float]
+        """
+        executed = max(self.executed, 1)
+        return {
+            "submitted": self.submitted,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "mean_latency": self.total_latency / executed,
+            "max_latency": self.max_latency,
+            "mean_duration": self.total_duration / executed,
+            "max_duration": self.max_duration,
+        }
+
+
+class ActionsPool:
+    """Bounded worker pool executing event actions outside of the event subscription callbacks
+
+    - Each action (key) runs at most 'max_concurrency' instances at the same time, additional requests wait in a per action queue
+    - A request for an action that is already waiting is coalesced with the waiting request
+    - Requests exceeding the pool 'max_pending' limit are dropped
+    - The latency between submitting and starting an action and the execution duration are recorded per action
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 100) -> None:
+        """Init the pool
+
+        :param max_workers: Number of worker threads, defaults to 4
+        :type max_workers: int, optional
+        :param max_pending: Maximum number of waiting requests, defaults to 100
+        :type max_pending: int, optional
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="actions_pool"
+        )
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: int = 0
+        self._running: Dict[Hashable, int] = {}
+        self._waiting: Dict[Hashable, Deque[Tuple[float, Callable, Dict]]] = {}
+        self._stats: Dict[Hashable, ActionStats] = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        method: Callable[..., Any],
+        max_concurrency: int = 1,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> bool:
+        """Submit an action for execution
+
+        :param key: Action key used for concurrency limits, coalescing and statistics
+        :type key: Hashable
+        :param method: Action callable
+        :type method: Callable[..., Any]
+        :param max_concurrency: Maximum number of concurrent executions of the action, defaults to 1
+        :type max_concurrency: int, optional
+        :param coalesce: Coalesce with an already waiting request of the same action, defaults to True
+        :type coalesce: bool, optional
+
+        :return: If the request is accepted (executed, queued or coalesced)
+        :rtype: bool
+        """
+        with self._lock:
+            stats = self._stats.setdefault(key, ActionStats())
+            stats.submitted += 1
+            waiting = self._waiting.setdefault(key, deque())
+            if coalesce and waiting:
+                stats.coalesced += 1
+                return True
+            if self._pending >= self._max_pending:
+                stats.dropped += 1
+                logging.warning(
+                    f"Actions pool is full, dropping execution request of '{key}'"
+                )
+                return False
+            self._pending += 1
+            request = (time.monotonic(), method, kwargs)
+            if self._running.get(key, 0) < max(max_concurrency, 1):
+                self._running[key] = self._running.get(key, 0) + 1
+                self._executor.submit(self._execute, key, request)
+            else:
+                waiting.append(request)
+        return True
+
+    def _execute(self, key: Hashable, request: Tuple[float, Callable, Dict]) -> None:
+        """Worker method: executes a request then the next waiting request of the same action
+
+        :param key: Action key
+        :type key: Hashable
+        :param request: Submit time, callable and keyword arguments
+        :type request: Tuple[float, Callable, Dict]
+        """
+        while request:
+            submit_time, method, kwargs = request
+            start_time = time.monotonic()
+            failed = False
+            try:
+                method(**kwargs)
+            except Exception as e:
+                failed = True
+                logging.error(f"Error while executing action '{key}': {e}")
+            end_time = time.monotonic()
+            with self._lock:
+                self._pending -= 1
+                stats = self._stats[key]
+                stats.executed += 1
+                stats.failed += int(failed)
+                latency = start_time - submit_time
+                duration = end_time - start_time
+                stats.total_latency += latency
+                stats.max_latency = max(stats.max_latency, latency)
+                stats.total_duration += duration
+                stats.max_duration = max(stats.max_duration, duration)
+                waiting = self._waiting[key]
+                if waiting:
+                    # Keep the execution slot for the next waiting request
+                    request = waiting.popleft()
+                else:
+                    request = None
+                    self._running[key] -= 1
+
+    def stats(self, key: Optional[Hashable] = None) -> Dict:
+        """Get the execution statistics
+
+        :param key: Action key, if not provided the statistics of all actions are returned, defaults to None
+        :type key: Optional[Hashable], optional
+
+        :return: Action statistics, or dictionary of all actions statistics
+        :rtype: Dict
+        """
+        with self._lock:
+            if key is not None:
+                return self._stats[key].dictionary if key in self._stats else {}
+            return {str(k): stats.dictionary for k, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the pool workers
+
+        :param wait: Wait for the running actions, defaults to True
+        :type wait: bool, optional
+        """
+        self._executor.shutdown(wait=wait)
+
+
+_actions_pool: Optional[ActionsPool] = None
+_actions_pool_lock = threading.Lock()
+
+
+def get_actions_pool() -> ActionsPool:
+    """Get the process-wide actions pool (created on first use)
+
+    :return: Actions pool
+    :rtype: ActionsPool
+    """
+    global _actions_pool
+    with _actions_pool_lock:
+        if _actions_pool is None:
+            _actions_pool = ActionsPool()
+        return _actions_pool
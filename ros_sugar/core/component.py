@@ -5,9 +5,10 @@ import time
 import json
 import socket
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Union, Callable, Sequence, Tuple
-from functools import wraps
+from typing import Any, Dict, List, Optional, Set, Union, Callable, Sequence, Tuple
+from functools import partial, wraps
 
+import msgpack
 from rclpy.action.server import ActionServer, CancelResponse, GoalResponse
 from rclpy.utilities import try_shutdown
 import rclpy.callback_groups as ros_callback_groups
@@ -15,6 +16,10 @@ from rclpy.callback_groups import MutuallyExclusiveCallbackGroup, ReentrantCallb
 from rclpy import lifecycle
 from rclpy.publisher import Publisher as ROSPublisher
 from rclpy.subscription import Subscription
+from rclpy.task import Future
+from rclpy.timer import Timer
+from rclpy.guard_condition import GuardCondition
+from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
 from automatika_ros_sugar.msg import ComponentStatus
 from automatika_ros_sugar.srv import (
     ChangeParameter,
@@ -25,13 +30,15 @@ from automatika_ros_sugar.srv import (
 
 from .action import Action
 from .event import Event
-from ..events import json_to_events_list
+from ..events import json_to_events_list, dicts_to_events_list
 from ..io.callbacks import GenericCallback
 from ..config.base_config import BaseComponentConfig, ComponentRunType
 from ..io.topic import Topic
+from ..io.utils import patch_msgpack_numpy
 from .fallbacks import ComponentFallbacks, Fallback
 from .node import BaseNode
-from .status import Status
+from .profiling import LoopProfiler, LoopRateController
+from .status import STATUS_QOS, Status
 from ..utils import (
     camel_to_snake_case,
     component_action,
@@ -137,6 +144,10 @@ class BaseComponent(BaseNode, lifecycle.Node):
             )
         self.__fallbacks = fallbacks
         self.__fallbacks_giveup: bool = False
+        # Fallbacks are checked on failure (status change), then retried at fallback_rate while the failure persists
+        self.__fallbacks_check_timer: Optional[Timer] = None
+        self.__fallbacks_guard: Optional[GuardCondition] = None
+        self.health_status.register_on_change(self._on_health_status_change)
 
         if self.config.use_without_launcher:
             # Create default services for changing config/inputs/outputs during runtime
@@ -152,6 +163,9 @@ class BaseComponent(BaseNode, lifecycle.Node):
         self.__actions: Optional[List[List[Action]]] = None
         self.__event_listeners: List[Subscription] = []
 
+        self._loop_profiler: Optional[LoopProfiler] = None
+        self._loop_rate_controller: Optional[LoopRateController] = None
+
         # To use without launcher -> Init the ROS2 node directly
         if self.config.use_without_launcher:
             self.rclpy_init_node(component_name, **kwargs)
@@ -165,6 +179,21 @@ class BaseComponent(BaseNode, lifecycle.Node):
             f"LIFECYCLE NODE {self.get_name()} STARTED AND REQUIRES CONFIGURATION"
         )
         self._create_default_services()
+        # Announce the component to the Monitor (latched status)
+        self._create_health_status_publisher()
+        self.health_status_publisher.publish(self.health_status())
+
+    def _create_health_status_publisher(self) -> None:
+        """
+        Creates the health status publisher (transient local) if it does not exist
+        """
+        if hasattr(self, "health_status_publisher"):
+            return
+        self.health_status_publisher: ROSPublisher = self.create_publisher(
+            msg_type=ComponentStatus,
+            topic=f"{self.get_name()}_status",
+            qos_profile=STATUS_QOS,
+        )
 
     # Managing Inputs/Outputs
     def _add_ros_subscriber(self, callback: GenericCallback):
@@ -294,10 +323,11 @@ class BaseComponent(BaseNode, lifecycle.Node):
         self.get_logger().info("STARTING ALL PUBLISHERS")
         if self.__enable_health_publishing:
             # Create status publisher
-            self.health_status_publisher: ROSPublisher = self.create_publisher(
-                msg_type=ComponentStatus,
-                topic=f"{self.get_name()}_status",
-                qos_profile=1,
+            self._create_health_status_publisher()
+            self._publish_health_status()
+        if self._loop_diagnostics_enabled:
+            self._diagnostics_publisher: ROSPublisher = self.create_publisher(
+                msg_type=DiagnosticArray, topic="/diagnostics", qos_profile=1
             )
         # Create publisher and attach it to output publisher object
         for publisher in self.publishers_dict.values():
@@ -309,6 +339,13 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         Creates all node timers
         """
+        if self.__enable_health_publishing and self.config.status_heartbeat_rate:
+            # Re-publish the unchanged status periodically as a heartbeat
+            self._status_heartbeat_timer = self.create_timer(
+                timer_period_sec=1 / self.config.status_heartbeat_rate,
+                callback=self._publish_health_status,
+                callback_group=MutuallyExclusiveCallbackGroup(),
+            )
         # If component is not used as a server start the main execution timer
         if self.run_type != ComponentRunType.TIMED:
             return
@@ -318,6 +355,13 @@ class BaseComponent(BaseNode, lifecycle.Node):
             callback=self._main,
             callback_group=MutuallyExclusiveCallbackGroup(),
         )
+        self._setup_loop_rate_tools()
+        if self._loop_diagnostics_enabled:
+            self._diagnostics_timer = self.create_timer(
+                timer_period_sec=1 / self.config.diagnostics_rate,
+                callback=self._publish_loop_diagnostics,
+                callback_group=MutuallyExclusiveCallbackGroup(),
+            )
 
     def create_all_action_servers(self):
         """
@@ -371,6 +415,14 @@ class BaseComponent(BaseNode, lifecycle.Node):
         if hasattr(self, "_execution_timer"):
             self.get_logger().info("DESTROYING MAIN TIMER")
             self.destroy_timer(self._execution_timer)
+        if hasattr(self, "_diagnostics_timer"):
+            self.destroy_timer(self._diagnostics_timer)
+            del self._diagnostics_timer
+        if hasattr(self, "_status_heartbeat_timer"):
+            self.destroy_timer(self._status_heartbeat_timer)
+            del self._status_heartbeat_timer
+            # Announce the end of the heartbeat to the Monitor
+            self._publish_health_status()
 
     def destroy_all_subscribers(self):
         """
@@ -379,6 +431,8 @@ class BaseComponent(BaseNode, lifecycle.Node):
         self.get_logger().info("DESTROYING ALL SUBSCRIBERS")
         for listener in self.__event_listeners:
             self.destroy_subscription(listener)
+        for event in self.__events or []:
+            event.deactivate()
         # Destroy all input subscribers
         for callback in self.callbacks:
             if callback._subscriber:
@@ -390,9 +444,11 @@ class BaseComponent(BaseNode, lifecycle.Node):
         Destroys all node publishers
         """
         self.get_logger().info("DESTROYING ALL PUBLISHERS")
-        if self.__enable_health_publishing:
-            # Destroy health status publisher
-            self.destroy_publisher(self.health_status_publisher)
+        # NOTE: The health status publisher is kept to announce the inactive component status to the Monitor
+
+        if hasattr(self, "_diagnostics_publisher"):
+            self.destroy_publisher(self._diagnostics_publisher)
+            del self._diagnostics_publisher
 
         for publisher in self.publishers_dict.values():
             if publisher._publisher:
@@ -439,6 +495,7 @@ class BaseComponent(BaseNode, lifecycle.Node):
                 callback_group=MutuallyExclusiveCallbackGroup(),
             )
             self.__event_listeners.append(listener)
+            event.activate()
 
     def got_all_inputs(
         self,
@@ -536,6 +593,174 @@ class BaseComponent(BaseNode, lifecycle.Node):
             config_file, nested_root_name=self.node_name, get_common=True
         )
 
+    # Parameters changing the set of ROS entities created by the component: a change requires restarting the component
+    _RESTART_CONFIG_PARAMS: Set[str] = {
+        "run_type",
+        "_callback_group",
+        "use_without_launcher",
+    }
+
+    # Parameters of the execution loop timing
+    _LOOP_CONFIG_PARAMS: Set[str] = {
+        "loop_rate",
+        "enable_loop_profiling",
+        "adaptive_loop_rate",
+        "min_loop_rate",
+        "max_loop_rate",
+    }
+
+    @classmethod
+    def _get_config_changes(
+        cls, old_config: Dict, new_config: Dict, prefix: str = ""
+    ) -> Set[str]:
+        """
+        Get the names of the changed parameters between two config dictionaries. Nested parameters are returned as 'parent.child'
+
+        :param old_config: Config dictionary before the change
+        :type old_config: Dict
+        :param new_config: Config dictionary after the change
+        :type new_config: Dict
+        :param prefix: Names prefix (for nested configs), defaults to ""
+        :type prefix: str, optional
+
+        :return: Changed parameters names
+        :rtype: Set[str]
+        """
+        changes = set()
+        for key in old_config.keys() | new_config.keys():
+            old_value, new_value = old_config.get(key), new_config.get(key)
+            name = f"{prefix}{key}"
+            if isinstance(old_value, Dict) and isinstance(new_value, Dict):
+                changes.update(
+                    cls._get_config_changes(old_value, new_value, prefix=f"{name}.")
+                )
+                continue
+            try:
+                changed = bool(old_value != new_value)
+            except ValueError:
+                # Values without a single truth value (arrays)
+                changed = True
+            if changed:
+                changes.add(name)
+        return changes
+
+    def _apply_config_changes(self, changed_params: Set[str]) -> bool:
+        """
+        Applies the side effects of changed config parameters on the running component without a restart:
+        - Retimes the execution loop timer on loop rate change
+        - Retimes (or creates/destroys) the fallbacks, heartbeat and diagnostics timers on their rate change
+        - Nothing to apply for the parameters read during execution (algorithm parameters)
+
+        :param changed_params: Changed parameters names
+        :type changed_params: Set[str]
+
+        :return: If the changes are applied, False if a restart is required
+        :rtype: bool
+        """
+        if not changed_params:
+            return True
+
+        if changed_params & self._RESTART_CONFIG_PARAMS:
+            return False
+
+        if self.lifecycle_state != 3:
+            # Component is not active -> changes are applied on activation
+            return True
+
+        if changed_params & self._LOOP_CONFIG_PARAMS and hasattr(
+            self, "_execution_timer"
+        ):
+            self._setup_loop_rate_tools()
+            self._set_execution_loop_rate(self.effective_loop_rate)
+
+        if "fallback_rate" in changed_params and self.__fallbacks_check_timer:
+            self.__fallbacks_check_timer.timer_period_ns = int(
+                1e9 / self.config.fallback_rate
+            )
+
+        if (
+            "status_heartbeat_rate" in changed_params
+            and self.__enable_health_publishing
+        ):
+            self._update_timer_rate(
+                "_status_heartbeat_timer",
+                self.config.status_heartbeat_rate,
+                self._publish_health_status,
+            )
+            # Announce the new heartbeat rate to the Monitor
+            self._publish_health_status()
+
+        if changed_params & {"diagnostics_rate", "enable_loop_profiling"}:
+            if self._loop_diagnostics_enabled and not hasattr(
+                self, "_diagnostics_publisher"
+            ):
+                self._diagnostics_publisher: ROSPublisher = self.create_publisher(
+                    msg_type=DiagnosticArray, topic="/diagnostics", qos_profile=1
+                )
+            self._update_timer_rate(
+                "_diagnostics_timer",
+                self.config.diagnostics_rate if self._loop_diagnostics_enabled else 0.0,
+                self._publish_loop_diagnostics,
+            )
+
+        self.get_logger().info(
+            f"Applied config changes {sorted(changed_params)} without restarting"
+        )
+        return True
+
+    def _update_timer_rate(
+        self, timer_attr_name: str, rate: float, callback: Callable
+    ) -> None:
+        """
+        Retimes a running timer to a new rate, creates it if it does not exist or destroys it if the rate is zero
+
+        :param timer_attr_name: Timer attribute name in the component
+        :type timer_attr_name: str
+        :param rate: New timer rate (Hz)
+        :type rate: float
+        :param callback: Timer callback
+        :type callback: Callable
+        """
+        timer = getattr(self, timer_attr_name, None)
+        if not rate:
+            if timer:
+                self.destroy_timer(timer)
+                delattr(self, timer_attr_name)
+            return
+        if timer:
+            timer.timer_period_ns = int(1e9 / rate)
+            return
+        setattr(
+            self,
+            timer_attr_name,
+            self.create_timer(
+                timer_period_sec=1 / rate,
+                callback=callback,
+                callback_group=MutuallyExclusiveCallbackGroup(),
+            ),
+        )
+
+    def _reconfigure_from_diff(self, old_config: Dict, keep_alive: bool) -> None:
+        """
+        Applies the changes between the previous config and the current config, the component is restarted only if a changed parameter requires it
+
+        :param old_config: Config dictionary before the change
+        :type old_config: Dict
+        :param keep_alive: To keep the component running even if a changed parameter requires a restart
+        :type keep_alive: bool
+        """
+        changes = self._get_config_changes(old_config, self.config.asdict())
+        if self._apply_config_changes(changes):
+            return
+        if keep_alive:
+            self.get_logger().warn(
+                f"Changed parameters {sorted(changes & self._RESTART_CONFIG_PARAMS)} are applied after the component is restarted"
+            )
+            return
+        # Restart to apply the changes
+        self.stop()
+        self.start()
+
     @property
     def run_type(self) -> ComponentRunType:
         """
@@ -623,10 +848,17 @@ class BaseComponent(BaseNode, lifecycle.Node):
             self.__actions.append(action_set)
 
     # SERIALIZATION AND DESERIALIZATION
-    def _update_cmd_args_list(self):
+    def _update_cmd_args_list(self, manifest_path: Optional[str] = None):
         """
         Update launch command arguments
+
+        :param manifest_path: Path to the component launch manifest (see _launch_manifest_sections). If provided, the manifest path is the only launch argument, defaults to None
+        :type manifest_path: Optional[str], optional
         """
+        if manifest_path:
+            self.launch_cmd_args = ["--manifest", manifest_path]
+            return
+
         self.launch_cmd_args = [
             "--component_type",
             self.__class__.__name__,
@@ -657,6 +889,29 @@ class BaseComponent(BaseNode, lifecycle.Node):
                 self._external_processors_json,
             ]
 
+    @property
+    def _launch_manifest_sections(self) -> Dict[str, Any]:
+        """Component launch manifest sections, serialized in a compact binary manifest passed to the component executable instead of the command line arguments
+
+        :return: Manifest sections {section_name: value}
+        :rtype: Dict[str, Any]
+        """
+        sections = {
+            "component_type": self.__class__.__name__,
+            "config_type": self.config.__class__.__name__,
+            "config": self.config.to_msgpack(),
+            "node_name": self.node_name,
+            "inputs": self._inputs_json,
+            "outputs": self._outputs_json,
+        }
+        if self._config_file:
+            sections["config_file"] = self._config_file
+        if self.__events and self.__actions:
+            sections["events_actions"] = self._events_actions_msgpack
+        if self._external_processors:
+            sections["external_processors"] = self._external_processors_json
+        return sections
+
     @property
     def _events_json(self) -> Union[str, bytes]:
         """Getter of serialized component Events
@@ -666,7 +921,7 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         if not self.__events:
             return "[]"
-        return json.dumps([event.json for event in self.__events])
+        return json.dumps([event.dictionary for event in self.__events])
 
     @_events_json.setter
     def _events_json(self, events_serialized: Union[str, bytes]):
@@ -678,29 +933,25 @@ class BaseComponent(BaseNode, lifecycle.Node):
         self.__events = json_to_events_list(events_serialized)
 
     @property
-    def _actions_json(self) -> Union[str, bytes]:
-        """Getter of serialized component Actions
+    def _actions_dict(self) -> Dict[str, List[Dict]]:
+        """Getter of component Actions as dictionaries
 
-        :return: Serialized Actions: {event_name: serialized_action}
-        :rtype: Union[str, bytes]
+        :return: Actions: {event_name: List[action_dictionary]}
+        :rtype: Dict[str, List[Dict]]
         """
-        actions_dict = {}
-        for event_name, action_set in self.events_actions.items():
-            actions_serialized = []
-            for action in action_set:
-                actions_serialized.append(action.dictionary)
-            actions_dict[event_name] = actions_serialized
-        return json.dumps(actions_dict)
+        return {
+            event_name: [action.dictionary for action in action_set]
+            for event_name, action_set in self.events_actions.items()
+        }
 
-    @_actions_json.setter
-    def _actions_json(self, actions_serialized: Union[str, bytes]):
-        """Setter of component events from JSON serialized actions
+    @_actions_dict.setter
+    def _actions_dict(self, actions_dict: Dict[str, List[Dict]]):
+        """Setter of component Actions from dictionaries
 
-        :param actions_serialized: Serialized Actions List
-        :type actions_serialized: Union[str, bytes]
+        :param actions_dict: Actions: {event_name: List[action_dictionary]}
+        :type actions_dict: Dict[str, List[Dict]]
         """
         self.__actions = []
-        actions_dict: Dict = json.loads(actions_serialized)
         for action_list in actions_dict.values():
             reconstructed_action_list = []
             for action_dict in action_list:
@@ -713,10 +964,54 @@ class BaseComponent(BaseNode, lifecycle.Node):
                     method=method,
                     args=action_dict["args"],
                     kwargs=action_dict["kwargs"],
+                    max_concurrency=action_dict.get("max_concurrency", 1),
                 )
                 reconstructed_action_list.append(reconstructed_action)
             self.__actions.append(reconstructed_action_list)
 
+    @property
+    def _actions_json(self) -> Union[str, bytes]:
+        """Getter of serialized component Actions
+
+        :return: Serialized Actions: {event_name: serialized_action}
+        :rtype: Union[str, bytes]
+        """
+        return json.dumps(self._actions_dict)
+
+    @_actions_json.setter
+    def _actions_json(self, actions_serialized: Union[str, bytes]):
+        """Setter of component events from JSON serialized actions
+
+        :param actions_serialized: Serialized Actions List
+        :type actions_serialized: Union[str, bytes]
+        """
+        self._actions_dict = json.loads(actions_serialized)
+
+    @property
+    def _events_actions_msgpack(self) -> bytes:
+        """Getter of the component Events/Actions serialized in a compact binary (msgpack) form
+
+        :return: Serialized Events/Actions
+        :rtype: bytes
+        """
+        patch_msgpack_numpy()
+        return msgpack.packb({
+            "events": [event.dictionary for event in self.__events or []],
+            "actions": self._actions_dict,
+        })
+
+    @_events_actions_msgpack.setter
+    def _events_actions_msgpack(self, serialized: bytes):
+        """Setter of the component Events/Actions from the compact binary (msgpack) form
+
+        :param serialized: Serialized Events/Actions
+        :type serialized: bytes
+        """
+        patch_msgpack_numpy()
+        events_actions = msgpack.unpackb(serialized)
+        self.__events = dicts_to_events_list(events_actions["events"])
+        self._actions_dict = events_actions["actions"]
+
     @property
     def _inputs_json(self) -> Union[str, bytes, bytearray]:
         """
@@ -1042,29 +1337,71 @@ class BaseComponent(BaseNode, lifecycle.Node):
 
         return error_msg
 
+    @classmethod
+    def get_config_parameters(cls, config: BaseComponentConfig) -> Dict[str, Any]:
+        """
+        Get the parameters of a config as a flat dictionary. Nested parameters are named 'parent.child'
+
+        :param config: Component config
+        :type config: ComponentConfig or child class
+
+        :return: Parameters {name: value}
+        :rtype: Dict[str, Any]
+        """
+        params = {}
+        for param_name, param_value in config.asdict().items():
+            if not isinstance(param_value, Dict):
+                params[param_name] = param_value
+            else:
+                for nested_name, nested_value in param_value.items():
+                    params[f"{param_name}.{nested_name}"] = nested_value
+        return params
+
+    @classmethod
+    def _param_changed(cls, old_value: Any, new_value: Any) -> bool:
+        """
+        Checks if a parameter value is changed
+
+        :param old_value: Old value
+        :type old_value: Any
+        :param new_value: New value
+        :type new_value: Any
+
+        :return: If the value is changed
+        :rtype: bool
+        """
+        try:
+            return bool(old_value != new_value)
+        except ValueError:
+            # Values without a single truth value (arrays)
+            return True
+
     @classmethod
     def get_change_parameters_msg_from_config(
-        cls, config: BaseComponentConfig
+        cls,
+        config: BaseComponentConfig,
+        reference_params: Optional[Dict[str, Any]] = None,
     ) -> ChangeParameters.Request:
         """
-        Helper method to update config parameter value and return an error message if it is not updated
+        Helper method to get the change parameters request corresponding to a config
 
         :param config: _description_
         :type config: ComponentConfig or child class
+        :param reference_params: Last known parameters of the component (see get_config_parameters). If provided, only the changed parameters are added to the request, defaults to None
+        :type reference_params: Optional[Dict[str, Any]], optional
 
         :return: Request message for change parameters services corresponding to the given config
         :rtype: ChangeParameters.Request
         """
         param_names = []
         param_values = []
-        for param_name, param_value in config.asdict().items():
-            if not isinstance(param_value, Dict):
-                param_names.append(param_name)
-                param_values.append(str(param_value))
-            else:
-                for nested_name, nested_value in param_value.items():
-                    param_names.append(f"{param_name}.{nested_name}")
-                    param_values.append(str(nested_value))
+        for param_name, param_value in cls.get_config_parameters(config).items():
+            if reference_params is not None and not cls._param_changed(
+                reference_params.get(param_name), param_value
+            ):
+                continue
+            param_names.append(param_name)
+            param_values.append(str(param_value))
 
         request_msg = ChangeParameters.Request()
         request_msg.names = param_names
@@ -1092,9 +1429,7 @@ class BaseComponent(BaseNode, lifecycle.Node):
         # To keep the component alive while reconfiguring
         keep_alive = request.keep_alive
 
-        if not keep_alive:
-            # Stop the component
-            self.stop()
+        old_config = self.config.asdict()
 
         error_msg = self._update_config_param_from_str_value(
             param_name, param_str_value
@@ -1106,9 +1441,8 @@ class BaseComponent(BaseNode, lifecycle.Node):
             response.success = False
             response.error_msg = error_msg
 
-        if not keep_alive:
-            # start again
-            self.start()
+        # Apply the change (restart only if required)
+        self._reconfigure_from_diff(old_config, keep_alive)
 
         return response
 
@@ -1132,9 +1466,7 @@ class BaseComponent(BaseNode, lifecycle.Node):
         # To keep the component alive while reconfiguring
         keep_alive = request.keep_alive
 
-        if not keep_alive:
-            # Stop the component
-            self.stop()
+        old_config = self.config.asdict()
 
         response.success = []
         response.error_msg = []
@@ -1149,9 +1481,8 @@ class BaseComponent(BaseNode, lifecycle.Node):
                 response.success.append(False)
                 response.error_msg.append(error_msg)
 
-        if not keep_alive:
-            # start again
-            self.start()
+        # Apply the changes (restart only if required)
+        self._reconfigure_from_diff(old_config, keep_alive)
 
         return response
 
@@ -1335,15 +1666,24 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         Component execution step every loop_step
         """
+        start_time = time.perf_counter()
         # Additional execution loop if exists
         if hasattr(self, "_extra_execute_loop"):
             self._extra_execute_loop()
+        extra_loop_end = time.perf_counter()
 
         # Execute main loop
         self._execution_step()
+        end_time = time.perf_counter()
 
-        if self.__enable_health_publishing:
-            self.health_status_publisher.publish(self.health_status())
+        # NOTE: The health status is published on change and periodically by the heartbeat timer
+        if self._loop_profiler:
+            self._loop_profiler.record(start_time, extra_loop_end, end_time)
+
+        if self._loop_rate_controller:
+            new_rate = self._loop_rate_controller.update(end_time - start_time)
+            if new_rate:
+                self._set_execution_loop_rate(new_rate)
 
         # Execute once
         if not hasattr(self, "_exec_started"):
@@ -1352,6 +1692,128 @@ class BaseComponent(BaseNode, lifecycle.Node):
                 self._extra_execute_once()
             self._exec_started = True
 
+    # EXECUTION LOOP RATE AND PROFILING
+    def _setup_loop_rate_tools(self) -> None:
+        """
+        Creates the execution loop profiler and the adaptive loop rate controller (if enabled in the config)
+        """
+        self._loop_profiler = (
+            LoopProfiler(period=1 / self.config.loop_rate)
+            if self.config.enable_loop_profiling
+            else None
+        )
+        self._loop_rate_controller = (
+            LoopRateController(
+                rate=self.config.loop_rate,
+                min_rate=self.config.min_loop_rate or self.config.loop_rate / 10,
+                max_rate=self.config.max_loop_rate or self.config.loop_rate,
+            )
+            if self.config.adaptive_loop_rate
+            else None
+        )
+        self.health_status.loop_rate = self.effective_loop_rate
+
+    @property
+    def effective_loop_rate(self) -> float:
+        """
+        Getter of the effective execution loop rate (different from the configured loop_rate when using an adaptive loop rate)
+
+        :return: Loop rate (Hz)
+        :rtype: float
+        """
+        if self._loop_rate_controller:
+            return self._loop_rate_controller.rate
+        return self.config.loop_rate
+
+    def _set_execution_loop_rate(self, rate: float) -> None:
+        """
+        Changes the period of the running execution timer
+
+        :param rate: New loop rate (Hz)
+        :type rate: float
+        """
+        if not hasattr(self, "_execution_timer"):
+            return
+        self._execution_timer.timer_period_ns = int(1e9 / rate)
+        if self._loop_profiler:
+            self._loop_profiler.period = 1 / rate
+        self.health_status.loop_rate = rate
+        self.get_logger().debug(f"Execution loop rate set to {rate:.2f} Hz")
+
+    @property
+    def loop_stats(self) -> Optional[Dict]:
+        """
+        Getter of the execution loop timing statistics (TIMED components with loop profiling enabled)
+
+        :return: Execution loop statistics, None if not available
+        :rtype: Optional[Dict]
+        """
+        return self._loop_profiler.stats if self._loop_profiler else None
+
+    def reset_loop_stats(self) -> None:
+        """
+        Reset the execution loop timing statistics
+        """
+        if self._loop_profiler:
+            self._loop_profiler.reset()
+
+    @property
+    def _loop_diagnostics_enabled(self) -> bool:
+        """
+        If the execution loop statistics are published on the diagnostics topic
+
+        :rtype: bool
+        """
+        return (
+            self.run_type == ComponentRunType.TIMED
+            and self.config.enable_loop_profiling
+            and self.config.diagnostics_rate > 0.0
+        )
+
+    def _publish_loop_diagnostics(self) -> None:
+        """
+        Publishes the execution loop statistics on the diagnostics topic
+        """
+        if not self._loop_profiler or not hasattr(self, "_diagnostics_publisher"):
+            return
+        stats = self._loop_profiler.stats
+        new_overruns = stats["overruns"] - getattr(self, "_published_overruns", 0)
+        self._published_overruns = stats["overruns"]
+
+        values = [
+            KeyValue(key=key, value=str(stats[key]))
+            for key in (
+                "period",
+                "steps",
+                "overruns",
+                "mean_duration",
+                "max_duration",
+                "mean_jitter",
+                "max_jitter",
+            )
+        ]
+        values.extend(
+            KeyValue(key=f"{phase}.{key}", value=str(value))
+            for phase, phase_stats in stats["phases"].items()
+            for key, value in phase_stats.items()
+        )
+        values.extend(
+            KeyValue(key=f"histogram.le_{bucket}", value=str(count))
+            for bucket, count in stats["histogram"].items()
+        )
+
+        status = DiagnosticStatus(
+            level=DiagnosticStatus.WARN if new_overruns > 0 else DiagnosticStatus.OK,
+            name=f"{self.node_name}: execution loop",
+            message=f"{new_overruns} overruns since last report"
+            if new_overruns > 0
+            else "OK",
+            values=values,
+        )
+        msg = DiagnosticArray(status=[status])
+        msg.header.stamp = self.get_clock().now().to_msg()
+        self._diagnostics_publisher.publish(msg)
+
     # COMPONENT ACTIONS
     @property
     def available_actions(self) -> List[str]:
@@ -1363,6 +1825,144 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         return get_methods_with_decorator(self, decorator_name="component_action")
 
+    # Period (seconds) to check for the end of an ongoing lifecycle transition
+    _TRANSITION_POLL_PERIOD: float = 0.01
+
+    # Maximum wait time (seconds) for an ongoing lifecycle transition to end
+    _TRANSITION_TIMEOUT: float = 5.0
+
+    def _is_in_transition(self) -> bool:
+        """
+        Checks if a lifecycle transition is ongoing
+
+        :return: If the lifecycle state machine is in a transition state
+        :rtype: bool
+        """
+        current_state = self.lifecycle_state
+        return current_state is not None and current_state > 4
+
+    def _wait_for_transition_end(self) -> bool:
+        """
+        Waits for an ongoing lifecycle transition to end (bounded by _TRANSITION_TIMEOUT)
+
+        :return: If no transition is ongoing
+        :rtype: bool
+        """
+        if not self._is_in_transition():
+            return True
+        self.get_logger().warn(
+            "Waiting for ongoing transition to end before executing new transition"
+        )
+        end_time = time.monotonic() + self._TRANSITION_TIMEOUT
+        while self._is_in_transition():
+            if time.monotonic() > end_time:
+                self.get_logger().error(
+                    f"Ongoing transition did not end after {self._TRANSITION_TIMEOUT} seconds, cannot execute new transition"
+                )
+                return False
+            time.sleep(self._TRANSITION_POLL_PERIOD)
+        return True
+
+    def _schedule_transition(
+        self, method: Callable[[], bool], delay: Optional[float] = None
+    ) -> Future:
+        """
+        Schedules a lifecycle transition method on the node executor using a one-shot timer. The method is executed after the given delay, once no other transition is ongoing
+
+        :param method: Transition method
+        :type method: Callable[[], bool]
+        :param delay: Delay (seconds) before executing the transition, defaults to None
+        :type delay: Optional[float], optional
+
+        :return: Future done with the transition method result
+        :rtype: Future
+        """
+        future = Future()
+        timer: Optional[Timer] = None
+
+        def _execute():
+            if future.done():
+                return
+            if self._is_in_transition():
+                # Check again on next poll
+                timer.timer_period_ns = int(1e9 * self._TRANSITION_POLL_PERIOD)
+                return
+            self.destroy_timer(timer)
+            try:
+                future.set_result(method())
+            except Exception as e:
+                future.set_exception(e)
+
+        timer = self.create_timer(
+            timer_period_sec=delay or self._TRANSITION_POLL_PERIOD,
+            callback=_execute,
+            callback_group=MutuallyExclusiveCallbackGroup(),
+        )
+        return future
+
+    def start_async(self) -> Future:
+        """
+        Schedules the component start on the node executor without blocking
+
+        :return: Future done with the start result
+        :rtype: Future
+        """
+        return self._schedule_transition(self.start)
+
+    def stop_async(self) -> Future:
+        """
+        Schedules the component stop on the node executor without blocking
+
+        :return: Future done with the stop result
+        :rtype: Future
+        """
+        return self._schedule_transition(self.stop)
+
+    def reconfigure_async(self, new_config: Any, keep_alive: bool = False) -> Future:
+        """
+        Schedules the component reconfiguration on the node executor without blocking
+
+        :param new_config: New component config
+        :type new_config: Any
+        :param keep_alive: Reconfigure while the component is online, defaults to False
+        :type keep_alive: bool, optional
+
+        :return: Future done with the reconfigure result
+        :rtype: Future
+        """
+        return self._schedule_transition(
+            partial(self.reconfigure, new_config=new_config, keep_alive=keep_alive)
+        )
+
+    def restart_async(self, wait_time: Optional[float] = None) -> Future:
+        """
+        Schedules the component restart (stop, then start after the wait time) on the node executor without blocking
+
+        :param wait_time: Wait time (seconds) between stop and start, defaults to None
+        :type wait_time: Optional[float], optional
+
+        :return: Future done with the restart result
+        :rtype: Future
+        """
+        future = Future()
+
+        def _on_start_done(start_future: Future):
+            if start_future.exception():
+                future.set_exception(start_future.exception())
+            else:
+                future.set_result(start_future.result())
+
+        def _on_stop_done(stop_future: Future):
+            if stop_future.exception():
+                future.set_exception(stop_future.exception())
+                return
+            self._schedule_transition(self.start, delay=wait_time).add_done_callback(
+                _on_start_done
+            )
+
+        self.stop_async().add_done_callback(_on_stop_done)
+        return future
+
     @component_action
     def start(self) -> bool:
         """
@@ -1371,6 +1971,9 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :return: If the component is started
         :rtype: bool
         """
+        if not self._wait_for_transition_end():
+            return False
+
         current_state = self.lifecycle_state
 
         if current_state == 3:
@@ -1381,13 +1984,6 @@ class BaseComponent(BaseNode, lifecycle.Node):
             # unconfigured or finalized -> configure again before starting
             self.trigger_configure()
 
-        while current_state > 4:
-            self.get_logger().warn(
-                "Waiting for ongoing transition to end before executing new transition",
-                once=True,
-            )
-            pass
-
         # configured and inactive
         self.trigger_activate()
         return True
@@ -1400,26 +1996,22 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :return: If the component is stopped
         :rtype: bool
         """
+        if not self._wait_for_transition_end():
+            return False
+
         current_state = self.lifecycle_state
 
         if current_state in [1, 2, 4]:
             # Already not active
             return True
 
-        while current_state > 4:
-            self.get_logger().warn(
-                "Waiting for ongoing transition to end before executing new transition",
-                once=True,
-            )
-            pass
-
         self.trigger_deactivate()
         return True
 
     @component_action
     def reconfigure(self, new_config: Any, keep_alive: bool = False) -> bool:
         """
-        Reconfigure the component - cleanup->stop->trigger_configure->start
+        Reconfigure the component. Changes that can be applied on the running component are applied directly (see '_apply_config_changes'), otherwise the component is reconfigured - cleanup->stop->trigger_configure->start
 
         :param new_config: New component config
         :type new_config: Any
@@ -1431,15 +2023,28 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         self.get_logger().warn("Reconfiguring component...")
 
+        old_config = self.config.asdict()
+
         # set new config as params attr
         if isinstance(new_config, str):
             self.configure(config_file=new_config)
         elif isinstance(new_config, self.config.__class__):
             self.config = new_config
 
+        changes = self._get_config_changes(old_config, self.config.asdict())
+
+        if self._apply_config_changes(changes):
+            return True
+
         if keep_alive:
+            self.get_logger().warn(
+                f"Changed parameters {sorted(changes & self._RESTART_CONFIG_PARAMS)} are applied after the component is restarted"
+            )
             return True
 
+        if not self._wait_for_transition_end():
+            return False
+
         initial_state = self.lifecycle_state
 
         if initial_state == 2:
@@ -1451,13 +2056,6 @@ class BaseComponent(BaseNode, lifecycle.Node):
             self.trigger_deactivate()
             self.trigger_cleanup()
 
-        while initial_state > 4:
-            self.get_logger().warn(
-                "Waiting for ongoing transition to end before executing new transition",
-                once=True,
-            )
-            pass
-
         # configure and go to configure (or active if the component was already active)
         self.trigger_configure()
 
@@ -1470,9 +2068,23 @@ class BaseComponent(BaseNode, lifecycle.Node):
         """
         Restart the component - stop->start
 
+        :param wait_time: Wait time (seconds) between stop and start. The start is scheduled on a timer without blocking, defaults to None
+        :type wait_time: Optional[float], optional
+
         :return: If the component is Reconfigured
         :rtype: bool
         """
+        if not self._wait_for_transition_end():
+            return False
+
+        if wait_time:
+            self.stop()
+            self.get_logger().warn(
+                f"Waiting for requested time '{wait_time}'seconds before starting again...",
+            )
+            self._schedule_transition(self.start, delay=wait_time)
+            return True
+
         current_state = self.lifecycle_state
 
         if current_state == 1:
@@ -1481,19 +2093,6 @@ class BaseComponent(BaseNode, lifecycle.Node):
         if current_state == 3:
             self.trigger_deactivate()
 
-        while current_state > 4:
-            self.get_logger().warn(
-                "Waiting for ongoing transition to end before executing new transition",
-                once=True,
-            )
-            pass
-
-        if wait_time:
-            self.get_logger().warn(
-                f"Waiting for requested time '{wait_time}'seconds before starting again...",
-            )
-            time.sleep(wait_time)
-
         # not configured -> configure and start
         self.trigger_activate()
         return True
@@ -1517,15 +2116,10 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :return: Parameter updated
         :rtype: bool
         """
-        try:
-            if keep_alive:
-                self.config.update_value(param_name, new_value)
-            else:
-                self.stop()
-                self.config.update_value(param_name, new_value)
-                self.start()
-        except Exception:
-            raise
+        old_config = self.config.asdict()
+        self.config.update_value(param_name, new_value)
+        # Apply the change (restart only if required)
+        self._reconfigure_from_diff(old_config, keep_alive)
         return True
 
     @component_action
@@ -1547,22 +2141,27 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :return: Parameter updated
         :rtype: bool
         """
-        try:
-            if keep_alive:
-                for param_name, new_value in zip(params_names, new_values):
-                    self.config.update_value(param_name, new_value)
-            else:
-                self.stop()
-                for param_name, new_value in zip(params_names, new_values):
-                    self.config.update_value(param_name, new_value)
-                self.start()
-        except Exception:
-            raise
+        old_config = self.config.asdict()
+        for param_name, new_value in zip(params_names, new_values):
+            self.config.update_value(param_name, new_value)
+        # Apply the changes (restart only if required)
+        self._reconfigure_from_diff(old_config, keep_alive)
         return True
 
     # END OF ACTIONS
 
     # FALLBACKS
+    def __destroy_fallbacks_check(self):
+        """
+        Destroys the fallbacks check timer and guard condition
+        """
+        if self.__fallbacks_check_timer:
+            self.destroy_timer(self.__fallbacks_check_timer)
+            self.__fallbacks_check_timer = None
+        if self.__fallbacks_guard:
+            self.destroy_guard_condition(self.__fallbacks_guard)
+            self.__fallbacks_guard = None
+
     def _fallbacks_check_callback(self):
         """
         Checks component health status and executes corresponding fallback in case of any detected failure
@@ -1671,7 +2270,12 @@ class BaseComponent(BaseNode, lifecycle.Node):
         return True
 
     def on_fail(
-        self, action: Union[List[Action], Action], max_retries: Optional[int] = None
+        self,
+        action: Union[List[Action], Action],
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_retry_delay: float = 60.0,
     ) -> None:
         """
         Set the fallback strategy (action) on any fail
@@ -1680,14 +2284,29 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :type action: Union[List[Action], Action]
         :param max_retries: Maximum number of action execution retries. None is equivalent to unlimited retries, defaults to None
         :type max_retries: Optional[int], optional
+        :param retry_delay: Delay (seconds) before the first retry, consecutive retries delays are increased exponentially. Zero is equivalent to retrying at the fallback_rate, defaults to 0.0
+        :type retry_delay: float, optional
+        :param backoff_factor: Retry delay multiplication factor after each retry, defaults to 2.0
+        :type backoff_factor: float, optional
+        :param max_retry_delay: Maximum delay (seconds) between two retries, defaults to 60.0
+        :type max_retry_delay: float, optional
         """
         if self._is_valid_fallback_action(action):
             self.__fallbacks.on_any_fail = Fallback(
-                action=action, max_retries=max_retries
+                action=action,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
             )
 
     def on_system_fail(
-        self, action: Union[List[Action], Action], max_retries: Optional[int] = None
+        self,
+        action: Union[List[Action], Action],
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_retry_delay: float = 60.0,
     ) -> None:
         """
         Set the fallback strategy (action) on system fail
@@ -1696,14 +2315,29 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :type action: Union[List[Action], Action]
         :param max_retries: Maximum number of action execution retries. None is equivalent to unlimited retries, defaults to None
         :type max_retries: Optional[int], optional
+        :param retry_delay: Delay (seconds) before the first retry, consecutive retries delays are increased exponentially. Zero is equivalent to retrying at the fallback_rate, defaults to 0.0
+        :type retry_delay: float, optional
+        :param backoff_factor: Retry delay multiplication factor after each retry, defaults to 2.0
+        :type backoff_factor: float, optional
+        :param max_retry_delay: Maximum delay (seconds) between two retries, defaults to 60.0
+        :type max_retry_delay: float, optional
         """
         if self._is_valid_fallback_action(action):
             self.__fallbacks.on_system_fail = Fallback(
-                action=action, max_retries=max_retries
+                action=action,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
             )
 
     def on_component_fail(
-        self, action: Union[List[Action], Action], max_retries: Optional[int] = None
+        self,
+        action: Union[List[Action], Action],
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_retry_delay: float = 60.0,
     ) -> None:
         """
         Set the fallback strategy (action) on component fail
@@ -1712,14 +2346,29 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :type action: Union[List[Action], Action]
         :param max_retries: Maximum number of action execution retries. None is equivalent to unlimited retries, defaults to None
         :type max_retries: Optional[int], optional
+        :param retry_delay: Delay (seconds) before the first retry, consecutive retries delays are increased exponentially. Zero is equivalent to retrying at the fallback_rate, defaults to 0.0
+        :type retry_delay: float, optional
+        :param backoff_factor: Retry delay multiplication factor after each retry, defaults to 2.0
+        :type backoff_factor: float, optional
+        :param max_retry_delay: Maximum delay (seconds) between two retries, defaults to 60.0
+        :type max_retry_delay: float, optional
         """
         if self._is_valid_fallback_action(action):
             self.__fallbacks.on_component_fail = Fallback(
-                action=action, max_retries=max_retries
+                action=action,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
             )
 
     def on_algorithm_fail(
-        self, action: Union[List[Action], Action], max_retries: Optional[int] = None
+        self,
+        action: Union[List[Action], Action],
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.0,
+        backoff_factor: float = 2.0,
+        max_retry_delay: float = 60.0,
     ) -> None:
         """
         Set the fallback strategy (action) on algorithm fail
@@ -1728,12 +2377,52 @@ class BaseComponent(BaseNode, lifecycle.Node):
         :type action: Union[List[Action], Action]
         :param max_retries: Maximum number of action execution retries. None is equivalent to unlimited retries, defaults to None
         :type max_retries: Optional[int], optional
+        :param retry_delay: Delay (seconds) before the first retry, consecutive retries delays are increased exponentially. Zero is equivalent to retrying at the fallback_rate, defaults to 0.0
+        :type retry_delay: float, optional
+        :param backoff_factor: Retry delay multiplication factor after each retry, defaults to 2.0
+        :type backoff_factor: float, optional
+        :param max_retry_delay: Maximum delay (seconds) between two retries, defaults to 60.0
+        :type max_retry_delay: float, optional
         """
         if self._is_valid_fallback_action(action):
             self.__fallbacks.on_algorithm_fail = Fallback(
-                action=action, max_retries=max_retries
+                action=action,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                backoff_factor=backoff_factor,
+                max_retry_delay=max_retry_delay,
             )
 
+    def _on_health_status_change(self) -> None:
+        """
+        Executed on every health status change: publishes the new status and signals the fallbacks check on failure
+        """
+        self._publish_health_status()
+        if not self.__fallbacks_check_timer or not self.__fallbacks_guard:
+            return
+        if self.health_status.is_healthy:
+            # No fallback checks while healthy
+            self.__fallbacks_check_timer.cancel()
+            self.__fallbacks.reset_backoff()
+            return
+        # Execute fallbacks immediately, then retry at fallback_rate while the failure persists
+        self.__fallbacks_guard.trigger()
+        if self.__fallbacks_check_timer.is_canceled():
+            self.__fallbacks_check_timer.reset()
+
+    def _publish_health_status(self) -> None:
+        """
+        Publishes the current health status (executed on status change and on heartbeat)
+        """
+        if self.__enable_health_publishing and hasattr(self, "health_status_publisher"):
+            # Heartbeat rate used by the Monitor to detect a missing heartbeat (zero when the heartbeat is stopped)
+            self.health_status().heartbeat_rate = (
+                float(self.config.status_heartbeat_rate)
+                if hasattr(self, "_status_heartbeat_timer")
+                else 0.0
+            )
+            self.health_status_publisher.publish(self.health_status())
+
     @component_fallback
     def broadcast_status(self) -> None:
         """
@@ -1810,11 +2499,17 @@ class BaseComponent(BaseNode, lifecycle.Node):
             # Create external processors
             self._attach_external_processors()
 
-            # Create failure check timer
+            # Create failure check timer and guard condition (triggered on failure)
+            fallbacks_callback_group = MutuallyExclusiveCallbackGroup()
             self.__fallbacks_check_timer = self.create_timer(
                 timer_period_sec=1 / self.config.fallback_rate,
                 callback=self._fallbacks_check_callback,
-                callback_group=MutuallyExclusiveCallbackGroup(),
+                callback_group=fallbacks_callback_group,
+            )
+            self.__fallbacks_check_timer.cancel()
+            self.__fallbacks_guard = self.create_guard_condition(
+                self._fallbacks_check_callback,
+                callback_group=fallbacks_callback_group,
             )
 
             self.health_status.set_healthy()
@@ -1849,7 +2544,7 @@ class BaseComponent(BaseNode, lifecycle.Node):
                 f"Node '{self.get_name()}' is in state '{state.label}'. Transitioning to 'deactivate'"
             )
 
-            self.destroy_timer(self.__fallbacks_check_timer)
+            self.__destroy_fallbacks_check()
             self.health_status.set_healthy()
             # Call custom method
             self.custom_on_deactivate()
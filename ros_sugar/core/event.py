@@ -1,17 +1,20 @@
 """Event"""
 
+import heapq
+import itertools
 import json
 import os
 import threading
 import time
 import logging
 from abc import abstractmethod
-from typing import Any, Callable, Dict, List, Union, Optional
+from typing import Any, Callable, Dict, List, Union, Optional, Tuple
 from launch.event import Event as ROSLaunchEvent
 from launch.event_handler import EventHandler as ROSLaunchEventHandler
 
 from ..io.topic import Topic
 from .action import Action
+from .actions_pool import get_actions_pool
 
 # Get ROS distro
 __installed_distro = os.environ.get("ROS_DISTRO", "").lower()
@@ -48,6 +51,108 @@ class Timer:
         self.done = True
 
 
+class Deadline:
+    """Re-armable deadline handled by the DeadlineScheduler"""
+
+    __slots__ = ("expiry", "callback", "queued")
+
+    def __init__(self, callback: Callable[[], Any]):
+        """Init a disarmed deadline
+
+        :param callback: Method to execute when the deadline expires
+        :type callback: Callable[[], Any]
+        """
+        self.expiry: Optional[float] = None
+        self.callback = callback
+        self.queued: bool = False
+
+
+class DeadlineScheduler:
+    """Single thread scheduler firing expired deadlines
+
+    Re-arming a deadline only updates its expiry time; the scheduler re-queues it lazily when the previous expiry is reached, so arming costs O(1) per message and no wakeups are spent on deadlines that keep getting pushed forward.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Deadline]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def arm(self, deadline: Deadline, timeout: float) -> None:
+        """Arm (or re-arm) a deadline to expire after a given timeout
+
+        :param deadline: Deadline
+        :type deadline: Deadline
+        :param timeout: Time to expiry (seconds)
+        :type timeout: float
+        """
+        with self._condition:
+            deadline.expiry = time.monotonic() + timeout
+            if deadline.queued:
+                return
+            deadline.queued = True
+            heapq.heappush(self._heap, (deadline.expiry, next(self._counter), deadline))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is deadline:
+                # New earliest deadline -> wake up the scheduler thread
+                self._condition.notify()
+
+    def disarm(self, deadline: Deadline) -> None:
+        """Disarm a deadline (it is dropped from the queue when reached)
+
+        :param deadline: Deadline
+        :type deadline: Deadline
+        """
+        with self._condition:
+            deadline.expiry = None
+
+    def _run(self) -> None:
+        """Scheduler thread loop"""
+        while True:
+            with self._condition:
+                expired = self._pop_expired()
+            try:
+                expired.callback()
+            except Exception as e:
+                logging.error(f"Error while executing deadline callback: {e}")
+
+    def _pop_expired(self) -> Deadline:
+        """Blocks until a deadline expires (must be called with the lock acquired)
+
+        :return: Expired deadline
+        :rtype: Deadline
+        """
+        while True:
+            if not self._heap:
+                self._condition.wait()
+                continue
+            queued_expiry, _, deadline = self._heap[0]
+            wait_time = queued_expiry - time.monotonic()
+            if wait_time > 0.0:
+                self._condition.wait(wait_time)
+                continue
+            heapq.heappop(self._heap)
+            if deadline.expiry is None:
+                # Disarmed
+                deadline.queued = False
+            elif deadline.expiry > queued_expiry:
+                # Re-armed since it was queued
+                heapq.heappush(
+                    self._heap, (deadline.expiry, next(self._counter), deadline)
+                )
+            else:
+                deadline.queued = False
+                deadline.expiry = None
+                return deadline
+
+
+# Process-wide scheduler shared by all events
+deadline_scheduler = DeadlineScheduler()
+
+
 def _access_attribute(obj: Any, nested_attributes: List[str]):
     """
     Access nested attribute (specified by attrs) in a given object
@@ -217,9 +322,16 @@ class Operand:
         :rtype: bool
         """
         if isinstance(self.value, List):
+            if isinstance(__value, List):
+                # Operand contains all the values
+                try:
+                    return set(__value).issubset(self.value)
+                except TypeError:
+                    # Unhashable values
+                    return all(val in self.value for val in __value)
             return __value in self.value
         if isinstance(__value, List):
-            return any(a == self.value for a in __value)
+            return self.value in __value
         return self.value == __value
 
     def __eq__(self, __value: object) -> bool:
@@ -329,6 +441,11 @@ class Event:
         handle_once: bool = False,
         keep_event_delay: float = 0.0,
         topic_template: Optional[Topic] = None,
+        debounce_count: int = 0,
+        debounce_time: float = 0.0,
+        hysteresis: float = 0.0,
+        max_trigger_rate: float = 0.0,
+        async_actions: bool = False,
     ) -> None:
         """Creates an event
 
@@ -346,12 +463,33 @@ class Event:
         :type keep_event_delay: float, optional
         :param topic_template: Option to provide the class with a template of the used topic class - Used for event serialization purposes, defaults to None
         :type topic_template: Optional[Topic], optional
+        :param debounce_count: Trigger the event only after the condition holds for this number of consecutive messages, defaults to 0
+        :type debounce_count: int, optional
+        :param debounce_time: Trigger the event only after the condition holds for this duration (seconds), defaults to 0.0
+        :type debounce_time: float, optional
+        :param hysteresis: Once triggered, the event is not triggered again until the value leaves the condition by this band (numeric threshold events) or the condition becomes false (other events), defaults to 0.0
+        :type hysteresis: float, optional
+        :param max_trigger_rate: Maximum rate of handling the event (Hz), no limit if zero, defaults to 0.0
+        :type max_trigger_rate: float, optional
+        :param async_actions: Execute the event methods and actions in the process actions pool instead of the event topic callback, defaults to False
+        :type async_actions: bool, optional
 
         :raises AttributeError: If a non-valid event_source is provided
 
         :raises TypeError: If the provided nested_attributes cannot be accessed in the Topic message type
+
+        :raises ValueError: If a negative debounce, hysteresis or rate value is provided
         """
         self.__name = event_name
+
+        self._handle_once: bool = handle_once
+        self._keep_event_delay: float = keep_event_delay
+        self._debounce_count: int = debounce_count
+        self._debounce_time: float = debounce_time
+        self._hysteresis: float = hysteresis
+        self._max_trigger_rate: float = max_trigger_rate
+        self._async_actions: bool = async_actions
+
         # Init the event from the json values
         if isinstance(event_source, str):
             self.json = event_source
@@ -365,15 +503,14 @@ class Event:
 
         elif isinstance(event_source, Topic):
             self.event_topic = event_source
-            if trigger_value is not None:
-                # Trigger access attributes
-                self._attrs: List[str] = (
-                    nested_attributes
-                    if isinstance(nested_attributes, List)
-                    else [nested_attributes]
-                )
+            # Trigger access attributes
+            self._attrs: List[str] = (
+                nested_attributes
+                if isinstance(nested_attributes, List)
+                else [nested_attributes]
+            )
 
-                self.trigger_ref_value = trigger_value
+            self.trigger_ref_value = trigger_value
 
         else:
             raise AttributeError(
@@ -397,12 +534,26 @@ class Event:
         # Register for on trigger actions
         self._registered_on_trigger_actions: List[Action] = []
 
+        trigger_options = (
+            self._debounce_count,
+            self._debounce_time,
+            self._hysteresis,
+            self._max_trigger_rate,
+        )
+        if min(trigger_options) < 0:
+            raise ValueError(
+                f"Cannot create event '{event_name}' with negative debounce, hysteresis or rate values"
+            )
+
         self.__under_processing = False
 
-        self._handle_once: bool = handle_once
         self._processed_once: bool = False
 
-        self._keep_event_delay: float = keep_event_delay
+        # Inline trigger filtering state
+        self._condition_count: int = 0
+        self._condition_start: Optional[float] = None
+        self._latched: bool = False
+        self._last_trigger_time: float = 0.0
 
     @property
     def under_processing(self) -> bool:
@@ -429,6 +580,10 @@ class Event:
         self._processed_once = False
         self.under_processing = False
         self.trigger = False
+        self._condition_count = 0
+        self._condition_start = None
+        self._latched = False
+        self._last_trigger_time = 0.0
 
     @property
     def name(self) -> str:
@@ -468,6 +623,11 @@ class Event:
             "_attrs": self._attrs,
             "handle_once": self._handle_once,
             "event_delay": self._keep_event_delay,
+            "debounce_count": self._debounce_count,
+            "debounce_time": self._debounce_time,
+            "hysteresis": self._hysteresis,
+            "max_trigger_rate": self._max_trigger_rate,
+            "async_actions": self._async_actions,
         }
 
     @dictionary.setter
@@ -489,6 +649,11 @@ class Event:
             self._attrs = dict_obj["_attrs"]
             self._handle_once = dict_obj["handle_once"]
             self._keep_event_delay = dict_obj["event_delay"]
+            self._debounce_count = dict_obj.get("debounce_count", 0)
+            self._debounce_time = dict_obj.get("debounce_time", 0.0)
+            self._hysteresis = dict_obj.get("hysteresis", 0.0)
+            self._max_trigger_rate = dict_obj.get("max_trigger_rate", 0.0)
+            self._async_actions = dict_obj.get("async_actions", False)
         except Exception as e:
             logging.error(f"Cannot set Event from incompatible dictionary. {e}")
             raise
@@ -503,9 +668,13 @@ class Event:
         :param topic_template: Template for the event topic
         :type topic_template: Topic
         """
-        # Set event topic from the dictionary using the template as an initial value
-        topic_template.from_json(dict_obj["topic"])
-        self.event_topic = topic_template
+        # Create a new event topic of the template class from the dictionary
+        topic_dict = (
+            json.loads(dict_obj["topic"])
+            if isinstance(dict_obj["topic"], (str, bytes, bytearray))
+            else dict_obj["topic"]
+        )
+        self.event_topic = topic_template.__class__(**topic_dict)
         self.dictionary = dict_obj
 
     @property
@@ -542,10 +711,58 @@ class Event:
         self._event_value = Operand(msg, self._attrs)
 
         self._update_trigger()
-        # Process event if trigger is up and the event is not already under processing
+        self._filter_trigger()
+        self._process_trigger(msg=msg, trigger=self._event_value)
+
+    def _filter_trigger(self) -> None:
+        """
+        Applies the debounce and hysteresis options to the trigger computed by _update_trigger
+        """
+        condition = self.trigger
+        if self._debounce_count or self._debounce_time:
+            if condition:
+                time_now = time.monotonic()
+                self._condition_count += 1
+                if self._condition_start is None:
+                    self._condition_start = time_now
+                self.trigger = (
+                    self._condition_count >= self._debounce_count
+                    and time_now - self._condition_start >= self._debounce_time
+                )
+            else:
+                self._condition_count = 0
+                self._condition_start = None
+
+        if self._hysteresis:
+            if self._latched:
+                # Keep the event latched until the condition is released
+                if not condition and self._hysteresis_released():
+                    self._latched = False
+                self.trigger = False
+            elif self.trigger:
+                self._latched = True
+
+    def _hysteresis_released(self) -> bool:
+        """
+        Checks if a latched event can be triggered again. Overridden by numeric threshold events to check the hysteresis band
+
+        :return: Event is released
+        :rtype: bool
+        """
+        return True
+
+    def _process_trigger(self, **kwargs) -> None:
+        """
+        Executes the event actions if the trigger is up and the event is not already under processing
+        """
         if self.trigger and not self.under_processing:
+            if self._max_trigger_rate:
+                time_now = time.monotonic()
+                if time_now - self._last_trigger_time < 1 / self._max_trigger_rate:
+                    return
+                self._last_trigger_time = time_now
             self.under_processing = True
-            self._call_on_trigger(msg=msg, trigger=self._event_value)
+            self._call_on_trigger(**kwargs)
             self.under_processing = False
             self._processed_once = True
             # If a delay is provided start a timer and set the event under_processing flag to False only when the delay expires
@@ -553,6 +770,18 @@ class Event:
                 self._delay_timer = Timer(duration=self._keep_event_delay)
                 self._delay_timer.start()
 
+    def activate(self) -> None:
+        """
+        Called when a listener to the event topic is created. Can be overridden by events requiring additional runtime setup
+        """
+        pass
+
+    def deactivate(self) -> None:
+        """
+        Called when the listener to the event topic is destroyed. Can be overridden by events requiring additional runtime cleanup
+        """
+        pass
+
     def register_method(self, method_name: str, method: Callable[..., Any]) -> None:
         """
         Adds a new method to the on trigger register
@@ -596,6 +825,10 @@ class Event:
         """
         Executes all the registered on trigger methods
         """
+        if self._async_actions:
+            self._submit_on_trigger(**kwargs)
+            return
+
         for method in self._registered_on_trigger_methods.values():
             method(*args, **kwargs)
 
@@ -603,6 +836,22 @@ class Event:
         for action in self._registered_on_trigger_actions:
             action(*args, **kwargs)
 
+    def _submit_on_trigger(self, **kwargs):
+        """
+        Submits all the registered on trigger methods and actions to the actions pool
+        """
+        pool = get_actions_pool()
+        for method_name, method in self._registered_on_trigger_methods.items():
+            pool.submit(f"{self.name}/{method_name}", method, **kwargs)
+
+        for action in self._registered_on_trigger_actions:
+            pool.submit(
+                f"{self.name}/{action.action_name}",
+                action,
+                max_concurrency=action.max_concurrency,
+                **kwargs,
+            )
+
     @abstractmethod
     def _update_trigger(self, *_, **__) -> None:
         """
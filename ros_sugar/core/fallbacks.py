@@ -1,5 +1,6 @@
 """Fallbacks"""
 
+import time
 from typing import List, Optional, Union
 
 from attrs import define, field
@@ -9,13 +10,21 @@ from .action import Action
 
 @define
 class Fallback:
-    """Fallback action and execution tracking"""
+    """Fallback action and execution tracking
+
+    When a 'retry_delay' is provided, consecutive executions of the fallback are spaced with an exponential backoff: the delay after the n-th execution is 'retry_delay * backoff_factor^(n-1)', up to 'max_retry_delay'
+    """
 
     action: Union[List[Action], Action] = field()
     max_retries: Optional[int] = field(default=None)
+    retry_delay: float = field(default=0.0)
+    backoff_factor: float = field(default=2.0)
+    max_retry_delay: float = field(default=60.0)
 
     action_idx: int = field(default=0, init=False)
     retry_idx: int = field(default=0, init=False)
+    executions_count: int = field(default=0, init=False)
+    next_attempt_time: float = field(default=0.0, init=False)
 
     def reset_current_idx(self):
         """Reset the current action index to zero"""
@@ -25,10 +34,37 @@ class Fallback:
         """Reset the current retries index to zero"""
         self.retry_idx = 0
 
+    def reset_backoff(self):
+        """Reset the retries backoff delay"""
+        self.executions_count = 0
+        self.next_attempt_time = 0.0
+
     def reset(self):
         """Reset the current action and the retries index to zero"""
         self.reset_current_idx()
         self.reset_retries()
+        self.reset_backoff()
+
+    @property
+    def in_backoff(self) -> bool:
+        """
+        Check if the fallback is waiting for the backoff delay before the next execution
+
+        :return: If the next execution is not yet allowed
+        :rtype: bool
+        """
+        return time.monotonic() < self.next_attempt_time
+
+    def register_execution(self):
+        """Register an execution of the fallback and compute the time of the next allowed execution"""
+        self.executions_count += 1
+        if self.retry_delay <= 0.0:
+            return
+        delay = min(
+            self.retry_delay * self.backoff_factor ** (self.executions_count - 1),
+            self.max_retry_delay,
+        )
+        self.next_attempt_time = time.monotonic() + delay
 
 
 class ComponentFallbacks:
@@ -129,6 +165,17 @@ class ComponentFallbacks:
         if self.on_system_fail:
             self.on_system_fail.reset_retries()
 
+    def reset_backoff(self):
+        """Reset all fallback retries backoff delays"""
+        for fallback in (
+            self.on_any_fail,
+            self.on_component_fail,
+            self.on_algorithm_fail,
+            self.on_system_fail,
+        ):
+            if fallback:
+                fallback.reset_backoff()
+
     def _execute_fallback(self, fallback: Optional[Fallback]) -> None:
         """
         Execute a fallback from given fallbacks methods
@@ -148,6 +195,11 @@ class ComponentFallbacks:
             else:
                 raise ValueError("No fallback actions are defined for detected failure")
 
+        if fallback.in_backoff:
+            # Wait for the backoff delay before retrying
+            self.__giveup = False
+            return
+
         if not isinstance(fallback.action, List):
             # Only one fallback action is available
 
@@ -155,12 +207,14 @@ class ComponentFallbacks:
             if not fallback.max_retries:
                 fallback.action()
                 fallback.retry_idx += 1
+                fallback.register_execution()
                 self.__giveup = False
                 return
 
             if fallback.retry_idx < fallback.max_retries:
                 fallback.action()
                 fallback.retry_idx += 1
+                fallback.register_execution()
                 self.__giveup = False
             else:
                 self.__giveup = True
@@ -180,6 +234,7 @@ class ComponentFallbacks:
 
         if fallback.action_idx < len(fallback.action):
             fallback.action[fallback.action_idx]()
+            fallback.register_execution()
             self.__giveup = False
         else:
             self.__giveup = True
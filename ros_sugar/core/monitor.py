@@ -1,13 +1,21 @@
 """Monitor"""
 
 import os
+import threading
+import time
+from collections import deque
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+from rclpy.client import Client
 from rclpy.publisher import Publisher
 from rclpy.callback_groups import MutuallyExclusiveCallbackGroup, ReentrantCallbackGroup
+from rclpy.task import Future
+from rclpy.timer import Timer
+from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+from lifecycle_msgs.msg import Transition
+from lifecycle_msgs.srv import ChangeState
 from automatika_ros_sugar.msg import ComponentStatus
 from automatika_ros_sugar.srv import (
-    ChangeParameter,
     ChangeParameters,
     ConfigureFromYaml,
     ReplaceTopic,
@@ -19,9 +27,13 @@ from ..config import BaseConfig
 from ..io.topic import Topic
 from .event import Event
 from .node import BaseNode
+from .status import STATUS_QOS, Status
 from .action import Action
 from ..launch import logger
 
+# Topic of the aggregated system health status published by the Monitor
+SYSTEM_STATUS_TOPIC = "/system_status"
+
 
 class Monitor(BaseNode):
     """
@@ -48,7 +60,11 @@ class Monitor(BaseNode):
         action_servers_components: Optional[List[BaseComponent]] = None,
         activate_on_start: Optional[List[BaseComponent]] = None,
         activation_timeout: Optional[float] = None,
-        activation_attempt_time: float = 1.0,
+        activation_attempt_time: float = 0.1,
+        missed_heartbeats_tolerance: int = 3,
+        publishers_idle_timeout: float = 60.0,
+        health_history_size: int = 10,
+        system_status_rate: float = 1.0,
         start_on_init: bool = False,
         component_name: str = "monitor",
         callback_group: Optional[
@@ -74,6 +90,18 @@ class Monitor(BaseNode):
         :type action_servers_components: Optional[List[Component]], optional
         :param activate_on_start: List of Lifecycle components to activate on start, defaults to None
         :type activate_on_start: Optional[List[Component]], optional
+        :param activation_timeout: Timeout (seconds) for activating the components on start, defaults to None
+        :type activation_timeout: Optional[float], optional
+        :param activation_attempt_time: Time (seconds) before retrying to activate a component whose lifecycle services are not discovered yet, defaults to 0.1
+        :type activation_attempt_time: float, optional
+        :param missed_heartbeats_tolerance: Number of consecutive missed heartbeats after which a component is considered failed. The heartbeat rate of each component is received in its health status, defaults to 3
+        :type missed_heartbeats_tolerance: int, optional
+        :param publishers_idle_timeout: Time (seconds) after which an unused publisher created by a publish message action is destroyed, defaults to 60.0
+        :type publishers_idle_timeout: float, optional
+        :param health_history_size: Number of recent health status transitions kept for each component, defaults to 10
+        :type health_history_size: int, optional
+        :param system_status_rate: Rate (Hz) in which the aggregated system health status is published on SYSTEM_STATUS_TOPIC. Publishing is disabled if zero, defaults to 1.0
+        :type system_status_rate: float, optional
         :param start_on_init: To activate provided components on start, defaults to False
         :type start_on_init: bool, optional
         :param component_name: Name of the ROS2 node, defaults to "monitor"
@@ -97,9 +125,6 @@ class Monitor(BaseNode):
         )
 
         # Server nodes handlers
-        self._update_parameter_srv_client: Dict[
-            str, base_clients.ServiceClientHandler
-        ] = {}
         self._update_parameters_srv_client: Dict[
             str, base_clients.ServiceClientHandler
         ] = {}
@@ -109,6 +134,13 @@ class Monitor(BaseNode):
         ] = {}
         self._main_srv_clients: Dict[str, base_clients.ServiceClientHandler] = {}
         self._main_action_clients: Dict[str, base_clients.ActionClientHandler] = {}
+        # Clients created on runtime requests: (name, type): client handler
+        self._srv_clients: Dict[
+            Tuple[str, type], base_clients.ServiceClientHandler
+        ] = {}
+        self._action_clients: Dict[
+            Tuple[str, type], base_clients.ActionClientHandler
+        ] = {}
 
         self._components_to_activate_on_start = activate_on_start
 
@@ -120,63 +152,333 @@ class Monitor(BaseNode):
         self.__activation_timeout = activation_timeout
         self.__activation_attempt_time = activation_attempt_time
 
+        # Components activation on start: each component is activated when it announces itself on its status topic
+        self.__components_pending_activation: Set[str] = {
+            comp.node_name for comp in activate_on_start or []
+        }
+        self.__components_activating: Set[str] = set()
+        self.__activation_lock = threading.Lock()
+        self.__change_state_clients: Dict[str, Client] = {}
+        self.__activation_retry_timers: Dict[str, Timer] = {}
+        self.__activation_timeout_timer: Optional[Timer] = None
+        self.__activation_start_time: float = time.monotonic()
+        # Component name: time to active (seconds)
+        self._components_activation_time: Dict[str, float] = {}
+        # Components with a failed activation transition
+        self._components_activation_failed: Set[str] = set()
+
         # Emit exit all to the launcher
         self._emit_exit_to_launcher: Optional[Callable] = None
 
+        # Components health status: last received status and reception time
+        self._components_status: Dict[str, Status] = {}
+        self._components_last_seen: Dict[str, float] = {}
+        # Heartbeat timeout of the components publishing a heartbeat (active components)
+        self._missed_heartbeats_tolerance = missed_heartbeats_tolerance
+        self._components_heartbeat_timeout: Dict[str, float] = {}
+        self.__heartbeat_check_timer: Optional[Timer] = None
+        self._stale_components: Set[str] = set()
+        # Recent health status transitions of each component: (time, old status value, new status value)
+        self._health_history_size = health_history_size
+        self._components_transitions: Dict[str, Deque[Tuple[float, int, int]]] = {}
+        self._system_status_rate = system_status_rate
+
+        # Last known parameters of the components (confirmed by the components responses), used to send only the changed parameters
+        self._components_last_params: Dict[str, Dict[str, Any]] = {}
+        # Components with an unknown running config: all the requested parameters are sent until a request succeeds
+        self._components_params_invalidated: Set[str] = set()
+
+        # Publishers created by publish message actions: (topic name, msg type, QoS): publisher
+        self._publishers_idle_timeout = publishers_idle_timeout
+        self._publishers: Dict[Tuple, Publisher] = {}
+        self._publishers_last_used: Dict[Tuple, float] = {}
+        # Publishing timers: (topic name, msg type, QoS): (timer, message, end time)
+        self._publish_timers: Dict[Tuple, Tuple[Timer, Any, Optional[float]]] = {}
+        self.__publishers_lock = threading.Lock()
+
+    @property
+    def components_status(self) -> Dict[str, Status]:
+        """
+        Getter of the last known health status of the monitored components. Components with a missing heartbeat are reported with a component level failure
+
+        :return: Component name: health status
+        :rtype: Dict[str, Status]
+        """
+        return self._components_status
+
+    def get_component_health(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the health of a monitored component from the Monitor health table
+
+        :param component_name: Component name
+        :type component_name: str
+
+        :return: Health {'status': last known status, 'last_seen': last status reception time (monotonic seconds) or None, 'transitions': recent status transitions [(time, old status value, new status value)]}, None if no status was received from the component
+        :rtype: Optional[Dict[str, Any]]
+        """
+        status = self._components_status.get(component_name)
+        if not status:
+            return None
+        return {
+            "status": status,
+            "last_seen": self._components_last_seen.get(component_name),
+            "transitions": list(self._components_transitions.get(component_name, [])),
+        }
+
+    @property
+    def system_healthy(self) -> bool:
+        """
+        Property to check if all the monitored components are healthy, a component without a received status is considered unhealthy
+
+        :return: If all the components are healthy
+        :rtype: bool
+        """
+        for component_name in self._components_to_monitor:
+            status = self._components_status.get(component_name)
+            if not status or not status.is_healthy:
+                return False
+        return all(status.is_healthy for status in self._components_status.values())
+
+    @property
+    def components_activation_time(self) -> Dict[str, float]:
+        """
+        Getter of the time (seconds) taken by each component activated on start to become active
+
+        :return: Component name: time to active
+        :rtype: Dict[str, float]
+        """
+        return self._components_activation_time
+
+    @property
+    def components_activation_failed(self) -> Set[str]:
+        """
+        Getter of the components activated on start with a failed lifecycle transition
+
+        :return: Components names
+        :rtype: Set[str]
+        """
+        return self._components_activation_failed
+
     def add_components_activation_event(self, method) -> None:
         """
-        Adds a method to be executed when components are activated
+        Adds a method to be executed when all the components to activate on start are active
 
         :param method: Method to be executed on components activation
         :type method: Callable
         """
         self.__components_activation_event = method
 
+    def create_all_publishers(self) -> None:
+        """
+        Create the aggregated system health status publisher
+        """
+        if self._enable_health_monitoring and self._system_status_rate > 0.0:
+            self._system_status_publisher: Publisher = self.create_publisher(
+                msg_type=DiagnosticArray, topic=SYSTEM_STATUS_TOPIC, qos_profile=1
+            )
+        super().create_all_publishers()
+
     def create_all_timers(self) -> None:
         """
         Create all timers
         """
-        # Create a timer for components activation
-        if self._components_to_activate_on_start:
-            callback_group = MutuallyExclusiveCallbackGroup()
-            self.__activation_wait_time: float = 0.0
-            self.__components_monitor_timer = self.create_timer(
-                timer_period_sec=self.__activation_attempt_time,
-                callback=self._check_and_activate_components,
-                callback_group=callback_group,
+        # Create a timer to publish the aggregated system health status
+        if hasattr(self, "_system_status_publisher"):
+            self.__system_status_timer = self.create_timer(
+                timer_period_sec=1 / self._system_status_rate,
+                callback=self._publish_system_status,
+                callback_group=MutuallyExclusiveCallbackGroup(),
+            )
+        # Create a timer to detect a components activation timeout
+        if self.__components_pending_activation:
+            self.__activation_start_time = time.monotonic()
+            if self.__activation_timeout:
+                self.__activation_timeout_timer = self.create_timer(
+                    timer_period_sec=self.__activation_timeout,
+                    callback=self._check_activation_timeout,
+                    callback_group=MutuallyExclusiveCallbackGroup(),
+                )
+        # Create a timer to destroy the idle publishers of publish message actions
+        if self._publishers_idle_timeout > 0.0:
+            self.__publishers_eviction_timer = self.create_timer(
+                timer_period_sec=self._publishers_idle_timeout / 2,
+                callback=self._evict_idle_publishers,
+                callback_group=MutuallyExclusiveCallbackGroup(),
             )
         super().create_all_timers()
 
-    def _check_and_activate_components(self) -> None:
+    def _check_activation_timeout(self) -> None:
         """
-        Checks and activates requested components
+        Timer callback executed after the activation timeout to check that all the requested components are active
         """
-        self.__activation_wait_time += self.__activation_attempt_time
-        node_names = self.get_node_names()
-        components_to_activate_names = (
-            [comp.node_name for comp in self._components_to_activate_on_start]
-            if self._components_to_activate_on_start
-            else []
+        if self.__activation_timeout_timer:
+            self.destroy_timer(self.__activation_timeout_timer)
+            self.__activation_timeout_timer = None
+        __notfound = self.__components_pending_activation | self.__components_activating
+        if not __notfound:
+            return
+        if self._emit_exit_to_launcher:
+            self._emit_exit_to_launcher()
+
+        raise LookupError(
+            f"Timeout while Waiting for nodes '{__notfound}' to come up to activate. A process might have died. If all processes are starting without errors, then this might be a ROS2 discovery problem. Run 'ros2 node list' to see if nodes with the same name already exist or old nodes are not killed properly. Alternatively, try to restart ROS2 daemon."
         )
-        __notfound: Optional[List] = None
-        if set(components_to_activate_names).issubset(set(node_names)):
-            logger.info(f"NODES '{components_to_activate_names}' ARE UP ... ACTIVATING")
-            if self.__components_activation_event:
-                self.__components_activation_event()
-            self.destroy_timer(self.__components_monitor_timer)
-        else:
-            __notfound = set(components_to_activate_names).difference(set(node_names))
-            logger.info(f"Waiting for Nodes '{__notfound}' to come up to activate ...")
-        if (
-            self.__activation_timeout
-            and self.__activation_wait_time > self.__activation_timeout
-        ):
-            if self._emit_exit_to_launcher:
-                self._emit_exit_to_launcher()
-
-            raise LookupError(
-                f"Timeout while Waiting for nodes '{__notfound}' to come up to activate. A process might have died. If all processes are starting without errors, then this might be a ROS2 discovery problem. Run 'ros2 node list' to see if nodes with the same name already exist or old nodes are not killed properly. Alternatively, try to restart ROS2 daemon."
+
+    def _activate_component(self, component_name: str) -> None:
+        """
+        Activates a component (configure + activate) using asynchronous lifecycle transition requests. Executed when the component announces itself, all the components are activated concurrently
+
+        :param component_name: Component name
+        :type component_name: str
+        """
+        with self.__activation_lock:
+            if (
+                component_name not in self.__components_pending_activation
+                or component_name in self.__activation_retry_timers
+            ):
+                return
+            if component_name not in self.__change_state_clients:
+                self.__change_state_clients[component_name] = self.create_client(
+                    ChangeState,
+                    f"{component_name}/change_state",
+                    callback_group=ReentrantCallbackGroup(),
+                )
+
+            if not self.__change_state_clients[component_name].service_is_ready():
+                # Services discovery can lag behind the status topic discovery -> Retry
+                self.__activation_retry_timers[component_name] = self.create_timer(
+                    timer_period_sec=self.__activation_attempt_time,
+                    callback=partial(self._retry_component_activation, component_name),
+                    callback_group=MutuallyExclusiveCallbackGroup(),
+                )
+                return
+
+            self.__components_pending_activation.discard(component_name)
+            self.__components_activating.add(component_name)
+
+        logger.info(f"NODE '{component_name}' IS UP ... ACTIVATING")
+        self._request_transitions(
+            component_name,
+            [Transition.TRANSITION_CONFIGURE, Transition.TRANSITION_ACTIVATE],
+        )
+
+    def _retry_component_activation(self, component_name: str) -> None:
+        """
+        Timer callback to retry activating a component whose lifecycle services were not discovered
+
+        :param component_name: Component name
+        :type component_name: str
+        """
+        timer = self.__activation_retry_timers.pop(component_name, None)
+        if timer:
+            self.destroy_timer(timer)
+        self._activate_component(component_name)
+
+    def _request_transitions(self, component_name: str, transitions: List[int]) -> None:
+        """
+        Sends the first lifecycle transition request of a list to a component, the following transitions are requested when the response is received
+
+        :param component_name: Component name
+        :type component_name: str
+        :param transitions: Transitions IDs
+        :type transitions: List[int]
+        """
+        self._invalidate_component_params(component_name)
+        request = ChangeState.Request()
+        request.transition.id = transitions[0]
+        future = self.__change_state_clients[component_name].call_async(request)
+        future.add_done_callback(
+            partial(
+                self._on_transition_done,
+                component_name=component_name,
+                transitions=transitions,
+            )
+        )
+
+    def _on_transition_done(
+        self, future: Future, component_name: str, transitions: List[int]
+    ) -> None:
+        """
+        Lifecycle transition response callback: requests the next transition or registers the component as active
+
+        :param future: Transition request future
+        :type future: Future
+        :param component_name: Component name
+        :type component_name: str
+        :param transitions: Requested transitions IDs (starting with the executed transition)
+        :type transitions: List[int]
+        """
+        transition_label = {
+            Transition.TRANSITION_CONFIGURE: "configure",
+            Transition.TRANSITION_ACTIVATE: "activate",
+        }.get(transitions[0], str(transitions[0]))
+        response = future.result()
+        if response is None:
+            self._on_activation_failed(
+                component_name,
+                f"no response to the '{transition_label}' transition request",
             )
+            return
+        if not response.success:
+            if len(transitions) == 1:
+                self._on_activation_failed(
+                    component_name, f"'{transition_label}' transition failed"
+                )
+                return
+            # The component can already be in the target state of the transition -> Continue
+            logger.warning(
+                f"Transition '{transition_label}' of component '{component_name}' failed, requesting next transition"
+            )
+
+        if len(transitions) > 1:
+            self._request_transitions(component_name, transitions[1:])
+            return
+
+        time_to_active = time.monotonic() - self.__activation_start_time
+        self._components_activation_time[component_name] = time_to_active
+        self._components_activation_failed.discard(component_name)
+        logger.info(f"NODE '{component_name}' IS ACTIVE AFTER {time_to_active:.3f}s")
+        self._end_component_activation(component_name)
+
+    def _on_activation_failed(self, component_name: str, reason: str) -> None:
+        """
+        Registers a component with a failed activation transition as failed
+
+        :param component_name: Component name
+        :type component_name: str
+        :param reason: Failure description
+        :type reason: str
+        """
+        logger.error(f"Failed to activate component '{component_name}': {reason}")
+        self._components_activation_failed.add(component_name)
+        status = Status()
+        status.set_fail_component(component_names=[component_name])
+        self._set_component_status(component_name, status)
+        self._end_component_activation(component_name)
+
+    def _end_component_activation(self, component_name: str) -> None:
+        """
+        Removes a component from the components under activation and executes the activation event when all the components are activated
+
+        :param component_name: Component name
+        :type component_name: str
+        """
+        with self.__activation_lock:
+            self.__components_activating.discard(component_name)
+            if self.__components_pending_activation or self.__components_activating:
+                return
+        if self.__activation_timeout_timer:
+            self.destroy_timer(self.__activation_timeout_timer)
+            self.__activation_timeout_timer = None
+        time_to_active = time.monotonic() - self.__activation_start_time
+        if self._components_activation_failed:
+            logger.error(
+                f"COMPONENTS ACTIVATION ENDED AFTER {time_to_active:.3f}s WITH FAILED COMPONENTS: {sorted(self._components_activation_failed)}"
+            )
+            return
+        logger.info(f"ALL NODES ARE ACTIVE AFTER {time_to_active:.3f}s")
+        if self.__components_activation_event:
+            self.__components_activation_event()
 
     @property
     def events(self):
@@ -191,7 +493,6 @@ class Monitor(BaseNode):
     def _turn_on_component_management(self, component_name: str) -> None:
         """
         Created clients for all main services in a given component
-        - Change a component parameter
         - Change a set of component parameters
         - Replace a topic
         - Reconfigure component from yaml file
@@ -199,14 +500,6 @@ class Monitor(BaseNode):
         :param component_name: Name of the component (ROS node name)
         :type component_name: str
         """
-        self._update_parameter_srv_client[component_name] = (
-            base_clients.ServiceClientHandler(
-                client_node=self,
-                srv_type=ChangeParameter,
-                srv_name=f"/{component_name}/update_config_parameter",
-            )
-        )
-
         self._update_parameters_srv_client[component_name] = (
             base_clients.ServiceClientHandler(
                 client_node=self,
@@ -241,7 +534,7 @@ class Monitor(BaseNode):
     ) -> None:
         """
         Configure a given component from config instance or config file
-        Creates and send the request to the component service
+        Creates and send the request to the component service. For a config instance, only the parameters changed from the last known component config are sent
 
         :param component: Component to configure
         :type component: BaseComponent
@@ -249,30 +542,62 @@ class Monitor(BaseNode):
         :type config: object | str
         :param keep_alive: To keep the component running while configuring
         :type keep_alive: bool
-        :param executor: Used to spin the monitor node until the service response is received, defaults to None
-        :type executor: ROS Executor, optional
-        """
-        try:
-            # For config instance prepare change parameters request
-            if isinstance(new_config, component.config.__class__):
-                request_msg: ChangeParameters.Request = (
-                    component.get_change_parameters_msg_from_config(new_config)
-                )
-                request_msg.keep_alive = keep_alive
-                self._update_parameters_srv_client[component.node_name].send_request(
-                    request_msg, executor=self.executor
-                )
-            else:
-                # For string send a configure from yaml request
-                request_msg_yaml = ConfigureFromYaml.Request()
-                request_msg_yaml.path_to_file = new_config
-                self._configure_from_yaml_srv_client[component.node_name].send_request(
-                    request_msg_yaml, executor=self.executor
+        """
+        self.configure_components({component: new_config}, keep_alive=keep_alive)
+
+    def configure_components(
+        self,
+        components_configs: Dict[BaseComponent, Union[object, str]],
+        keep_alive: bool = False,
+        timeout: float = 5.0,
+        done_callback: Optional[Callable[[Dict[str, bool]], Any]] = None,
+        force: bool = False,
+    ) -> Dict[str, Future]:
+        """
+        Configure a set of components concurrently from config instances or config files. For config instances, only the parameters changed from the last known config of each component are sent
+
+        :param components_configs: Component: Config instance or path to config file
+        :type components_configs: Dict[BaseComponent, Union[object, str]]
+        :param keep_alive: To keep the components running while configuring, defaults to False
+        :type keep_alive: bool, optional
+        :param timeout: Timeout (seconds) for each component response, defaults to 5.0
+        :type timeout: float, optional
+        :param done_callback: Method executed with the results {component_name: success} when all the components responded or timed out, defaults to None
+        :type done_callback: Optional[Callable[[Dict[str, bool]], Any]], optional
+        :param force: Send all the config parameters regardless of the last known config, defaults to False
+        :type force: bool, optional
+
+        :return: Requests futures {component_name: future}
+        :rtype: Dict[str, Future]
+        """
+        components_params: Dict[BaseComponent, Dict[str, Any]] = {}
+        yaml_requests: Dict[str, Any] = {}
+        for component, new_config in components_configs.items():
+            try:
+                if isinstance(new_config, component.config.__class__):
+                    components_params[component] = component.get_config_parameters(
+                        new_config
+                    )
+                else:
+                    # For string send a configure from yaml request
+                    request_msg_yaml = ConfigureFromYaml.Request()
+                    request_msg_yaml.path_to_file = new_config
+                    request_msg_yaml.keep_alive = keep_alive
+                    yaml_requests[component.node_name] = request_msg_yaml
+                    # The component config is unknown after the change
+                    self._invalidate_component_params(component.node_name)
+            except Exception as e:
+                self.get_logger().error(
+                    f"Unable to configure component {component.node_name}: {e}"
                 )
-        except Exception as e:
-            self.get_logger().error(
-                f"Unable to configure component {component.node_name}: {e}"
-            )
+
+        return self._send_batch_requests(
+            self._get_changed_parameters(components_params, force),
+            yaml_requests,
+            keep_alive,
+            timeout,
+            done_callback,
+        )
 
     def update_parameter(
         self,
@@ -281,7 +606,7 @@ class Monitor(BaseNode):
         new_value: Any,
         keep_alive: bool = True,
     ) -> None:
-        """Sends a ChangeParameter service request to given component
+        """Sends a parameter change request to given component (if the value is different from the last known value)
 
         :param component: _description_
         :type component: BaseComponent
@@ -292,14 +617,9 @@ class Monitor(BaseNode):
         :param keep_alive: _description_, defaults to True
         :type keep_alive: bool, optional
         """
-        srv_client: base_clients.ServiceClientHandler = (
-            self._update_parameter_srv_client[component.node_name]
+        self.update_components_parameters(
+            {component: {param_name: new_value}}, keep_alive=keep_alive
         )
-        srv_request = ChangeParameter.Request()
-        srv_request.name = param_name
-        srv_request.value = str(new_value)
-        srv_request.keep_alive = keep_alive
-        srv_client.send_request(req_msg=srv_request, executor=self.executor)
 
     def update_parameters(
         self,
@@ -309,7 +629,7 @@ class Monitor(BaseNode):
         keep_alive: bool = True,
         **_,
     ) -> None:
-        """Sends a ChangeParameters service request to given component
+        """Sends a ChangeParameters service request to given component with the parameters different from the last known values
 
         :param component: _description_
         :type component: BaseComponent
@@ -320,14 +640,286 @@ class Monitor(BaseNode):
         :param keep_alive: _description_, defaults to True
         :type keep_alive: bool, optional
         """
-        srv_client: base_clients.ServiceClientHandler = (
-            self._update_parameters_srv_client[component.node_name]
+        self.update_components_parameters(
+            {component: dict(zip(params_names, new_values, strict=False))},
+            keep_alive=keep_alive,
+        )
+
+    def update_components_parameters(
+        self,
+        components_params: Dict[BaseComponent, Dict[str, Any]],
+        keep_alive: bool = True,
+        timeout: float = 5.0,
+        done_callback: Optional[Callable[[Dict[str, bool]], Any]] = None,
+        force: bool = False,
+    ) -> Dict[str, Future]:
+        """Sends parameters updates to a set of components concurrently. Only the parameters different from the last known config of each component are sent, and the results are gathered with a timeout per component
+
+        :param components_params: Component: {parameter_name: new_value}
+        :type components_params: Dict[BaseComponent, Dict[str, Any]]
+        :param keep_alive: To keep the components running when updating the values, defaults to True
+        :type keep_alive: bool, optional
+        :param timeout: Timeout (seconds) for each component response, defaults to 5.0
+        :type timeout: float, optional
+        :param done_callback: Method executed with the results {component_name: success} when all the components responded or timed out, defaults to None
+        :type done_callback: Optional[Callable[[Dict[str, bool]], Any]], optional
+        :param force: Send all the given parameters regardless of the last known config, defaults to False
+        :type force: bool, optional
+
+        :return: Requests futures {component_name: future}
+        :rtype: Dict[str, Future]
+        """
+        return self._send_batch_requests(
+            self._get_changed_parameters(components_params, force),
+            {},
+            keep_alive,
+            timeout,
+            done_callback,
         )
-        srv_request = ChangeParameters.Request()
-        srv_request.names = params_names
-        srv_request.values = str(new_values)
-        srv_request.keep_alive = keep_alive
-        srv_client.send_request(req_msg=srv_request, executor=self.executor)
+
+    def _get_changed_parameters(
+        self,
+        components_params: Dict[BaseComponent, Dict[str, Any]],
+        force: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get the parameters different from the last known config of each component
+
+        :param components_params: Component: {parameter_name: new_value}
+        :type components_params: Dict[BaseComponent, Dict[str, Any]]
+        :param force: Get all the given parameters regardless of the last known config, defaults to False
+        :type force: bool, optional
+
+        :return: Changed parameters {component_name: {parameter_name: new_value}}, components without changes are skipped
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        changed_params = {}
+        for component, params in components_params.items():
+            last_params = self._components_last_params.get(component.node_name)
+            if (
+                force
+                or last_params is None
+                or component.node_name in self._components_params_invalidated
+            ):
+                # No baseline of the running config -> send all the parameters
+                changed = dict(params)
+            else:
+                changed = {
+                    name: value
+                    for name, value in params.items()
+                    if name not in last_params
+                    or BaseComponent._param_changed(last_params[name], value)
+                }
+            if not changed:
+                self.get_logger().debug(
+                    f"No parameters changes to send to '{component.node_name}'"
+                )
+                continue
+            changed_params[component.node_name] = changed
+        return changed_params
+
+    def _invalidate_component_params(self, component_name: str) -> None:
+        """Clears the last known config of a component, the next configuration requests are sent without filtering the unchanged parameters until a request succeeds
+
+        :param component_name: Component name
+        :type component_name: str
+        """
+        self._components_last_params.pop(component_name, None)
+        self._components_params_invalidated.add(component_name)
+
+    def _send_batch_requests(
+        self,
+        changed_params: Dict[str, Dict[str, Any]],
+        yaml_requests: Dict[str, ConfigureFromYaml.Request],
+        keep_alive: bool,
+        timeout: float,
+        done_callback: Optional[Callable[[Dict[str, bool]], Any]],
+    ) -> Dict[str, Future]:
+        """Sends configuration requests to a set of components concurrently and gathers the results with a timeout per component
+
+        :param changed_params: Parameters to change {component_name: {parameter_name: new_value}}
+        :type changed_params: Dict[str, Dict[str, Any]]
+        :param yaml_requests: Configure from yaml requests {component_name: request}
+        :type yaml_requests: Dict[str, ConfigureFromYaml.Request]
+        :param keep_alive: To keep the components running when updating the values
+        :type keep_alive: bool
+        :param timeout: Timeout (seconds) for each component response
+        :type timeout: float
+        :param done_callback: Method executed with the results when all the components responded or timed out
+        :type done_callback: Optional[Callable[[Dict[str, bool]], Any]]
+
+        :return: Requests futures {component_name: future}
+        :rtype: Dict[str, Future]
+        """
+        requests: List[
+            Tuple[str, Any, Dict[str, base_clients.ServiceClientHandler]]
+        ] = []
+        for component_name, params in changed_params.items():
+            request = ChangeParameters.Request()
+            request.names = list(params.keys())
+            request.values = [str(value) for value in params.values()]
+            request.keep_alive = keep_alive
+            requests.append((
+                component_name,
+                request,
+                self._update_parameters_srv_client,
+            ))
+        for component_name, request in yaml_requests.items():
+            requests.append((
+                component_name,
+                request,
+                self._configure_from_yaml_srv_client,
+            ))
+
+        batch = _RequestsBatch(
+            [component_name for component_name, _, _ in requests], done_callback
+        )
+        futures: Dict[str, Future] = {}
+        if not requests:
+            if done_callback:
+                done_callback({})
+            return futures
+        for component_name, request, clients in requests:
+            future = None
+            if component_name in clients:
+                future = clients[component_name].send_request_async(
+                    request,
+                    done_callback=partial(
+                        self._on_batch_response,
+                        batch=batch,
+                        component_name=component_name,
+                        params=changed_params.get(component_name),
+                    ),
+                )
+            else:
+                self.get_logger().error(
+                    f"Component '{component_name}' is not managed by the Monitor"
+                )
+            if not future:
+                self._finish_batch_request(batch, component_name, False)
+                continue
+            futures[component_name] = future
+            batch.timers[component_name] = self.create_timer(
+                timer_period_sec=timeout,
+                callback=partial(
+                    self._on_batch_timeout,
+                    batch=batch,
+                    component_name=component_name,
+                    timeout=timeout,
+                ),
+            )
+        return futures
+
+    def _on_batch_response(
+        self,
+        future: Future,
+        batch: "_RequestsBatch",
+        component_name: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Configuration request response callback: updates the last known config of the component
+
+        :param future: Request future
+        :type future: Future
+        :param batch: Requests batch
+        :type batch: _RequestsBatch
+        :param component_name: Component name
+        :type component_name: str
+        :param params: Sent parameters {parameter_name: new_value}, None for configure from yaml requests, defaults to None
+        :type params: Optional[Dict[str, Any]], optional
+        """
+        response = future.result()
+        if response is None:
+            success = False
+        elif params is None:
+            success = response.success
+        else:
+            success = all(response.success)
+            last_params = self._components_last_params.setdefault(component_name, {})
+            for (name, value), param_success in zip(
+                params.items(), response.success, strict=False
+            ):
+                if param_success:
+                    last_params[name] = value
+            if success:
+                # The sent parameters give a new baseline of the running config
+                self._components_params_invalidated.discard(component_name)
+        if not success:
+            self.get_logger().error(
+                f"Configuration request to '{component_name}' failed: {getattr(response, 'error_msg', '')}"
+            )
+        self._finish_batch_request(batch, component_name, success)
+
+    def _on_batch_timeout(
+        self, batch: "_RequestsBatch", component_name: str, timeout: float
+    ) -> None:
+        """Configuration request timeout callback
+
+        :param batch: Requests batch
+        :type batch: _RequestsBatch
+        :param component_name: Component name
+        :type component_name: str
+        :param timeout: Request timeout (seconds)
+        :type timeout: float
+        """
+        self.get_logger().error(
+            f"No response to the configuration request from '{component_name}' after {timeout} seconds"
+        )
+        self._finish_batch_request(batch, component_name, False)
+
+    def _finish_batch_request(
+        self, batch: "_RequestsBatch", component_name: str, success: bool
+    ) -> None:
+        """Registers the result of a configuration request in its batch and executes the batch done callback when all the results are gathered
+
+        :param batch: Requests batch
+        :type batch: _RequestsBatch
+        :param component_name: Component name
+        :type component_name: str
+        :param success: Request result
+        :type success: bool
+        """
+        timer = batch.timers.pop(component_name, None)
+        if timer:
+            self.destroy_timer(timer)
+        if not batch.set_result(component_name, success):
+            return
+        self.get_logger().debug(f"Configuration requests results: {batch.results}")
+        if batch.done_callback:
+            batch.done_callback(batch.results)
+
+    def _send_srv_request_async(
+        self, srv_client: base_clients.ServiceClientHandler, srv_request: Any
+    ) -> None:
+        """Sends a service request without blocking the Monitor, the response is checked on reception. Requests to several components are in flight at the same time
+
+        :param srv_client: Service client handler
+        :type srv_client: base_clients.ServiceClientHandler
+        :param srv_request: Service request message
+        :type srv_request: Any
+        """
+        srv_client.send_request_async(
+            srv_request,
+            done_callback=partial(
+                self._on_srv_response, srv_name=srv_client.config.name
+            ),
+        )
+
+    def _on_srv_response(self, future: Future, srv_name: str) -> None:
+        """Service response callback: logs failed requests
+
+        :param future: Request future
+        :type future: Future
+        :param srv_name: Service name
+        :type srv_name: str
+        """
+        response = future.result()
+        success = getattr(response, "success", True)
+        if isinstance(success, (list, tuple)):
+            success = all(success)
+        if response is None or not success:
+            self.get_logger().error(f"Request to service '{srv_name}' failed")
+            return
+        self.get_logger().debug(f"Got response from service '{srv_name}'")
 
     def __get_srv_client(
         self, srv_name: str, srv_type: type
@@ -349,10 +941,12 @@ class Monitor(BaseNode):
                 and main_srv_client.config.srv_type == srv_type
             ):
                 return main_srv_client
-        # If no return -> service client does not exist -> create it
-        return base_clients.ServiceClientHandler(
-            client_node=self, srv_name=srv_name, srv_type=srv_type
-        )
+        # If no return -> service client does not exist -> create it and keep it for the next requests
+        if (srv_name, srv_type) not in self._srv_clients:
+            self._srv_clients[(srv_name, srv_type)] = base_clients.ServiceClientHandler(
+                client_node=self, srv_name=srv_name, srv_type=srv_type
+            )
+        return self._srv_clients[(srv_name, srv_type)]
 
     def __get_action_client(
         self, action_name: str, action_type: type
@@ -374,10 +968,14 @@ class Monitor(BaseNode):
                 and main_action_client.config.action_type == action_type
             ):
                 return main_action_client
-        # If no return -> service client does not exist -> create it
-        return base_clients.ActionClientHandler(
-            client_node=self, action_name=action_name, action_type=action_type
-        )
+        # If no return -> action client does not exist -> create it and keep it for the next requests
+        if (action_name, action_type) not in self._action_clients:
+            self._action_clients[(action_name, action_type)] = (
+                base_clients.ActionClientHandler(
+                    client_node=self, action_name=action_name, action_type=action_type
+                )
+            )
+        return self._action_clients[(action_name, action_type)]
 
     def send_srv_request(
         self, srv_name: str, srv_type: type, srv_request_msg: Any, **_
@@ -392,7 +990,7 @@ class Monitor(BaseNode):
         :type srv_request_msg: Any
         """
         srv_client = self.__get_srv_client(srv_name, srv_type)
-        srv_client.send_request(srv_request_msg, executor=self.executor)
+        self._send_srv_request_async(srv_client, srv_request_msg)
 
     def send_action_goal(
         self, action_name: str, action_type: type, action_request_msg: Any, **_
@@ -407,7 +1005,35 @@ class Monitor(BaseNode):
         :type action_request_msg: Any
         """
         action_client = self.__get_action_client(action_name, action_type)
-        action_client.send_request(action_request_msg)
+        action_client.reset()
+        action_client.send_request_async(
+            action_request_msg,
+            done_callback=partial(
+                self._on_action_goal_response, action_client=action_client
+            ),
+        )
+
+    def _on_action_goal_response(
+        self, future: Future, action_client: base_clients.ActionClientHandler
+    ) -> None:
+        """Action goal response callback: updates the action client handler goal status and logs rejected goals
+
+        :param future: Goal future
+        :type future: Future
+        :param action_client: Action client handler
+        :type action_client: base_clients.ActionClientHandler
+        """
+        goal_handle = future.result()
+        if goal_handle is None:
+            self.get_logger().error(
+                f"Goal to action '{action_client.config.name}' was not sent"
+            )
+            return
+        action_client.action_response_callback(future)
+        if action_client.goal_rejcted:
+            self.get_logger().error(
+                f"Goal rejected by action server '{action_client.config.name}'"
+            )
 
     def publish_message(
         self,
@@ -417,7 +1043,7 @@ class Monitor(BaseNode):
         publish_period: Optional[float] = None,
         **_,
     ) -> None:
-        """Action to publish a message to a given topic
+        """Action to publish a message to a given topic. Publishers are cached and reused by repeated actions on the same topic, and a new publishing rate timer on a topic replaces the previous one
 
         :param topic: Published topic
         :type topic: Topic
@@ -428,57 +1054,93 @@ class Monitor(BaseNode):
         :param publish_period: Publishing period, if none and rate is given the message is published forever, defaults to None
         :type publish_period: Optional[float], optional
         """
-        publisher: Publisher = self.create_publisher(
-            msg_type=topic.ros_msg_type,
-            topic=topic.name,
-            qos_profile=self.setup_qos(topic.qos_profile),
-        )
+        key, publisher = self._get_cached_publisher(topic)
         # Publish once
         if not publish_rate:
             publisher.publish(msg)
-            self.destroy_publisher(publisher)
-        elif not publish_period:
-            # Publish forever
-            self.create_timer(
-                timer_period_sec=1 / publish_rate,
-                callback=partial(publisher.publish, msg),
-            )
-        else:
-            # Publish with rate for given period
-            max_time: float = self.get_secs_time() + publish_period
-            timer_name: str = f"timer_{topic.name}_"
-            callback = partial(
-                self._timer_publish_msg_loop,
-                timer_name=timer_name,
-                max_time=max_time,
-                publisher=publisher,
-                msg=msg,
-            )
-            setattr(
-                self,
-                timer_name,
-                self.create_timer(timer_period_sec=1 / publish_rate, callback=callback),
-            )
+            return
 
-    def _timer_publish_msg_loop(
-        self, timer_name: str, max_time: float, publisher: Publisher, msg: Any
-    ) -> None:
-        """Timer callback to publish a message until max_time is reached then destroy the timer
+        # Publish with rate for given period, or forever if no period is given
+        max_time: Optional[float] = (
+            self.get_secs_time() + publish_period if publish_period else None
+        )
+        timer_period = 1 / publish_rate
+        with self.__publishers_lock:
+            timer = self._publish_timers.get(key, (None, None, None))[0]
+            if timer and timer.timer_period_ns != int(timer_period * 1e9):
+                self.destroy_timer(timer)
+                timer = None
+            if not timer:
+                timer = self.create_timer(
+                    timer_period_sec=timer_period,
+                    callback=partial(self._timer_publish_msg_loop, key=key),
+                )
+            # Reuse the topic timer with the new message
+            self._publish_timers[key] = (timer, msg, max_time)
 
-        :param max_time: _description_
-        :type max_time: float
-        :param publisher: _description_
-        :type publisher: Publisher
-        :param msg: _description_
-        :type msg: Any
+    def _get_cached_publisher(self, topic: Topic) -> Tuple[Tuple, Publisher]:
+        """Get the cached publisher of a topic or create it
+
+        :param topic: Published topic
+        :type topic: Topic
+
+        :return: Publisher key (topic name, msg type, QoS), publisher
+        :rtype: Tuple[Tuple, Publisher]
         """
-        time_now: float = self.get_secs_time()
-        if time_now > max_time:
-            self.destroy_timer(getattr(self, timer_name))
-            self.destroy_publisher(publisher)
-            return
+        qos_profile = topic.qos_profile
+        key = (
+            topic.name,
+            topic.ros_msg_type,
+            (
+                qos_profile.history,
+                qos_profile.queue_size,
+                qos_profile.reliability,
+                qos_profile.durability,
+            ),
+        )
+        with self.__publishers_lock:
+            publisher = self._publishers.get(key)
+            if not publisher:
+                publisher = self.create_publisher(
+                    msg_type=topic.ros_msg_type,
+                    topic=topic.name,
+                    qos_profile=self.setup_qos(qos_profile),
+                )
+                self._publishers[key] = publisher
+            self._publishers_last_used[key] = time.monotonic()
+        return key, publisher
+
+    def _timer_publish_msg_loop(self, key: Tuple) -> None:
+        """Timer callback to publish a message until its end time is reached then destroy the timer
+
+        :param key: Publisher key (topic name, msg type, QoS)
+        :type key: Tuple
+        """
+        with self.__publishers_lock:
+            if key not in self._publish_timers:
+                return
+            timer, msg, max_time = self._publish_timers[key]
+            if max_time is not None and self.get_secs_time() > max_time:
+                self.destroy_timer(timer)
+                del self._publish_timers[key]
+                return
+            publisher = self._publishers[key]
+            self._publishers_last_used[key] = time.monotonic()
         publisher.publish(msg)
 
+    def _evict_idle_publishers(self) -> None:
+        """Timer callback to destroy the cached publishers unused for more than the idle timeout"""
+        now = time.monotonic()
+        with self.__publishers_lock:
+            for key, last_used in list(self._publishers_last_used.items()):
+                if (
+                    key in self._publish_timers
+                    or now - last_used < self._publishers_idle_timeout
+                ):
+                    continue
+                self.destroy_publisher(self._publishers.pop(key))
+                del self._publishers_last_used[key]
+
     def _activate_event_monitoring(self) -> None:
         """
         Turn on all events
@@ -498,6 +1160,7 @@ class Monitor(BaseNode):
                     qos_profile=self.setup_qos(event.event_topic.qos_profile),
                     callback_group=MutuallyExclusiveCallbackGroup(),
                 )
+                event.activate()
         if self._internal_events:
             # Turn on monitoring for internal events (to emit back to launcher)
             for event in self._internal_events:
@@ -508,14 +1171,18 @@ class Monitor(BaseNode):
                     qos_profile=self.setup_qos(event.event_topic.qos_profile),
                     callback_group=MutuallyExclusiveCallbackGroup(),
                 )
+                event.activate()
 
-    def _create_status_subscribers(self) -> None:
+    def _create_status_subscribers(self, components_names: List[str]) -> None:
         """
-        Creates subscribers to all the health status topics of the components
+        Creates subscribers to the health status topics of the components. The components also announce themselves on their status topic (transient local) to be activated on start
+
+        :param components_names: Components names
+        :type components_names: List[str]
         """
         # Reentrant group for multi threaded monitoring
         callback_group = ReentrantCallbackGroup()
-        for component_name in self._components_to_monitor:
+        for component_name in components_names:
             logger.debug(f"Creating health status subscriber for: {component_name}")
             self.create_subscription(
                 ComponentStatus,
@@ -523,7 +1190,7 @@ class Monitor(BaseNode):
                 callback=partial(
                     self._status_check_callback, component_name=component_name
                 ),
-                qos_profile=10,
+                qos_profile=STATUS_QOS,
                 callback_group=callback_group,
             )
 
@@ -536,17 +1203,185 @@ class Monitor(BaseNode):
         :param component: Node under check
         :type component: Component
         """
-        # TODO: handle status
+        self._components_last_seen[component_name] = time.monotonic()
+        self._update_heartbeat_timeout(component_name, msg.heartbeat_rate)
+        self._set_component_status(component_name, Status(msg))
+        if component_name in self._stale_components:
+            # The component may have been restarted
+            self._invalidate_component_params(component_name)
+            self._stale_components.discard(component_name)
+            self.get_logger().info(
+                f"Health status heartbeat of '{component_name}' is restored"
+            )
         self.get_logger().debug(f"Form {component_name} got status {msg}")
+        if component_name in self.__components_pending_activation:
+            self._activate_component(component_name)
+
+    def _set_component_status(self, component_name: str, status: Status) -> None:
+        """
+        Update the health table with a new status of a component and record the status transition
+
+        :param component_name: Component name
+        :type component_name: str
+        :param status: New health status
+        :type status: Status
+        """
+        old_status = self._components_status.get(component_name)
+        self._components_status[component_name] = status
+        if old_status and old_status.value == status.value:
+            return
+        # The component config can be reset by a failure, a restart or a transition
+        self._invalidate_component_params(component_name)
+        transitions = self._components_transitions.get(component_name)
+        if transitions is None:
+            transitions = deque(maxlen=self._health_history_size)
+            self._components_transitions[component_name] = transitions
+        transitions.append((
+            time.monotonic(),
+            old_status.value if old_status else -1,
+            status.value,
+        ))
+
+    def _publish_system_status(self) -> None:
+        """
+        Publishes the aggregated health status of all the monitored components
+        """
+        now = time.monotonic()
+        statuses = []
+        for component_name in self._components_to_monitor:
+            status = self._components_status.get(component_name)
+            if not status:
+                statuses.append(
+                    DiagnosticStatus(
+                        level=DiagnosticStatus.STALE,
+                        name=component_name,
+                        message="No status received",
+                    )
+                )
+                continue
+            last_seen = self._components_last_seen.get(component_name)
+            if component_name in self._stale_components:
+                level = DiagnosticStatus.STALE
+            else:
+                level = (
+                    DiagnosticStatus.OK if status.is_healthy else DiagnosticStatus.ERROR
+                )
+            status_msg = status()
+            statuses.append(
+                DiagnosticStatus(
+                    level=level,
+                    name=component_name,
+                    message=status_msg.msg,
+                    values=[
+                        KeyValue(key="status", value=str(status.value)),
+                        KeyValue(
+                            key="last_seen_age",
+                            value=f"{now - last_seen:.3f}"
+                            if last_seen is not None
+                            else "",
+                        ),
+                        KeyValue(
+                            key="transitions",
+                            value=str(
+                                len(
+                                    self._components_transitions.get(component_name, [])
+                                )
+                            ),
+                        ),
+                        KeyValue(
+                            key="src_algorithms",
+                            value=",".join(status_msg.src_algorithms),
+                        ),
+                        KeyValue(
+                            key="src_components",
+                            value=",".join(status_msg.src_components),
+                        ),
+                        KeyValue(
+                            key="src_topics", value=",".join(status_msg.src_topics)
+                        ),
+                    ],
+                )
+            )
+        failed = [
+            status.name for status in statuses if status.level != DiagnosticStatus.OK
+        ]
+        system_status = DiagnosticStatus(
+            level=max(
+                [DiagnosticStatus.OK]
+                + [
+                    DiagnosticStatus.ERROR
+                    if status.level == DiagnosticStatus.STALE
+                    else status.level
+                    for status in statuses
+                ]
+            ),
+            name="system",
+            message=f"Not healthy: {', '.join(failed)}" if failed else "OK",
+        )
+        msg = DiagnosticArray(status=[system_status] + statuses)
+        msg.header.stamp = self.get_clock().now().to_msg()
+        self._system_status_publisher.publish(msg)
+
+    def _update_heartbeat_timeout(self, component_name: str, rate: float) -> None:
+        """
+        Updates the heartbeat timeout of a component from the heartbeat rate received in its status. Heartbeat check is paused for components without a heartbeat (not active)
+
+        :param component_name: Component name
+        :type component_name: str
+        :param rate: Component heartbeat rate (Hz), zero if the component is not publishing a heartbeat
+        :type rate: float
+        """
+        if rate <= 0.0:
+            self._components_heartbeat_timeout.pop(component_name, None)
+            return
+        timeout = self._missed_heartbeats_tolerance / rate
+        if self._components_heartbeat_timeout.get(component_name) == timeout:
+            return
+        self._components_heartbeat_timeout[component_name] = timeout
+        # Check the heartbeats at twice the rate of the smallest timeout
+        check_period = min(self._components_heartbeat_timeout.values()) / 2
+        if not self.__heartbeat_check_timer:
+            self.__heartbeat_check_timer = self.create_timer(
+                timer_period_sec=check_period,
+                callback=self._check_components_heartbeat,
+                callback_group=MutuallyExclusiveCallbackGroup(),
+            )
+        else:
+            self.__heartbeat_check_timer.timer_period_ns = int(check_period * 1e9)
+
+    def _check_components_heartbeat(self):
+        """
+        Timer callback to detect the components with a missing health status heartbeat and register them as failed
+        """
+        now = time.monotonic()
+        for component_name, timeout in list(self._components_heartbeat_timeout.items()):
+            last_seen = self._components_last_seen.get(component_name)
+            # Components are monitored after receiving their first status
+            if (
+                last_seen is None
+                or component_name in self._stale_components
+                or now - last_seen < timeout
+            ):
+                continue
+            self._stale_components.add(component_name)
+            status = Status()
+            status.set_fail_component(component_names=[component_name])
+            self._set_component_status(component_name, status)
+            self.get_logger().error(
+                f"No health status received from '{component_name}' for {now - last_seen:.2f} seconds -> Component is considered failed"
+            )
 
     def create_all_subscribers(self) -> None:
         """
         Create health status subscribers and events subscribers
         """
+        status_components = set(self.__components_pending_activation)
         if self._components_to_monitor and self._enable_health_monitoring:
-            self._create_status_subscribers()
+            status_components.update(self._components_to_monitor)
             for component_name in self._components_to_monitor:
                 self._turn_on_component_management(component_name)
+        if status_components:
+            self._create_status_subscribers(list(status_components))
 
         self._activate_event_monitoring()
 
@@ -581,3 +1416,45 @@ class Monitor(BaseNode):
                     action_name=component.main_action_name,
                 )
             )
+
+
+class _RequestsBatch:
+    """
+    Results of a batch of configuration requests sent concurrently to a set of components
+    """
+
+    def __init__(
+        self,
+        components_names: List[str],
+        done_callback: Optional[Callable[[Dict[str, bool]], Any]] = None,
+    ) -> None:
+        """Init the batch
+
+        :param components_names: Names of the components receiving a request
+        :type components_names: List[str]
+        :param done_callback: Method executed with the results when all the components responded or timed out, defaults to None
+        :type done_callback: Optional[Callable[[Dict[str, bool]], Any]], optional
+        """
+        self.results: Dict[str, bool] = {}
+        self.timers: Dict[str, Timer] = {}
+        self.done_callback = done_callback
+        self._pending: Set[str] = set(components_names)
+        self._lock = threading.Lock()
+
+    def set_result(self, component_name: str, success: bool) -> bool:
+        """Set the result of a component request (only the first result is kept)
+
+        :param component_name: Component name
+        :type component_name: str
+        :param success: Request result
+        :type success: bool
+
+        :return: If this result completes the batch
+        :rtype: bool
+        """
+        with self._lock:
+            if component_name not in self._pending:
+                return False
+            self._pending.discard(component_name)
+            self.results[component_name] = success
+            return not self._pending
@@ -5,10 +5,9 @@ from builtin_interfaces.msg import Time
 from rclpy import callback_groups
 from rclpy.client import Client
 from rclpy.node import Node
-from tf2_ros.transform_listener import TransformListener
 
 from ..config import BaseConfig, QoSConfig
-from ..tf import TFListener, TFListenerConfig
+from ..tf import MultiTFListener, MultiTFListenerConfig, TFListener, TFListenerConfig
 
 
 class BaseNode(Node):
@@ -51,6 +50,9 @@ class BaseNode(Node):
         # List to keep all node clients
         self.clients_list = []
 
+        # List to keep all node transform listeners
+        self._tf_listeners: List[Union[TFListener, MultiTFListener]] = []
+
         # Start Node
         if start_on_init:
             Node.__init__(self, node_name, *args, **kwargs)
@@ -262,23 +264,54 @@ class BaseNode(Node):
 
     def create_tf_listener(self, tf_config: TFListenerConfig) -> TFListener:
         """
-        Creates a new transform listener to lookup a transform with given config and return the transform lookup handler
+        Creates a new transform listener to lookup a transform with given config and return the transform lookup handler. All the transform listeners of the process share one TF buffer and listener created on the first component node
 
         :param tf_config: Transform listener config
         :type tf_config: TFListenerConfig
 
         :return: Transform lookup handler object
-        :rtype: TransformListener
+        :rtype: TFListener
         """
-        tf_handler = TFListener(tf_config=tf_config, node_name=self.node_name)
-        transform_listener = TransformListener(buffer=tf_handler.tf_buffer, node=self)
-        tf_handler.set_listener(transform_listener)
+        tf_handler = TFListener(
+            tf_config=tf_config, node_name=self.node_name, shared=True, node=self
+        )
+        self._tf_listeners.append(tf_handler)
         transform_timer = self.create_timer(
             1 / tf_config.lookup_rate, tf_handler.timer_callback
         )  # timer to lookup the transform with given rate
         tf_handler.timer = transform_timer
         return tf_handler
 
+    def create_multi_tf_listener(
+        self, tf_config: MultiTFListenerConfig
+    ) -> MultiTFListener:
+        """
+        Creates a new transform listener to lookup multiple transforms (frame pairs) with given config and return the transforms lookup handler
+
+        :param tf_config: Multiple transforms listener config
+        :type tf_config: MultiTFListenerConfig
+
+        :return: Transforms lookup handler object
+        :rtype: MultiTFListener
+        """
+        tf_handler = MultiTFListener(
+            tf_config=tf_config, node_name=self.node_name, shared=True, node=self
+        )
+        self._tf_listeners.append(tf_handler)
+        tf_handler.timer = self.create_timer(
+            1 / tf_config.lookup_rate, tf_handler.timer_callback
+        )  # timer to lookup the transforms with given rate
+        return tf_handler
+
+    def destroy_node(self):
+        """
+        Overwrites the Node destroy method to release the node transform listeners
+        """
+        for tf_handler in getattr(self, "_tf_listeners", []):
+            tf_handler.release()
+        self._tf_listeners = []
+        super().destroy_node()
+
     def create_client(self, *args, **kwargs) -> Client:
         """
         Overwrites the Node create client method to add to the clients list
@@ -0,0 +1,197 @@
+"""Execution Loop Profiling"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+class LoopProfiler:
+    """
+    Low overhead profiler for the component timed execution loop.
+
+    Records fixed-bucket histograms of the step durations, the loop jitter with respect to the loop period, the number of overruns (step longer than the period) and the timing of each phase of the loop (extra execution loop, main execution step).
+    """
+
+    # Upper bounds of the step duration histogram buckets (seconds), the last bucket collects all longer steps
+    BUCKETS: Tuple[float, ...] = (
+        1e-4,
+        2.5e-4,
+        5e-4,
+        1e-3,
+        2.5e-3,
+        5e-3,
+        1e-2,
+        2.5e-2,
+        5e-2,
+        1e-1,
+        2.5e-1,
+        5e-1,
+        1.0,
+    )
+
+    PHASES: Tuple[str, ...] = ("extra_loop", "step")
+
+    def __init__(self, period: float) -> None:
+        """Init the profiler
+
+        :param period: Execution loop period (seconds)
+        :type period: float
+        """
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all the recorded statistics"""
+        self.steps: int = 0
+        self.overruns: int = 0
+        self.histogram: List[int] = [0] * (len(self.BUCKETS) + 1)
+        self.total_duration: float = 0.0
+        self.max_duration: float = 0.0
+        self.total_jitter: float = 0.0
+        self.max_jitter: float = 0.0
+        self.phases_total: List[float] = [0.0] * len(self.PHASES)
+        self.phases_max: List[float] = [0.0] * len(self.PHASES)
+        self._last_start: Optional[float] = None
+
+    def record(self, start: float, extra_loop_end: float, step_end: float) -> None:
+        """Record one execution loop using the time stamps of the end of each phase
+
+        :param start: Loop start time (seconds)
+        :type start: float
+        :param extra_loop_end: Extra execution loop end time (seconds)
+        :type extra_loop_end: float
+        :param step_end: Main execution step end time (seconds)
+        :type step_end: float
+        """
+        duration = step_end - start
+        self.steps += 1
+        self.histogram[bisect_left(self.BUCKETS, duration)] += 1
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        if duration > self.period:
+            self.overruns += 1
+
+        if self._last_start is not None:
+            jitter = abs(start - self._last_start - self.period)
+            self.total_jitter += jitter
+            if jitter > self.max_jitter:
+                self.max_jitter = jitter
+        self._last_start = start
+
+        for idx, phase_duration in enumerate((
+            extra_loop_end - start,
+            step_end - extra_loop_end,
+        )):
+            self.phases_total[idx] += phase_duration
+            if phase_duration > self.phases_max[idx]:
+                self.phases_max[idx] = phase_duration
+
+    @property
+    def stats(self) -> Dict:
+        """Recorded statistics
+
+        :return: Steps count, overruns count, mean/max step duration, mean/max jitter, mean/max duration per phase and the step duration histogram {bucket_upper_bound: count} (durations in seconds)
+        :rtype: Dict
+        """
+        steps = max(self.steps, 1)
+        return {
+            "period": self.period,
+            "steps": self.steps,
+            "overruns": self.overruns,
+            "mean_duration": self.total_duration / steps,
+            "max_duration": self.max_duration,
+            "mean_jitter": self.total_jitter / max(self.steps - 1, 1),
+            "max_jitter": self.max_jitter,
+            "phases": {
+                phase: {
+                    "mean_duration": self.phases_total[idx] / steps,
+                    "max_duration": self.phases_max[idx],
+                }
+                for idx, phase in enumerate(self.PHASES)
+            },
+            "histogram": dict(
+                zip([*self.BUCKETS, float("inf")], self.histogram, strict=True)
+            ),
+        }
+
+
+class LoopRateController:
+    """
+    Adapts the execution loop rate between a minimum and a maximum rate.
+
+    The controller tracks an exponential moving average of the step duration. The rate is decreased when the steps overrun the loop period and is recovered towards the maximum rate when the steps leave enough headroom in the period.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        backoff_factor: float = 0.8,
+        recovery_factor: float = 1.1,
+        headroom: float = 0.5,
+        smoothing: float = 0.1,
+        min_steps: int = 10,
+    ) -> None:
+        """Init the controller
+
+        :param rate: Initial loop rate (Hz)
+        :type rate: float
+        :param min_rate: Minimum loop rate (Hz)
+        :type min_rate: float
+        :param max_rate: Maximum loop rate (Hz)
+        :type max_rate: float
+        :param backoff_factor: Rate multiplier on overrun, defaults to 0.8
+        :type backoff_factor: float, optional
+        :param recovery_factor: Rate multiplier on headroom, defaults to 1.1
+        :type recovery_factor: float, optional
+        :param headroom: Fraction of the loop period under which the step duration is considered to have enough headroom, defaults to 0.5
+        :type headroom: float, optional
+        :param smoothing: Step duration moving average smoothing factor, defaults to 0.1
+        :type smoothing: float, optional
+        :param min_steps: Minimum number of steps between two rate changes, defaults to 10
+        :type min_steps: int, optional
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self._backoff_factor = backoff_factor
+        self._recovery_factor = recovery_factor
+        self._headroom = headroom
+        self._smoothing = smoothing
+        self._min_steps = min_steps
+        self._mean_duration: Optional[float] = None
+        self._steps_since_change: int = 0
+
+    def update(self, step_duration: float) -> Optional[float]:
+        """Update the controller with a new step duration
+
+        :param step_duration: Step duration (seconds)
+        :type step_duration: float
+
+        :return: New loop rate (Hz) if the rate is changed, else None
+        :rtype: Optional[float]
+        """
+        if self._mean_duration is None:
+            self._mean_duration = step_duration
+        else:
+            self._mean_duration += self._smoothing * (
+                step_duration - self._mean_duration
+            )
+        self._steps_since_change += 1
+        if self._steps_since_change < self._min_steps:
+            return None
+
+        period = 1 / self.rate
+        if self._mean_duration > period and self.rate > self.min_rate:
+            new_rate = max(self.rate * self._backoff_factor, self.min_rate)
+        elif (
+            self._mean_duration < self._headroom * period and self.rate < self.max_rate
+        ):
+            new_rate = min(self.rate * self._recovery_factor, self.max_rate)
+        else:
+            return None
+
+        self.rate = new_rate
+        self._steps_since_change = 0
+        return new_rate
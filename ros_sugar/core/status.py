@@ -1,8 +1,16 @@
 """Component Status"""
 
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from automatika_ros_sugar.msg import ComponentStatus
+from rclpy.qos import DurabilityPolicy, QoSProfile, ReliabilityPolicy
+
+# Health status topics QoS: the last status is kept for late subscribers (components announce themselves on init)
+STATUS_QOS = QoSProfile(
+    depth=1,
+    reliability=ReliabilityPolicy.RELIABLE,
+    durability=DurabilityPolicy.TRANSIENT_LOCAL,
+)
 
 _component_status = {
     0: "Running - Healthy",
@@ -50,14 +58,12 @@ class Status:
         self.health_status.set_fail_system(topic_names=['some_topic_name'])
         ```
 
-    NOTE: TIMED components publish the status periodically (if broadcasting is enabled). If the component is not TIMED, then the child component should implement the publishing, using:
-    ```python
-        self.health_status_publisher.publish(self.health_status)
-    ```
+    NOTE: When broadcasting is enabled, the component publishes the status immediately on every change, and re-publishes the unchanged status periodically as a heartbeat (see 'status_heartbeat_rate' in the component config).
 
     """
 
     def __init__(self, msg: Optional[ComponentStatus] = None) -> None:
+        self._on_change: Optional[Callable[[], None]] = None
         if msg:
             self._msg = msg
         else:
@@ -65,6 +71,22 @@ class Status:
             self._msg = ComponentStatus()
             self.set_healthy()
 
+    def register_on_change(self, method: Optional[Callable[[], None]]) -> None:
+        """
+        Register a method to be executed every time the status message changes (used to publish the status on change)
+
+        :param method: Method without arguments, None to remove the registered method
+        :type method: Optional[Callable[[], None]]
+        """
+        self._on_change = method
+
+    def _changed(self) -> None:
+        """
+        Executes the registered on change method
+        """
+        if self._on_change:
+            self._on_change()
+
     def __call__(self) -> ComponentStatus:
         """
         Returns the ROS message for publishing
@@ -107,15 +129,61 @@ class Status:
                 f"Can only set using integer values in the following: {_component_status}"
             )
 
-    def _set_status_from_dict(self, key: int):
+    @property
+    def loop_rate(self) -> float:
+        """
+        Effective execution loop rate of the component
+
+        :return: Loop rate (Hz)
+        :rtype: float
+        """
+        return self._msg.loop_rate
+
+    @loop_rate.setter
+    def loop_rate(self, value: float):
+        """
+        Set the effective execution loop rate of the component
+
+        :param value: Loop rate (Hz)
+        :type value: float
+        """
+        if self._msg.loop_rate != float(value):
+            self._msg.loop_rate = float(value)
+            self._changed()
+
+    def _set_status_from_dict(
+        self,
+        key: int,
+        src_algorithms: Optional[List[str]] = None,
+        src_components: Optional[List[str]] = None,
+        src_topics: Optional[List[str]] = None,
+    ):
         """
-        Set StatusMsg from given key
+        Set StatusMsg from given key and failure sources, executes the on change method if the message is changed
 
         :param key: Status key value
         :type key: int
+        :param src_algorithms: Failure source algorithms, defaults to None
+        :type src_algorithms: Optional[List[str]], optional
+        :param src_components: Failure source components, defaults to None
+        :type src_components: Optional[List[str]], optional
+        :param src_topics: Failure source topics, defaults to None
+        :type src_topics: Optional[List[str]], optional
         """
+        changed = self._msg.status != key
         self._msg.status = key
         self._msg.msg = _component_status[key]
+        if src_algorithms and list(self._msg.src_algorithms) != src_algorithms:
+            self._msg.src_algorithms = src_algorithms
+            changed = True
+        if src_components and list(self._msg.src_components) != src_components:
+            self._msg.src_components = src_components
+            changed = True
+        if src_topics and list(self._msg.src_topics) != src_topics:
+            self._msg.src_topics = src_topics
+            changed = True
+        if changed:
+            self._changed()
 
     def set_healthy(self):
         """
@@ -133,17 +201,13 @@ class Status:
         """
         Set status to Error: Algorithmic Level
         """
-        self._set_status_from_dict(key=1)
-        if algorithm_names:
-            self._msg.src_algorithms = algorithm_names
+        self._set_status_from_dict(key=1, src_algorithms=algorithm_names)
 
     def set_fail_component(self, component_names: Optional[List[str]] = None):
         """
         Set status to Error: Component Level
         """
-        self._set_status_from_dict(key=2)
-        if component_names:
-            self._msg.src_components = component_names
+        self._set_status_from_dict(key=2, src_components=component_names)
 
     def set_fail_system(
         self,
@@ -153,11 +217,9 @@ class Status:
         """
         Set status to Error: System Level
         """
-        self._set_status_from_dict(key=3)
-        if component_names:
-            self._msg.src_components = component_names
-        if topic_names:
-            self._msg.src_topics = topic_names
+        self._set_status_from_dict(
+            key=3, src_components=component_names, src_topics=topic_names
+        )
 
     @property
     def is_healthy(self) -> bool:
@@ -2,31 +2,39 @@
 
 from typing import Union, Dict, Optional, List, Any
 import json
-from copy import deepcopy
+import msgpack
+import numpy as np
 from .io.topic import Topic
-from .core.event import Event
+from .io.utils import patch_msgpack_numpy
+from .core.event import Event, Deadline, deadline_scheduler
 
 
-def json_to_events_list(
-    json_obj: Union[str, bytes, bytearray],
+def dicts_to_events_list(
+    list_obj: List[Union[Dict, str]],
     topic_template: Optional[Topic] = None,
 ) -> List:
     """
-    Loads a list of events from a JSON object
+    Loads a list of events from a list of serialized events dictionaries
 
-    :param json_obj: JSON object containing a set of events
-    :type json_obj: str | bytes | bytearray
+    :param list_obj: Events dictionaries (or events JSON strings)
+    :type list_obj: List[Union[Dict, str]]
+    :param topic_template: Template for the events topics, defaults to None
+    :type topic_template: Optional[Topic], optional
 
-    :raises ValueError: If the provided json object cannot be converted to an events list
+    :raises ValueError: If an item cannot be converted to an event
 
     :return: Events list
     :rtype: List[Event]
     """
-    list_obj = json.loads(json_obj)
+    events_classes = {event.__name__: event for event in available_events}
     events_list = []
     for event_serialized in list_obj:
+        event_as_dict = (
+            json.loads(event_serialized)
+            if isinstance(event_serialized, (str, bytes, bytearray))
+            else event_serialized
+        )
         # Check if the serialized event contains a class name
-        event_as_dict = json.loads(event_serialized)
         if "event_class" not in event_as_dict.keys():
             raise ValueError(
                 "Cannot convert json object to Events Dictionary. Json item is not a valid serialized Event"
@@ -34,30 +42,67 @@ def json_to_events_list(
 
         # Get and check event class
         event_class_name: str = event_as_dict["event_class"]
-        events_classes = [event.__name__ for event in available_events]
-        if event_class_name not in events_classes:
+        event_class = events_classes.get(event_class_name)
+        if not event_class:
             raise ValueError(
                 f"Cannot convert json object to Events Dictionary. Unknown event class '{event_class_name}'"
             )
 
-        for event in available_events:
-            if event.__name__ == event_class_name:
-                # Construct new event
-                new_event = event(
-                    event_as_dict["event_name"],
-                    event_as_dict,
-                    event_as_dict["trigger_ref_value"],
-                    nested_attributes=[],
-                    topic_template=topic_template,
-                )
-                # Add to events dictionary
-                events_list.append(deepcopy(new_event))
+        # Construct new event (each event gets a new topic from the template)
+        events_list.append(
+            event_class(
+                event_as_dict["event_name"],
+                event_as_dict,
+                event_as_dict["trigger_ref_value"],
+                nested_attributes=[],
+                topic_template=topic_template,
+            )
+        )
 
     return events_list
 
 
+def json_to_events_list(
+    json_obj: Union[str, bytes, bytearray],
+    topic_template: Optional[Topic] = None,
+) -> List:
+    """
+    Loads a list of events from a JSON object
+
+    :param json_obj: JSON object containing a set of events
+    :type json_obj: str | bytes | bytearray
+
+    :raises ValueError: If the provided json object cannot be converted to an events list
+
+    :return: Events list
+    :rtype: List[Event]
+    """
+    return dicts_to_events_list(json.loads(json_obj), topic_template)
+
+
+def msgpack_to_events_list(
+    msgpack_obj: bytes,
+    topic_template: Optional[Topic] = None,
+) -> List:
+    """
+    Loads a list of events from a msgpack object
+
+    :param msgpack_obj: Msgpack object containing a set of events
+    :type msgpack_obj: bytes
+
+    :raises ValueError: If the provided msgpack object cannot be converted to an events list
+
+    :return: Events list
+    :rtype: List[Event]
+    """
+    patch_msgpack_numpy()
+    return dicts_to_events_list(msgpack.unpackb(msgpack_obj), topic_template)
+
+
 class OnAny(Event):
-    def __init__(self, event_name: str, event_source: Union[Topic, str, Dict]) -> None:
+    def __init__(
+        self, event_name: str, event_source: Union[Topic, str, Dict], **kwargs
+    ) -> None:
         """__init__.
 
         :param event_name:
@@ -66,9 +111,15 @@ class OnAny(Event):
         :type event_source: Union[Topic, str, Dict]
         :param attrs: Tuple of attributes to access in the topic message
         :rtype: None
+
+        :raises ValueError: If a hysteresis is provided (the event condition is never released)
         """
         # passing trigger_value as zero as it will not be used in this event
-        super().__init__(event_name, event_source, None, [])
+        super().__init__(event_name, event_source, None, [], **kwargs)
+        if self._hysteresis:
+            raise ValueError(
+                f"Cannot create event '{event_name}' with a hysteresis: OnAny condition holds on every message"
+            )
 
     def callback(self, msg: Any) -> None:
         """
@@ -80,12 +131,10 @@ class OnAny(Event):
         self._event_value = msg
 
         self.trigger = True
+        self._filter_trigger()
 
         # Process event on any incoming message
-        if not self.under_processing:
-            self.under_processing = True
-            self._call_on_trigger(msg=msg)
-            self.under_processing = False
+        self._process_trigger(msg=msg)
 
 
 class OnChange(Event):
@@ -239,9 +288,9 @@ class OnEqual(Event):
         self.trigger = self._event_value == self.trigger_ref_value
 
 
-class OnContainsAll(Event):
+class _OnContains(Event):
     """
-    OnContainsAll Event is triggered when a given topic attribute value contains all of the given trigger list value.
+    Base class for containment events. The trigger values are pre-computed into a frozenset (and a sorted numpy array for numerical values) to check the containment in linear time of the message values
     """
 
     def __init__(
@@ -266,52 +315,86 @@ class OnContainsAll(Event):
         super().__init__(
             event_name, event_source, trigger_value, nested_attributes, **kwargs
         )
+        self._trigger_lookup_source: Any = None
+        self._trigger_values: List = []
+        self._trigger_set: Optional[frozenset] = None
+        self._trigger_array: Optional[np.ndarray] = None
+
+    def _update_trigger_lookup(self) -> None:
+        """
+        Pre-computes the trigger values lookups if the reference value is updated
+        """
+        if self._trigger_lookup_source is self.trigger_ref_value:
+            return
+        self._trigger_lookup_source = self.trigger_ref_value
+        self._trigger_values = (
+            list(self.trigger_ref_value)
+            if isinstance(self.trigger_ref_value, (List, tuple))
+            else [self.trigger_ref_value]
+        )
+        try:
+            self._trigger_set = frozenset(self._trigger_values)
+        except TypeError:
+            # Unhashable values -> fallback to lists
+            self._trigger_set = None
+        self._trigger_array = (
+            np.unique(np.asarray(self._trigger_values))
+            if self._trigger_values
+            and all(
+                isinstance(val, (int, float)) and not isinstance(val, bool)
+                for val in self._trigger_values
+            )
+            else None
+        )
+
+    def _get_event_values(self) -> Any:
+        """
+        Get the message value as a sequence of values
+
+        :return: Message values
+        :rtype: Any
+        """
+        self._update_trigger_lookup()
+        value = self._event_value.value
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            return (value,)
+        return value
+
+
+class OnContainsAll(_OnContains):
+    """
+    OnContainsAll Event is triggered when a given topic attribute value contains all of the given trigger list value.
+    """
 
     def _update_trigger(self) -> None:
         """
         Set trigger  to True if event value contains all of the reference values
         """
-        self.trigger = self.trigger_ref_value in self._event_value
+        values = self._get_event_values()
+        if isinstance(values, np.ndarray) and self._trigger_array is not None:
+            self.trigger = bool(np.isin(self._trigger_array, values).all())
+        elif self._trigger_set is not None:
+            self.trigger = self._trigger_set.issubset(values)
+        else:
+            self.trigger = all(val in values for val in self._trigger_values)
 
 
-class OnContainsAny(Event):
+class OnContainsAny(_OnContains):
     """
     OnContainsAny Event is triggered when a given topic attribute value contains one of the given trigger list value.
     """
 
-    def __init__(
-        self,
-        event_name: str,
-        event_source: Union[Topic, str, Dict],
-        trigger_value: List,
-        nested_attributes: Union[str, List[str]],
-        **kwargs,
-    ) -> None:
-        """__init__.
-
-        :param event_name:
-        :type event_name: str
-        :param event_source:
-        :type event_source: Union[Topic, str, Dict]
-        :param trigger_value:
-        :type trigger_value: Union[float, int, bool, str, List]
-        :param attrs:
-        :rtype: None
-        """
-        super().__init__(
-            event_name, event_source, trigger_value, nested_attributes, **kwargs
-        )
-
     def _update_trigger(self) -> None:
         """
         Set trigger  to True if event value contains any of the reference values
         """
-        if isinstance(self.trigger_ref_value, List):
-            self.trigger = any(
-                val in self._event_value for val in self.trigger_ref_value
-            )
+        values = self._get_event_values()
+        if isinstance(values, np.ndarray) and self._trigger_array is not None:
+            self.trigger = bool(np.isin(values, self._trigger_array).any())
+        elif self._trigger_set is not None:
+            self.trigger = not self._trigger_set.isdisjoint(values)
         else:
-            self.trigger = self.trigger_ref_value in self._event_value
+            self.trigger = any(val in values for val in self._trigger_values)
 
 
 class OnDifferent(Event):
@@ -393,6 +476,15 @@ class OnGreater(Event):
         else:
             self.trigger = self._event_value > self.trigger_ref_value
 
+    def _hysteresis_released(self) -> bool:
+        """
+        Event is released when the value goes below the reference value by the hysteresis band
+
+        :return: Event is released
+        :rtype: bool
+        """
+        return self._event_value.value < self.trigger_ref_value - self._hysteresis
+
 
 class OnLess(Event):
     """
@@ -438,6 +530,101 @@ class OnLess(Event):
         else:
             self.trigger = self._event_value < self.trigger_ref_value
 
+    def _hysteresis_released(self) -> bool:
+        """
+        Event is released when the value goes above the reference value by the hysteresis band
+
+        :return: Event is released
+        :rtype: bool
+        """
+        return self._event_value.value > self.trigger_ref_value + self._hysteresis
+
+
+class OnTimeout(Event):
+    """
+    OnTimeout Event is triggered when no message is received on a given topic for a given timeout duration. The deadline is re-armed on each received message and checked by a shared scheduler, so the event fires even if the topic goes completely silent. After triggering, the event is triggered again only after new messages are received and the topic goes silent again.
+
+    ## Example usage scenario:
+    - Event when a sensor driver stops publishing (silent lidar or camera topic) to restart the driver component.
+    """
+
+    def __init__(
+        self,
+        event_name: str,
+        event_source: Union[Topic, str, Dict],
+        timeout: float,
+        nested_attributes: Union[str, List[str], None] = None,
+        **kwargs,
+    ) -> None:
+        """__init__.
+
+        :param event_name:
+        :type event_name: str
+        :param event_source:
+        :type event_source: Union[Topic, str, Dict]
+        :param timeout: Maximum allowed time without receiving messages on the topic (seconds)
+        :type timeout: float
+        :param nested_attributes: Not used by this event, kept for compatibility with the events serialization
+        :rtype: None
+        """
+        super().__init__(event_name, event_source, None, [], **kwargs)
+        if not isinstance(event_source, (str, Dict)):
+            self.trigger_ref_value = timeout
+        if not self.trigger_ref_value or self.trigger_ref_value <= 0.0:
+            raise ValueError(
+                f"Cannot create OnTimeout event '{event_name}' with a non positive timeout"
+            )
+        self._deadline = Deadline(callback=self._on_deadline)
+
+    def activate(self) -> None:
+        """
+        Arms the timeout deadline once the topic listener is created
+        """
+        deadline_scheduler.arm(self._deadline, self.trigger_ref_value)
+
+    def deactivate(self) -> None:
+        """
+        Disarms the timeout deadline when the topic listener is destroyed
+        """
+        deadline_scheduler.disarm(self._deadline)
+
+    def callback(self, msg: Any) -> None:
+        """
+        Event topic listener callback: re-arms the timeout deadline
+
+        :param msg: Event trigger topic message
+        :type msg: Any
+        """
+        self.trigger = False
+        # Resets the debounce and releases the hysteresis latch
+        self._filter_trigger()
+        deadline_scheduler.arm(self._deadline, self.trigger_ref_value)
+
+    def _on_deadline(self) -> None:
+        """
+        Executed by the deadline scheduler when no message is received within the timeout
+        """
+        if self._handle_once and self._processed_once:
+            return
+        self._update_trigger()
+        self._filter_trigger()
+        if not self.trigger and not self._latched:
+            # Trigger is debounced -> check the timeout again after another period
+            deadline_scheduler.arm(self._deadline, self.trigger_ref_value)
+        self._process_trigger(msg=None)
+
+    def _call_on_trigger(self, *_, **kwargs):
+        """
+        Submits the registered on trigger methods and actions to the actions pool, the actions are never executed on the deadline scheduler thread shared by all the events of the process
+        """
+        self._submit_on_trigger(**kwargs)
+
+    def _update_trigger(self) -> None:
+        """
+        Set trigger to True on timeout
+        """
+        self.trigger = True
+
 
 available_events: List[type] = [
     OnAny,
@@ -449,4 +636,5 @@ available_events: List[type] = [
     OnEqual,
     OnContainsAll,
     OnContainsAny,
+    OnTimeout,
 ]
@@ -1,26 +1,37 @@
 """ROS Subscribers Callback Classes"""
 
 import os
+import sys
 from abc import abstractmethod
-from typing import Any, Callable, Optional, Union, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, Dict, List
 from socket import socket
 
 import numpy as np
 import msgpack
-import msgpack_numpy as m_pack
 from geometry_msgs.msg import Pose
-from jinja2.environment import Template
 from nav_msgs.msg import OccupancyGrid, Odometry
 from std_msgs.msg import Header
-from PIL import Image as PILImage
 from rclpy.logging import get_logger
 from rclpy.subscription import Subscription
 from tf2_ros import TransformStamped
 
 from . import utils
 
-# patch msgpack for numpy arrays
-m_pack.patch()
+# PIL and jinja2 are imported on first use (fixed image read / template render)
+if TYPE_CHECKING:
+    from jinja2.environment import Template
+
+
+def _is_pil_image(obj: Any) -> bool:
+    """Check if an object is a PIL image without importing PIL (PIL is only loaded once a fixed image is read)
+
+    :param obj: Object to check
+    :type obj: Any
+    :return: If the object is a PIL image
+    :rtype: bool
+    """
+    pil_image = sys.modules.get("PIL.Image")
+    return pil_image is not None and isinstance(obj, pil_image.Image)
 
 
 class GenericCallback:
@@ -119,6 +130,7 @@ class GenericCallback:
             return processor(output=output)
 
         try:
+            utils.patch_msgpack_numpy()
             out_dict = {"output": output}
             payload = msgpack.packb(out_dict)
             if payload:
@@ -218,6 +230,8 @@ class ImageCallback(GenericCallback):
         if hasattr(input_topic, "fixed"):
             if os.path.isfile(input_topic.fixed):
                 try:
+                    from PIL import Image as PILImage
+
                     self.msg = PILImage.open(input_topic.fixed)
                 except Exception:
                     get_logger(self.node_name).error(
@@ -238,7 +252,7 @@ class ImageCallback(GenericCallback):
             return None
 
         # return bytes if fixed image has been read
-        if isinstance(self.msg, PILImage.Image):
+        if _is_pil_image(self.msg):
             return np.array(self.msg)
         else:
             # pre-process in case of weird encodings and reshape ROS topic
@@ -259,7 +273,7 @@ class TextCallback(GenericCallback):
         """
         super().__init__(input_topic, node_name)
         self.msg = input_topic.fixed if hasattr(input_topic, "fixed") else None
-        self._template: Optional[Template] = None
+        self._template: Optional["Template"] = None
 
     def _get_output(self, **_) -> Optional[str]:
         """Gets text.
@@ -4,15 +4,13 @@ from typing import Any, Callable, Optional, Union, List
 from socket import socket
 
 import msgpack
-import msgpack_numpy as m_pack
 from rclpy.logging import get_logger
 from rclpy.publisher import Publisher as ROSPublisher
 
 from std_msgs.msg import Header
 from builtin_interfaces.msg import Time
 
-# patch msgpack for numpy arrays
-m_pack.patch()
+from .utils import patch_msgpack_numpy
 
 
 class Publisher:
@@ -70,6 +68,7 @@ class Publisher:
             return processor(output=output)
 
         try:
+            patch_msgpack_numpy()
             out_dict = {'output': output}
             payload = msgpack.packb(out_dict)
             if payload:
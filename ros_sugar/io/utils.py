@@ -1,9 +1,86 @@
-from typing import List
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
+import msgpack
 import numpy as np
 from nav_msgs.msg import Odometry
-from quaternion import quaternion
-import cv2
+
+# Heavy optional dependencies (cv2, numpy-quaternion, msgpack_numpy) are imported on first use
+if TYPE_CHECKING:
+    from quaternion import quaternion
+
+# msgpack is patched for numpy arrays on first use
+_msgpack_numpy_patched: bool = False
+
+
+def patch_msgpack_numpy() -> None:
+    """
+    Patch msgpack for numpy arrays (imports msgpack_numpy on the first call)
+    """
+    global _msgpack_numpy_patched
+    if _msgpack_numpy_patched:
+        return
+    import msgpack_numpy as m_pack
+
+    m_pack.patch()
+    _msgpack_numpy_patched = True
+
+
+def _encode_numpy(obj: Any, chain: Optional[Callable] = None) -> Any:
+    """
+    msgpack default hook for the objects not supported by msgpack (numpy arrays and scalars), imports msgpack_numpy on the first call
+
+    :param obj: Object to encode
+    :type obj: Any
+    :param chain: User default hook, defaults to None
+    :type chain: Optional[Callable], optional
+
+    :return: Encoded object
+    :rtype: Any
+    """
+    import msgpack_numpy as m_pack
+
+    return m_pack.encode(obj, chain=chain)
+
+
+def _decode_numpy(obj: Any, chain: Optional[Callable] = None) -> Any:
+    """
+    msgpack object hook decoding the serialized numpy objects, msgpack_numpy is only imported when such an object is found
+
+    :param obj: Decoded map
+    :type obj: Any
+    :param chain: User object hook, defaults to None
+    :type chain: Optional[Callable], optional
+
+    :return: Decoded object
+    :rtype: Any
+    """
+    if b"nd" in obj or b"complex" in obj:
+        import msgpack_numpy as m_pack
+
+        return m_pack.decode(obj, chain=chain)
+    return obj if chain is None else chain(obj)
+
+
+def _install_msgpack_numpy_hooks() -> None:
+    """
+    Install the numpy hooks on msgpack.packb/unpackb (and the dumps/loads aliases) on import, to keep packing numpy arrays with msgpack after importing ros_sugar without importing msgpack_numpy until a numpy object is packed or unpacked. The streaming API (Packer, Unpacker, pack, unpack) is patched by patch_msgpack_numpy
+    """
+    packb, unpackb = msgpack.packb, msgpack.unpackb
+
+    def _packb(o: Any, **kwargs) -> bytes:
+        kwargs["default"] = partial(_encode_numpy, chain=kwargs.get("default"))
+        return packb(o, **kwargs)
+
+    def _unpackb(packed: bytes, **kwargs) -> Any:
+        kwargs["object_hook"] = partial(_decode_numpy, chain=kwargs.get("object_hook"))
+        return unpackb(packed, **kwargs)
+
+    msgpack.packb = msgpack.dumps = _packb
+    msgpack.unpackb = msgpack.loads = _unpackb
+
+
+_install_msgpack_numpy_hooks()
 
 
 def image_pre_processing(img) -> np.ndarray:
@@ -15,6 +92,8 @@ def image_pre_processing(img) -> np.ndarray:
     :returns:   Image as an numpy array
     :rtype:     Numpy array
     """
+    import cv2
+
     if img.encoding == "yuv422_yuy2":
         np_arr = np.asarray(img.data, dtype="uint8").reshape((img.height, img.width, 2))
         np_arr = cv2.cvtColor(np_arr, cv2.COLOR_YUV2RGB_YUYV)
@@ -32,7 +111,7 @@ def image_pre_processing(img) -> np.ndarray:
     return rgb
 
 
-def rotate_vector_by_quaternion(q: quaternion, v: List) -> List:
+def rotate_vector_by_quaternion(q: "quaternion", v: List) -> List:
     """
     rotate a vector v by a rotation quaternion q
 
@@ -44,6 +123,8 @@ def rotate_vector_by_quaternion(q: quaternion, v: List) -> List:
     :return:    the rotated position of the vector
     :rtype:     List
     """
+    from quaternion import quaternion
+
     vq = quaternion(0, 0, 0, 0)
     vq.imag = v
     return (q * vq * q.inverse()).imag
@@ -51,9 +132,9 @@ def rotate_vector_by_quaternion(q: quaternion, v: List) -> List:
 
 def get_pose_target_in_reference_frame(
     reference_position: np.ndarray,
-    reference_orientation: quaternion,
+    reference_orientation: "quaternion",
     target_position: np.ndarray,
-    target_orientation: quaternion,
+    target_orientation: "quaternion",
 ) -> np.ndarray:
     """
     Computes a target pose with respect to a reference pose, both given in a common coordinates frame
@@ -124,7 +205,7 @@ def _get_odom_from_ndarray(odom_array: np.ndarray) -> Odometry:
     return odom_msg
 
 
-def _get_orientation_from_odom(odom_msg: Odometry) -> quaternion:
+def _get_orientation_from_odom(odom_msg: Odometry) -> "quaternion":
     """
     Gets a rotation quaternion from Odometry message
 
@@ -134,6 +215,8 @@ def _get_orientation_from_odom(odom_msg: Odometry) -> quaternion:
     :return: Rotation quaternion (qw, qx, qy, qz)
     :rtype: quaternion
     """
+    from quaternion import quaternion
+
     return quaternion(
         odom_msg.pose.pose.orientation.w,
         odom_msg.pose.pose.orientation.x,
@@ -156,6 +239,8 @@ def odom_from_frame1_to_frame2(
     :return:    pose of target in frame 2
     :rtype:     PoseData
     """
+    from quaternion import quaternion
+
     pose_2_origin = Odometry()
 
     pose_2_in_1 = get_pose_target_in_reference_frame(
@@ -1,12 +1,14 @@
 import argparse
 import logging
-from typing import Optional, List, Type
+from typing import Any, Optional, List, Type
 
 import rclpy
 import setproctitle
 from rclpy.executors import MultiThreadedExecutor
 from rclpy.utilities import try_shutdown
 
+from .manifest import ComponentManifest
+
 
 def _parse_args() -> tuple[argparse.Namespace, List[str]]:
     """Parse arguments."""
@@ -41,21 +43,55 @@ def _parse_args() -> tuple[argparse.Namespace, List[str]]:
     parser.add_argument(
         "--actions", type=str, help="Actions associated with the component Events"
     )
+    parser.add_argument(
+        "--external_processors",
+        type=str,
+        help="External processors associated with the component topics",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        help="Path to the component launch manifest (replaces all the other component arguments)",
+    )
     return parser.parse_known_args()
 
 
+def _get_arg(
+    args: argparse.Namespace, manifest: Optional[ComponentManifest], name: str
+) -> Any:
+    """Get a component launch argument from the launch manifest if provided, else from the command line arguments
+
+    :param args: Command line arguments
+    :type args: argparse.Namespace
+    :param manifest: Component launch manifest
+    :type manifest: Optional[ComponentManifest]
+    :param name: Argument name
+    :type name: str
+
+    :return: Argument value
+    :rtype: Any
+    """
+    if manifest:
+        return manifest.get(name) or None
+    return getattr(args, name, None) or None
+
+
 def _parse_component_config(
-    args: argparse.Namespace, config_classes: List[Type]
+    args: argparse.Namespace,
+    config_classes: List[Type],
+    manifest: Optional[ComponentManifest] = None,
 ) -> Optional[object]:
     """Parse the component config object
 
     :param args: Command line arguments
     :type args: argparse.Namespace
+    :param manifest: Component launch manifest, defaults to None
+    :type manifest: Optional[ComponentManifest], optional
 
     :return: Component config object
     :rtype: object
     """
-    config_type = args.config_type or None
+    config_type = _get_arg(args, manifest, "config_type")
     config_class = None
     if not config_type:
         logging.warning(
@@ -76,6 +112,12 @@ def _parse_component_config(
 
     config = config_class()
 
+    if manifest:
+        # Config is passed in a compact binary (msgpack) form in the manifest
+        if config_msgpack := manifest.get("config"):
+            config.from_msgpack(config_msgpack)
+        return config
+
     config_json = args.config
 
     if config_json and config:
@@ -105,6 +147,50 @@ def _parse_ros_args(args_names: list[str]) -> list[str]:
     return ros_specific_args
 
 
+def _set_component_io(
+    component: Any, args: argparse.Namespace, manifest: Optional[ComponentManifest]
+) -> None:
+    """Sets the component inputs, outputs, events/actions and external processors from the launch arguments
+
+    :param component: Component
+    :type component: BaseComponent
+    :param args: Parsed command line arguments
+    :type args: argparse.Namespace
+    :param manifest: Component launch manifest
+    :type manifest: Optional[ComponentManifest]
+    """
+    # Set inputs/outputs
+    inputs_json = _get_arg(args, manifest, "inputs")
+    outputs_json = _get_arg(args, manifest, "outputs")
+
+    try:
+        if inputs_json:
+            component._inputs_json = inputs_json
+
+        if outputs_json:
+            component._outputs_json = outputs_json
+    except (ValueError, TypeError) as e:
+        logging.warning(
+            f"Passed Invalid inputs and/or outputs -> continue with component default values. Error: '{e}'"
+        )
+
+    # Set events/actions
+    events_json = args.events or None
+    actions_json = args.actions or None
+
+    if manifest:
+        if events_actions := manifest.get("events_actions"):
+            component._events_actions_msgpack = events_actions
+
+    elif events_json and actions_json:
+        component._events_json = events_json
+        component._actions_json = actions_json
+
+    # Set external processors
+    if external_processors_json := _get_arg(args, manifest, "external_processors"):
+        component._external_processors_json = external_processors_json
+
+
 def executable_main(*, list_of_components: List[Type], list_of_configs: List[Type]):
     """Executable main function to run a component as a ROS2 node in a new process.
     Used to start a node using Launcher
@@ -156,10 +242,13 @@ def executable_main(*, list_of_components: List[Type], list_of_configs: List[Typ
     """
     args, args_names = _parse_args()
 
+    # Component launch arguments are read from the manifest if provided
+    manifest = ComponentManifest.read(args.manifest) if args.manifest else None
+
     # Initialize rclpy with the ros-specific arguments
     rclpy.init(args=_parse_ros_args(args_names))
 
-    component_type = args.component_type or None
+    component_type = _get_arg(args, manifest, "component_type")
 
     if not component_type:
         raise ValueError("Cannot launch withput providing a component_type")
@@ -179,7 +268,7 @@ def executable_main(*, list_of_components: List[Type], list_of_configs: List[Typ
         )
 
     # Get name
-    component_name = args.node_name or None
+    component_name = _get_arg(args, manifest, "node_name")
 
     if not component_name:
         raise ValueError("Cannot launch component without specifying a name")
@@ -187,10 +276,10 @@ def executable_main(*, list_of_components: List[Type], list_of_configs: List[Typ
     # SET PROCESS NAME
     setproctitle.setproctitle(component_name)
 
-    config = _parse_component_config(args, list_of_configs)
+    config = _parse_component_config(args, list_of_configs, manifest)
 
     # Get Yaml config file if provided
-    config_file = args.config_file or None
+    config_file = _get_arg(args, manifest, "config_file")
 
     # Init the component
     component = comp_class(
@@ -200,28 +289,7 @@ def executable_main(*, list_of_components: List[Type], list_of_configs: List[Typ
     # Init the node with rclpy
     component.rclpy_init_node()
 
-    # Set inputs/outputs
-    inputs_json = args.inputs or None
-    outputs_json = args.outputs or None
-
-    try:
-        if inputs_json:
-            component._inputs_json = inputs_json
-
-        if outputs_json:
-            component._outputs_json = outputs_json
-    except (ValueError, TypeError) as e:
-        logging.warning(
-            f"Passed Invalid inputs and/or outputs -> continue with component default values. Error: '{e}'"
-        )
-
-    # Set events/actions
-    events_json = args.events or None
-    actions_json = args.actions or None
-
-    if events_json and actions_json:
-        component._events_json = events_json
-        component._actions_json = actions_json
+    _set_component_io(component, args, manifest)
 
     executor = MultiThreadedExecutor()
 
@@ -9,7 +9,7 @@ from launch import event_handlers
 from launch.action import Action as ROSAction
 from launch_ros.actions import Node as NodeLaunchAction
 from rclpy.context import Context
-from rclpy.executors import MultiThreadedExecutor
+from rclpy.executors import ExternalShutdownException, MultiThreadedExecutor
 from rclpy.impl.logging_severity import LoggingSeverity
 from rclpy.lifecycle.managed_entity import ManagedEntity
 from rclpy.logging import set_logger_level
@@ -21,6 +21,123 @@ from ..core.component import BaseComponent
 from ..core import BaseNode
 
 
+class ExecutorGroup:
+    """
+    Shared ROS2 context and multi-threaded executor spinning a group of nodes launched in threads.
+
+    All the nodes in the group are spun by one executor thread with a fixed number of workers, instead of one executor thread per node. The context and the executor thread are created when the first node is added to the group and shutdown when the last node is removed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        num_threads: Optional[int] = None,
+    ) -> None:
+        """Init the executor group
+
+        :param name: Group name
+        :type name: str
+        :param num_threads: Number of executor worker threads, if not provided the executor default (CPU count) is used, defaults to None
+        :type num_threads: Optional[int], optional
+        """
+        self.name = name
+        self.num_threads = num_threads
+        self._lock = threading.Lock()
+        self._nodes: List[Union[BaseComponent, BaseNode]] = []
+        self._ros_context: Optional[Context] = None
+        self._ros_executor: Optional[MultiThreadedExecutor] = None
+        self._ros_executor_thread: Optional[threading.Thread] = None
+
+    @property
+    def context(self) -> Context:
+        """
+        Getter of the group rclpy context (initialized on first use)
+
+        :return: Group context
+        :rtype: Context
+        """
+        with self._lock:
+            if not self._ros_context:
+                self._ros_context = Context()
+                rclpy.init(context=self._ros_context)
+            return self._ros_context
+
+    @property
+    def executor(self) -> Optional[MultiThreadedExecutor]:
+        """
+        Getter of the group executor
+
+        :return: Group executor, None if the group is not running
+        :rtype: Optional[MultiThreadedExecutor]
+        """
+        return self._ros_executor
+
+    def add_node(self, node: Union[BaseComponent, BaseNode]) -> None:
+        """
+        Adds a node initialized with the group context to the group executor, starts the executor thread if not running
+
+        :param node: ROS2 node
+        :type node: Union[BaseComponent, BaseNode]
+        """
+        with self._lock:
+            if not self._ros_executor:
+                self._ros_executor = MultiThreadedExecutor(
+                    num_threads=self.num_threads, context=self._ros_context
+                )
+            self._nodes.append(node)
+            self._ros_executor.add_node(node)
+            if not self._ros_executor_thread:
+                self._ros_executor_thread = threading.Thread(
+                    target=self._run,
+                    args=(self._ros_executor,),
+                    name=f"executor_group_{self.name}",
+                    daemon=True,
+                )
+                self._ros_executor_thread.start()
+
+    def destroy_node(self, node: Union[BaseComponent, BaseNode]) -> None:
+        """
+        Removes a node from the group executor and destroys it, stops the executor thread and shutdown the context when the group is empty
+
+        :param node: ROS2 node
+        :type node: Union[BaseComponent, BaseNode]
+        """
+        with self._lock:
+            if node not in self._nodes:
+                return
+            self._nodes.remove(node)
+            if self._ros_executor:
+                self._ros_executor.remove_node(node)
+            node.destroy_node()
+            if self._nodes:
+                return
+            # Last node removed -> stop the executor thread and shutdown the context
+            if self._ros_executor:
+                self._ros_executor.shutdown()
+                self._ros_executor = None
+            if (
+                self._ros_executor_thread
+                and self._ros_executor_thread is not threading.current_thread()
+            ):
+                self._ros_executor_thread.join()
+            self._ros_executor_thread = None
+            if self._ros_context:
+                rclpy.shutdown(context=self._ros_context)
+                self._ros_context = None
+
+    def _run(self, executor: MultiThreadedExecutor):
+        """
+        Spins the group executor until it is shutdown
+
+        :param executor: Group executor
+        :type executor: MultiThreadedExecutor
+        """
+        try:
+            executor.spin()
+        except (KeyboardInterrupt, ExternalShutdownException):
+            pass
+
+
 class ComponentLaunchAction(NodeLaunchAction):
     """ComponentLaunchAction."""
 
@@ -31,9 +148,10 @@ class ComponentLaunchAction(NodeLaunchAction):
         name: Union[str, List[launch.Substitution], None] = "node_name",
         namespace: Union[str, List[launch.Substitution], None] = None,
         log_level: LoggingSeverity = LoggingSeverity.INFO,
+        executor_group: Optional[ExecutorGroup] = None,
         **kwargs,
     ) -> None:
-        """Launch action to start a BaseComponent with the Launcher in a separate thread
+        """Launch action to start a BaseComponent with the Launcher in a separate thread, or in a shared executor group
 
         :param node:
         :type node: Union[BaseComponent, BaseNode]
@@ -43,12 +161,15 @@ class ComponentLaunchAction(NodeLaunchAction):
         :type namespace: Union[str, List[launch.Substitution], None]
         :param log_level:
         :type log_level: LoggingSeverity
+        :param executor_group: Shared executor group spinning the node, if not provided the node is spun in its own executor thread, defaults to None
+        :type executor_group: Optional[ExecutorGroup]
         :param kwargs:
         :rtype: None
         """
         self.__ros_node = node
         self.__node_name = name
         self.__ros_executor = None
+        self.__executor_group = executor_group
         self.__log_level = log_level
         self.__logger = logger
 
@@ -118,15 +239,12 @@ class ComponentLaunchAction(NodeLaunchAction):
                     self._on_internal_event, "exit_all"
                 )
 
-            # Adds an emit event for components activation
-            self.__logger.info("Registering Conditional Activation Handle")
-            self.__ros_node.add_components_activation_event(
-                partial(self._on_internal_event, "activate_all")
-            )
-
-        # Get rclpy context and init the monitor
-        self.__ros_context = Context()
-        rclpy.init(context=self.__ros_context)
+        # Get rclpy context (shared by the executor group, if any) and init the node
+        if self.__executor_group:
+            self.__ros_context = self.__executor_group.context
+        else:
+            self.__ros_context = Context()
+            rclpy.init(context=self.__ros_context)
         set_logger_level(self.__node_name, self.__log_level)
 
         self.__ros_node.rclpy_init_node(context=self.__ros_context)
@@ -135,8 +253,6 @@ class ComponentLaunchAction(NodeLaunchAction):
             # Activate Non lifecycle nodes
             self.__ros_node.activate()
 
-        # Get a multi-threaded executor
-        self.__ros_executor = MultiThreadedExecutor(context=self.__ros_context)
         self.__is_running = True
 
         context.extend_globals({f"{self.name}": self.__ros_node})
@@ -145,6 +261,15 @@ class ComponentLaunchAction(NodeLaunchAction):
             event_handlers.OnShutdown(on_shutdown=lambda *_: self.shutdown())
         )
 
+        if self.__executor_group:
+            # Spin the node in the shared group executor
+            self.__executor_group.add_node(self.__ros_node)
+            self.__ros_executor = self.__executor_group.executor
+            return
+
+        # Get a multi-threaded executor
+        self.__ros_executor = MultiThreadedExecutor(context=self.__ros_context)
+
         self.__ros_executor_thread = threading.Thread(target=self._run, daemon=True)
 
         self.__ros_executor_thread.start()
@@ -183,6 +308,9 @@ class ComponentLaunchAction(NodeLaunchAction):
         if not self.__is_running:
             raise RuntimeError(f"Cannot shutdown - Node {self.name} is not running")
         self.__is_running = False
+        if self.__executor_group:
+            self.__executor_group.destroy_node(self.__ros_node)
+            return
         self.__ros_executor_thread.join()
         self.__ros_node.destroy_node()
         rclpy.shutdown(context=self.__ros_context)
@@ -18,11 +18,11 @@ from typing import (
 from concurrent.futures import ThreadPoolExecutor
 
 import msgpack
-import msgpack_numpy as m_pack
 import launch
 import launch_ros
 import rclpy
 import setproctitle
+from ament_index_python.packages import get_package_prefix
 from launch import LaunchDescription, LaunchIntrospector, LaunchService
 from launch.action import Action as ROSLaunchAction
 from launch.actions import (
@@ -47,12 +47,12 @@ from ..core.action import Action
 from ..core.component import BaseComponent
 from ..core.monitor import Monitor
 from ..core.event import OnInternalEvent, Event
-from .launch_actions import ComponentLaunchAction
+from .launch_actions import ComponentLaunchAction, ExecutorGroup
+from .manifest import ComponentManifest
+from .zygote import ForkServer
+from ..io.utils import patch_msgpack_numpy
 from ..utils import InvalidAction, action_handler, has_decorator
 
-# patch msgpack for numpy arrays
-m_pack.patch()
-
 
 class Launcher:
     """
@@ -123,6 +123,17 @@ class Launcher:
         # Thread pool for external processors
         self.thread_pool: Union[ThreadPoolExecutor, None] = None
 
+        # Shared executor groups for components running in threads
+        self._executor_groups: Dict[str, ExecutorGroup] = {}
+        # Component name: executor group name
+        self.__components_executor_group: Dict[str, str] = {}
+
+        # Fork server for the components running in separate processes
+        self._fork_server: Optional[ForkServer] = None
+
+        # Launch manifests of the components running in separate processes
+        self._manifests: List[ComponentManifest] = []
+
     def add_pkg(
         self,
         components: List[BaseComponent],
@@ -135,6 +146,7 @@ class Launcher:
         multiprocessing: bool = False,
         activate_all_components_on_start: bool = True,
         components_to_activate_on_start: Optional[List[BaseComponent]] = None,
+        executor_group: Optional[str] = None,
     ):
         """Add component or a set of components to the launcher from one ROS2 package based on ros_sugar
 
@@ -152,6 +164,8 @@ class Launcher:
         :type activate_all_components_on_start: bool, optional
         :param components_to_activate_on_start: Set of components to activate on bringup, defaults to None
         :type components_to_activate_on_start: Optional[List[BaseComponent]], optional
+        :param executor_group: Name of a shared executor group to run the components in (multi-threading only). The group is created with default parameters if it is not already added with 'add_executor_group', defaults to None
+        :type executor_group: Optional[str], optional
         """
         # If multi processing is enabled -> check for package and executable name
         if multiprocessing and (not package_name or not executable_entry_point):
@@ -159,6 +173,11 @@ class Launcher:
                 "Cannot run in multi-processes without specifying ROS2 'package_name' and 'executable_entry_point'"
             )
 
+        if executor_group:
+            self._add_components_to_executor_group(
+                components, executor_group, multiprocessing
+            )
+
         if not multiprocessing:
             package_name = None
             executable_entry_point = None
@@ -199,6 +218,52 @@ class Launcher:
                 component._config_file = self._config_file
                 component.configure(self._config_file)
 
+    def add_executor_group(
+        self,
+        name: str,
+        components: Optional[List[BaseComponent]] = None,
+        num_threads: Optional[int] = None,
+    ) -> None:
+        """Add a shared executor group to run a set of components launched in threads with one multi-threaded executor, instead of one executor thread per component
+
+        :param name: Group name
+        :type name: str
+        :param components: Components to run in the group, defaults to None
+        :type components: Optional[List[BaseComponent]], optional
+        :param num_threads: Number of executor worker threads, if not provided the executor default (CPU count) is used, defaults to None
+        :type num_threads: Optional[int], optional
+        """
+        if name not in self._executor_groups:
+            self._executor_groups[name] = ExecutorGroup(
+                name=name, num_threads=num_threads
+            )
+        else:
+            group = self._executor_groups[name]
+            group.num_threads = num_threads or group.num_threads
+
+        for component in components or []:
+            self.__components_executor_group[component.node_name] = name
+
+    def _add_components_to_executor_group(
+        self, components: List[BaseComponent], name: str, multiprocessing: bool
+    ) -> None:
+        """Validate and register the executor group of a set of components added to the launcher
+
+        :param components: Components to run in the group
+        :type components: List[BaseComponent]
+        :param name: Group name
+        :type name: str
+        :param multiprocessing: If the components run in multi-processes
+        :type multiprocessing: bool
+
+        :raises ValueError: If the components run in multi-processes
+        """
+        if multiprocessing:
+            raise ValueError(
+                "Executor groups are only available for components running in multi-threading"
+            )
+        self.add_executor_group(name, components=components)
+
     def _setup_component_events_handlers(self, comp: BaseComponent):
         """Parse a component events/actions from the overall components actions
 
@@ -267,22 +332,6 @@ class Launcher:
                     # Action to execute through the monitor
                     self.__update_dict_list(self._monitor_actions, condition, action)
 
-    def _activate_components_action(self) -> SomeEntitiesType:
-        """
-        Activate all the components in the stack
-
-        :param in_processes: Components run type, If false then run type is in threads
-        :type in_processes: bool
-        """
-        activation_actions = []
-        for component, run_in_process in self.__components_to_activate_on_start.items():
-            if run_in_process:
-                activation_actions.extend(self.start(component.node_name))
-            else:
-                start_action = Action(component.start)
-                activation_actions.append(start_action.launch_action())
-        return activation_actions
-
     # LAUNCH ACTION HANDLERS
     @action_handler
     def start(self, node_name: str, **_) -> SomeEntitiesType:
@@ -367,7 +416,12 @@ class Launcher:
         for component in self.components:
             component.fallback_rate = value
 
-    def on_fail(self, action_name: str, max_retries: Optional[int] = None) -> None:
+    def on_fail(
+        self,
+        action_name: str,
+        max_retries: Optional[int] = None,
+        retry_delay: float = 0.0,
+    ) -> None:
         """
         Set the fallback strategy (action) on any fail for all components
 
@@ -375,6 +429,8 @@ class Launcher:
         :type action: Union[List[Action], Action]
         :param max_retries: Maximum number of action execution retries. None is equivalent to unlimited retries, defaults to None
         :type max_retries: Optional[int], optional
+        :param retry_delay: Delay (seconds) before the first retry, consecutive retries delays are increased exponentially, defaults to 0.0
+        :type retry_delay: float, optional
         """
         for component in self.components:
             if action_name in component.fallbacks:
@@ -387,7 +443,7 @@ class Launcher:
                         f"{method} takes {method_params} as arguments. Only actions without any arguments or with keyword only arguments can be set as on_fail actions from the launcher. Use component.on_fail to pass specific arguments."
                     )
                 action = Action(method=method)
-                component.on_fail(action, max_retries)
+                component.on_fail(action, max_retries, retry_delay=retry_delay)
             else:
                 raise ValueError(
                     f"Non valid action fallback {action_name}: Fallback is not available in component {component.node_name}. Available component fallbacks are the following methods: '{component.fallbacks}'"
@@ -524,15 +580,6 @@ class Launcher:
         )
         self._description.add_action(monitor_action)
 
-        # Register a activation event
-        internal_events_handler_activate = launch.actions.RegisterEventHandler(
-            OnInternalEvent(
-                internal_event_name="activate_all",
-                entities=self._activate_components_action(),
-            )
-        )
-        self._description.add_action(internal_events_handler_activate)
-
         # Register exit_all event
         exit_all_event_handler = launch.actions.RegisterEventHandler(
             OnInternalEvent(
@@ -569,6 +616,8 @@ class Launcher:
         if not component._external_processors:
             return
 
+        patch_msgpack_numpy()
+
         if not self.thread_pool:
             self.thread_pool = ThreadPoolExecutor()
 
@@ -593,17 +642,27 @@ class Launcher:
         pkg_name: str,
         executable_name: str,
         ros_log_level: str = "info",
+        launch_debug: bool = False,
     ):
         """
         Sets up the launch actions to start the components in separate processes
 
         :param ros_log_level: Log level for ROS2
         :type ros_log_level: str, default to "info"
+        :param launch_debug: Pass the component launch arguments as readable JSON arguments instead of a binary manifest, defaults to False
+        :type launch_debug: bool, optional
         """
         name = component.node_name
-        component._update_cmd_args_list()
+        if launch_debug:
+            component._update_cmd_args_list()
+        else:
+            manifest = ComponentManifest(component._launch_manifest_sections)
+            self._manifests.append(manifest)
+            component._update_cmd_args_list(manifest_path=manifest.write(name))
         self._setup_external_processors(component)
         # Check if the component is a lifecycle node
+        # Start the executable through the fork server if available
+        prefix = self._fork_server.client_prefix if self._fork_server else None
         if issubclass(component.__class__, ManagedEntity):
             new_node = LifecycleNodeLaunchAction(
                 package=pkg_name,
@@ -614,6 +673,7 @@ class Launcher:
                 output="screen",
                 arguments=component.launch_cmd_args
                 + ["--ros-args", "--log-level", ros_log_level],
+                prefix=prefix,
             )
         else:
             new_node = NodeLaunchAction(
@@ -625,20 +685,54 @@ class Launcher:
                 output="screen",
                 arguments=component.launch_cmd_args
                 + ["--ros-args", "--log-level", ros_log_level],
+                prefix=prefix,
             )
 
         self._launch_group.append(new_node)
 
+    def _start_fork_server(self) -> None:
+        """
+        Starts a fork server preloading the packages executables of the components running in separate processes
+        """
+        executables = []
+        for pkg_name, executable_name in set(self._pkg_executable):
+            if not pkg_name or not executable_name:
+                continue
+            try:
+                executables.append(
+                    os.path.join(
+                        get_package_prefix(pkg_name), "lib", pkg_name, executable_name
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Cannot find executable '{executable_name}' in package '{pkg_name}' to preload in the fork server: {e}"
+                )
+        if not executables:
+            return
+
+        self._fork_server = ForkServer(preload_executables=executables)
+        if not self._fork_server.start():
+            logger.warning(
+                "Fork server is not available, components processes will be started directly"
+            )
+            self._fork_server.stop()
+            self._fork_server = None
+
     def _setup_component_in_thread(self, component, ros_log_level: str = "info"):
         """
         Adds all components to be launched in separate threads
         """
+        group_name = self.__components_executor_group.get(component.node_name)
         component_action = ComponentLaunchAction(
             node=component,
             namespace=self._namespace,
             name=component.node_name,
             output="screen",
             log_level=logging.get_logging_severity_from_string(ros_log_level),
+            executor_group=self._executor_groups.get(group_name)
+            if group_name
+            else None,
         )
         self._launch_group.append(component_action)
 
@@ -736,9 +830,21 @@ class Launcher:
         introspect: bool = False,
         launch_debug: bool = False,
         ros_log_level: str = "info",
+        fork_server: bool = False,
     ):
         """
         Bring up the Launcher
+
+        :param config_file: Path to Yaml configuration file, defaults to None
+        :type config_file: str | None, optional
+        :param introspect: Start LaunchIntrospector, defaults to False
+        :type introspect: bool, optional
+        :param launch_debug: LaunchService debugger, defaults to False
+        :type launch_debug: bool, optional
+        :param ros_log_level: Log level for ROS2, defaults to "info"
+        :type ros_log_level: str, optional
+        :param fork_server: Start the components running in separate processes by forking a process with preloaded modules (fork server), defaults to False
+        :type fork_server: bool, optional
         """
         if not self.components:
             raise ValueError(
@@ -756,12 +862,15 @@ class Launcher:
         for component in self.components:
             self._setup_component_events_handlers(component)
 
+        if fork_server:
+            self._start_fork_server()
+
         # Add configured components to launcher
         for idx, component in enumerate(self.components):
             pkg_name, executable_name = self._pkg_executable[idx]
             if pkg_name and executable_name:
                 self._setup_component_in_process(
-                    component, pkg_name, executable_name, ros_log_level
+                    component, pkg_name, executable_name, ros_log_level, launch_debug
                 )
             else:
                 self._setup_component_in_thread(component, ros_log_level)
@@ -770,7 +879,15 @@ class Launcher:
 
         self._description.add_action(group_action)
 
-        self._start_ros_launch(introspect, launch_debug)
+        try:
+            self._start_ros_launch(introspect, launch_debug)
+        finally:
+            if self._fork_server:
+                self._fork_server.stop()
+
+            # Manifest files are kept while the components can be respawned
+            for manifest in self._manifests:
+                manifest.close()
 
         if self.thread_pool:
             self.thread_pool.shutdown()
@@ -0,0 +1,151 @@
+"""Component launch manifest"""
+
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+import msgpack
+
+# Manifest format version
+MANIFEST_VERSION = 1
+
+
+class ComponentManifest:
+    """
+    Compact binary (msgpack) launch manifest of a component running in a separate process.
+
+    The manifest gathers the component launch sections (type, name, config, inputs, outputs, events/actions, external processors, ...). Each section is packed separately and is only decoded on first access, so a component decodes only the sections it uses.
+
+    The Launcher writes the manifest to an anonymous in-memory file (memfd), or to a temporary file if memfd is not available, and passes only its path to the component executable (see '--manifest' argument).
+    """
+
+    def __init__(self, sections: Optional[Dict[str, Any]] = None) -> None:
+        """Init the manifest
+
+        :param sections: Manifest sections {section_name: value}, defaults to None
+        :type sections: Optional[Dict[str, Any]], optional
+        """
+        self._packed: Dict[str, bytes] = {}
+        self._decoded: Dict[str, Any] = {}
+        self._fd: Optional[int] = None
+        self._file_path: Optional[str] = None
+        for name, value in (sections or {}).items():
+            self[name] = value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        """Set a manifest section
+
+        :param name: Section name
+        :type name: str
+        :param value: Section value (msgpack serializable)
+        :type value: Any
+        """
+        self._packed[name] = msgpack.packb(value)
+        self._decoded[name] = value
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._packed
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get a manifest section value (decoded on first access)
+
+        :param name: Section name
+        :type name: str
+        :param default: Default value if the section is not in the manifest, defaults to None
+        :type default: Any, optional
+
+        :return: Section value
+        :rtype: Any
+        """
+        if name not in self._packed:
+            return default
+        if name not in self._decoded:
+            self._decoded[name] = msgpack.unpackb(self._packed[name])
+        return self._decoded[name]
+
+    def to_msgpack(self) -> bytes:
+        """Serialize the manifest
+
+        :return: Manifest binary form
+        :rtype: bytes
+        """
+        return msgpack.packb({"version": MANIFEST_VERSION, "sections": self._packed})
+
+    @classmethod
+    def from_msgpack(cls, manifest_obj: bytes) -> "ComponentManifest":
+        """Load a manifest from its binary form, the sections are not decoded
+
+        :param manifest_obj: Manifest binary form
+        :type manifest_obj: bytes
+
+        :raises ValueError: If the manifest version is not supported
+
+        :return: Manifest
+        :rtype: ComponentManifest
+        """
+        manifest_dict = msgpack.unpackb(manifest_obj)
+        if manifest_dict.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported component manifest version '{manifest_dict.get('version')}', expected '{MANIFEST_VERSION}'"
+            )
+        manifest = cls()
+        manifest._packed = manifest_dict["sections"]
+        return manifest
+
+    def write(self, name: str) -> str:
+        """Write the manifest to an in-memory file (memfd), or to a temporary file if memfd is not supported
+
+        :param name: Manifest name (component name)
+        :type name: str
+
+        :return: Path to read the manifest from another process
+        :rtype: str
+        """
+        self.close()
+        manifest_obj = self.to_msgpack()
+        try:
+            self._fd = os.memfd_create(f"{name}_manifest")
+            with os.fdopen(self._fd, "wb", closefd=False) as manifest_file:
+                manifest_file.write(manifest_obj)
+            # The memfd is kept open by the writer and opened by path by the reader
+            return f"/proc/{os.getpid()}/fd/{self._fd}"
+        except (AttributeError, OSError):
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            prefix=f"{name}_manifest_",
+            suffix=".msgpack",
+            delete=False,
+        ) as manifest_file:
+            manifest_file.write(manifest_obj)
+        self._file_path = manifest_file.name
+        return self._file_path
+
+    def close(self) -> None:
+        """Release the written manifest file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._file_path:
+            try:
+                os.remove(self._file_path)
+            except FileNotFoundError:
+                pass
+            self._file_path = None
+
+    @classmethod
+    def read(cls, path: str) -> "ComponentManifest":
+        """Read a manifest written by another process. The manifest file is kept for a respawned component and is released by the writer (see 'close')
+
+        :param path: Manifest path
+        :type path: str
+
+        :return: Manifest
+        :rtype: ComponentManifest
+        """
+        with open(path, "rb") as manifest_file:
+            manifest_obj = manifest_file.read()
+        return cls.from_msgpack(manifest_obj)
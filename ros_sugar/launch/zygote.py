@@ -0,0 +1,410 @@
+"""Fork server (zygote) for multi-process components bringup
+
+The fork server is a single-threaded process that imports the heavy modules used by the components (rclpy, numpy, cv2, PIL, jinja2, msgpack, quaternion, ros_sugar and the components packages executables) once, then forks a new process for each component requested by a zygote client (see zygote_client.py). The forked processes share the preloaded modules memory (copy-on-write) and skip the imports at startup.
+
+NOTE: The fork server must not initialize rclpy or start any threads before forking.
+
+This script is executed by path by the Launcher and only uses the standard library at module level.
+
+Usage:
+    python3 zygote.py --socket <socket_path> [--preload <executable_path> ...]
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Modules imported by the fork server before forking the components
+PRELOAD_MODULES = (
+    "rclpy",
+    "rclpy.executors",
+    "rclpy.lifecycle",
+    "numpy",
+    "cv2",
+    "PIL.Image",
+    "jinja2",
+    "msgpack",
+    "msgpack_numpy",
+    "quaternion",
+    "ros_sugar",
+)
+
+# Module name used to import the executables without running their main
+_PRELOAD_RUN_NAME = "__ros_sugar_zygote_preload__"
+
+_CLIENT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "zygote_client.py"
+)
+
+
+class ForkServer:
+    """
+    Launcher side handle of the fork server process: starts/stops the server and provides the command prefix to start the components executables through the server
+    """
+
+    def __init__(
+        self, preload_executables: Optional[List[str]] = None, timeout: float = 60.0
+    ) -> None:
+        """Init the fork server handle
+
+        :param preload_executables: Paths to the components executables to preload in the server, defaults to None
+        :type preload_executables: Optional[List[str]], optional
+        :param timeout: Timeout (seconds) for the server to be ready, defaults to 60.0
+        :type timeout: float, optional
+        """
+        self.socket_path = os.path.join(
+            tempfile.gettempdir(), f"ros_sugar_zygote_{os.getpid()}.sock"
+        )
+        self._preload_executables = preload_executables or []
+        self._timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def client_prefix(self) -> str:
+        """
+        Command prefix to start an executable through the fork server
+
+        :return: Launch command prefix
+        :rtype: str
+        """
+        return f"{sys.executable} {_CLIENT_PATH} {self.socket_path}"
+
+    def start(self) -> bool:
+        """
+        Starts the fork server and waits for it to be ready (preloading done)
+
+        :return: If the server is ready
+        :rtype: bool
+        """
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        cmd = [sys.executable, os.path.abspath(__file__), "--socket", self.socket_path]
+        if self._preload_executables:
+            cmd += ["--preload", *self._preload_executables]
+        self._process = subprocess.Popen(cmd)
+
+        end_time = time.monotonic() + self._timeout
+        while time.monotonic() < end_time:
+            if os.path.exists(self.socket_path):
+                return True
+            if self._process.poll() is not None:
+                break
+            time.sleep(0.05)
+        # Components are executed directly if the server is not available
+        return False
+
+    def stop(self) -> None:
+        """
+        Stops the fork server
+        """
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def _preload(executables: List[str]) -> None:
+    """
+    Imports the heavy modules and the components executables modules
+
+    :param executables: Paths to the executables
+    :type executables: List[str]
+    """
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+    for path in executables:
+        try:
+            # Runs the executable imports without running its main
+            runpy.run_path(path, run_name=_PRELOAD_RUN_NAME)
+        except Exception as e:
+            print(f"Fork server: cannot preload '{path}': {e}", file=sys.stderr)
+    # Keep the preloaded objects out of the garbage collector to limit copy-on-write
+    gc.freeze()
+
+
+def _recv_request(conn: socket.socket) -> Tuple[Dict, List[int]]:
+    """
+    Receives a client request: length-prefixed json payload and the client standard streams file descriptors
+
+    :param conn: Client connection
+    :type conn: socket.socket
+
+    :raises ConnectionError: If the request is incomplete
+
+    :return: Request payload, file descriptors
+    :rtype: Tuple[Dict, List[int]]
+    """
+    header, fds, _, _ = socket.recv_fds(conn, 4, 3)
+    if len(header) < 4:
+        for fd in fds:
+            os.close(fd)
+        raise ConnectionError("Incomplete fork server request")
+    size = struct.unpack("!I", header)[0]
+    payload = b""
+    while len(payload) < size:
+        chunk = conn.recv(size - len(payload))
+        if not chunk:
+            for fd in fds:
+                os.close(fd)
+            raise ConnectionError("Incomplete fork server request")
+        payload += chunk
+    return json.loads(payload), fds
+
+
+def _run_child(request: Dict, fds: List[int]) -> None:
+    """
+    Runs the requested executable in the forked process and exits with its exit code
+
+    :param request: Client request (argv, env, cwd)
+    :type request: Dict
+    :param fds: Client standard streams file descriptors
+    :type fds: List[int]
+    """
+    code = 1
+    try:
+        for sig in (signal.SIGCHLD, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        for target_fd, fd in enumerate(fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = request["argv"]
+        # Same import path as running the executable directly
+        sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[0])))
+
+        runpy.run_path(sys.argv[0], run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except KeyboardInterrupt:
+        code = 0
+    except BaseException as e:
+        print(
+            f"Fork server: error while running '{request['argv']}': {e}",
+            file=sys.stderr,
+        )
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+class _Server:
+    """
+    Fork server state: listening socket, selector and forked components
+    """
+
+    def __init__(self, socket_path: str) -> None:
+        """Creates the server socket and the selector, and sets up the signals handlers
+
+        :param socket_path: Server unix socket path
+        :type socket_path: str
+        """
+        self.socket_path = socket_path
+        self.running = True
+
+        # Wake up the selector on SIGCHLD/SIGTERM
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        signal.set_wakeup_fd(self._wakeup_write)
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Bind to a temporary path then rename: the socket file appears when the server is ready
+        tmp_socket_path = f"{socket_path}.tmp"
+        if os.path.exists(tmp_socket_path):
+            os.remove(tmp_socket_path)
+        self._listener.bind(tmp_socket_path)
+        self._listener.listen(128)
+        os.rename(tmp_socket_path, socket_path)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+
+        # Forked component pid: client connection
+        self._children: Dict[int, socket.socket] = {}
+
+    def _stop(self, *_) -> None:
+        """
+        Signal handler to stop the server loop
+        """
+        self.running = False
+
+    def run(self) -> None:
+        """
+        Server loop: accepts the client requests, forks the components and reaps the exited components
+        """
+        while self.running:
+            for key, _ in self._selector.select(timeout=1.0):
+                if key.fileobj is self._listener:
+                    self._accept_request()
+                elif key.fileobj is self._wakeup_read:
+                    try:
+                        os.read(self._wakeup_read, 512)
+                    except BlockingIOError:
+                        pass
+                else:
+                    self._on_client_closed(key)
+            self._reap_children()
+        self.close()
+
+    def _accept_request(self) -> None:
+        """
+        Accepts a client connection, receives its request and forks the component
+        """
+        conn, _ = self._listener.accept()
+        try:
+            conn.settimeout(5.0)
+            request, fds = _recv_request(conn)
+        except (OSError, ValueError) as e:
+            print(f"Fork server: invalid request: {e}", file=sys.stderr)
+            conn.close()
+            return
+        pid = self._fork(conn, request, fds)
+
+        for fd in fds:
+            os.close(fd)
+        conn.settimeout(None)
+        try:
+            conn.sendall(struct.pack("!i", pid))
+        except OSError:
+            pass
+        self._children[pid] = conn
+        # Detect the client exit
+        self._selector.register(conn, selectors.EVENT_READ, data=pid)
+
+    def _fork(self, conn: socket.socket, request: Dict, fds: List[int]) -> int:
+        """
+        Forks a process running the requested executable, the child process releases the server resources and never returns
+
+        :param conn: Client connection
+        :type conn: socket.socket
+        :param request: Client request (argv, env, cwd)
+        :type request: Dict
+        :param fds: Client standard streams file descriptors
+        :type fds: List[int]
+
+        :return: Forked process pid
+        :rtype: int
+        """
+        pid = os.fork()
+        if pid == 0:
+            signal.set_wakeup_fd(-1)
+            self._selector.close()
+            self._listener.close()
+            os.close(self._wakeup_read)
+            os.close(self._wakeup_write)
+            for child_conn in self._children.values():
+                child_conn.close()
+            conn.close()
+            _run_child(request, fds)
+        return pid
+
+    def _on_client_closed(self, key: selectors.SelectorKey) -> None:
+        """
+        Client connection closed -> terminate its component
+
+        :param key: Client connection selector key (data is the component pid)
+        :type key: selectors.SelectorKey
+        """
+        self._selector.unregister(key.fileobj)
+        try:
+            os.kill(key.data, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _reap_children(self) -> None:
+        """
+        Reaps the exited components and sends their exit code to the clients (negative signal number if killed by a signal)
+        """
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            conn = self._children.pop(pid, None)
+            if not conn:
+                continue
+            try:
+                self._selector.unregister(conn)
+            except KeyError:
+                pass
+            try:
+                conn.sendall(struct.pack("!i", os.waitstatus_to_exitcode(status)))
+            except OSError:
+                pass
+            conn.close()
+
+    def close(self) -> None:
+        """
+        Closes the server socket and removes the socket file
+        """
+        self._selector.close()
+        self._listener.close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def serve(socket_path: str, preload_executables: List[str]) -> None:
+    """
+    Fork server main: preloads the modules then runs the single-threaded selector loop accepting the client requests, forking the components and reaping the exited components
+
+    :param socket_path: Server unix socket path
+    :type socket_path: str
+    :param preload_executables: Paths to the executables to preload
+    :type preload_executables: List[str]
+    """
+    _preload(preload_executables)
+    _Server(socket_path).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ros_sugar components fork server")
+    parser.add_argument("--socket", type=str, required=True, help="Unix socket path")
+    parser.add_argument(
+        "--preload",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Paths to the components executables to preload",
+    )
+    args = parser.parse_args()
+    # Do not import from this script directory
+    if sys.path and sys.path[0] == os.path.dirname(os.path.abspath(__file__)):
+        sys.path.pop(0)
+    serve(args.socket, args.preload)
+
+
+if __name__ == "__main__":
+    main()
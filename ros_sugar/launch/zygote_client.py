@@ -0,0 +1,104 @@
+"""Fork server (zygote) client
+
+Light process started by the launcher in place of a component executable when the fork server is enabled. The client forwards its command line, environment and standard streams to the fork server, which forks a preloaded process to run the component executable. The client then forwards the received signals to the forked component and exits with its exit code.
+
+This script is executed by path and only uses the standard library to start fast.
+
+Usage:
+    python3 zygote_client.py <socket_path> <executable> [args ...]
+"""
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+# Forwarded standard streams (stdin, stdout, stderr)
+_STD_FDS = [0, 1, 2]
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Receive an exact number of bytes from a socket
+
+    :param sock: Connected socket
+    :type sock: socket.socket
+    :param size: Number of bytes
+    :type size: int
+
+    :raises ConnectionError: If the connection is closed before receiving all the bytes
+
+    :return: Received bytes
+    :rtype: bytes
+    """
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Fork server connection closed")
+        data += chunk
+    return data
+
+
+def main() -> int:
+    """Forward the executable to the fork server and wait for its exit
+
+    :return: Component exit code, negative signal number if the component is killed by a signal
+    :rtype: int
+    """
+    socket_path, argv = sys.argv[1], sys.argv[2:]
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        # Fork server is not available -> run the executable directly
+        os.execv(argv[0], argv)
+
+    payload = json.dumps({
+        "argv": argv,
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+    }).encode()
+    socket.send_fds(sock, [struct.pack("!I", len(payload))], _STD_FDS)
+    sock.sendall(payload)
+
+    pid = struct.unpack("!i", _recv_exactly(sock, 4))[0]
+
+    def _forward_signal(signum, _):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP, signal.SIGQUIT):
+        signal.signal(sig, _forward_signal)
+
+    try:
+        return struct.unpack("!i", _recv_exactly(sock, 4))[0]
+    except ConnectionError:
+        return 1
+
+
+def _exit(code: int) -> None:
+    """Exit with the component exit code. A component killed by a signal is reported with a negative code: the same signal is raised on the client to give the same exit status to the launcher
+
+    :param code: Component exit code
+    :type code: int
+    """
+    if code < 0:
+        signum = -code
+        try:
+            # Signals that cannot be caught (SIGKILL, SIGSTOP) have no handler to reset
+            signal.signal(signum, signal.SIG_DFL)
+        except (OSError, ValueError):
+            pass
+        os.kill(os.getpid(), signum)
+        # Signal did not terminate the process -> shell convention
+        code = 128 + signum
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    _exit(main())
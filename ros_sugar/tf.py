@@ -1,12 +1,17 @@
 """ROS TF Listener"""
 
-from typing import Optional
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from attrs import define, field
+import numpy as np
+from attrs import Factory, define, field
 from rclpy.logging import get_logger
+from rclpy.node import Node
 from rclpy.time import Time
 from rclpy.timer import Timer
-from tf2_ros import ConnectivityException, LookupException
+from geometry_msgs.msg import TransformStamped
+from tf2_ros import ConnectivityException, ExtrapolationException, LookupException
 from tf2_ros.buffer import Buffer
 from tf2_ros.transform_listener import TransformListener
 
@@ -28,38 +33,189 @@ class TFListenerConfig(BaseAttrs):
     static_tf: bool = field(default=False)  # If the transform is static
 
 
-class TFListener:
+def _to_frame_pairs(value: Sequence) -> List[Tuple[str, str]]:
     """
-    ROS TF listener class to lookup a transformation and execute it
+    Converts a list of frame pairs to a list of (source_frame, goal_frame) tuples
+
+    :param value: Frame pairs
+    :type value: Sequence
+
+    :raises ValueError: If a pair does not contain exactly two frames
+
+    :return: Frame pairs
+    :rtype: List[Tuple[str, str]]
+    """
+    pairs = []
+    for pair in value:
+        if len(pair) != 2:
+            raise ValueError(
+                f"Frame pairs should be given as (source_frame, goal_frame), got '{pair}'"
+            )
+        pairs.append((str(pair[0]), str(pair[1])))
+    return pairs
+
+
+@define
+class MultiTFListenerConfig(BaseAttrs):
+    """
+    Multiple transforms listener config
+    """
+
+    lookup_rate: float = field(
+        default=30.0, validator=base_validators.in_range(min_value=1e-6, max_value=1e6)
+    )
+
+    # TF lookup (source_frame, goal_frame) pairs
+    frame_pairs: List[Tuple[str, str]] = field(
+        default=Factory(list), converter=_to_frame_pairs
+    )
+    static_tf: bool = field(default=False)  # If the transforms are static
+
+
+def transform_to_matrix(transform: TransformStamped) -> np.ndarray:
+    """
+    Converts a transform to a 4x4 homogeneous transformation matrix
+
+    :param transform: Transform
+    :type transform: TransformStamped
+
+    :return: Transformation matrix
+    :rtype: np.ndarray
+    """
+    translation = transform.transform.translation
+    rotation = transform.transform.rotation
+    x, y, z, w = rotation.x, rotation.y, rotation.z, rotation.w
+    return np.array([
+        [
+            1 - 2 * (y * y + z * z),
+            2 * (x * y - z * w),
+            2 * (x * z + y * w),
+            translation.x,
+        ],
+        [
+            2 * (x * y + z * w),
+            1 - 2 * (x * x + z * z),
+            2 * (y * z - x * w),
+            translation.y,
+        ],
+        [
+            2 * (x * z - y * w),
+            2 * (y * z + x * w),
+            1 - 2 * (x * x + y * y),
+            translation.z,
+        ],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+
+
+class _SharedTFListener:
+    """
+    Process-wide TF buffer and transform listener shared by all the TFListener instances of the process
+
+    The transform listener subscribes to '/tf' and '/tf_static' once, on the node of the first acquiring component, so the TF tree is stored and deserialized once whatever the number of components in the process, the node remappings and namespace are applied, and no additional node (DDS participant) is created. If the node holding the listener releases it while other nodes still use the buffer, the listener is moved to one of these nodes. The buffer is dropped on the last release (reference counting).
+    """
+
+    _lock = threading.Lock()
+    _buffer: Optional[Buffer] = None
+    _listener: Optional[TransformListener] = None
+    _listener_node: Optional[Node] = None
+    # One entry per acquire
+    _nodes: List[Node] = []
+
+    @classmethod
+    def acquire(cls, node: Node) -> Buffer:
+        """
+        Get the shared TF buffer and register the node using it, the listener is created on the first call
+
+        :param node: ROS node using the TF buffer
+        :type node: Node
+
+        :return: Shared TF buffer
+        :rtype: Buffer
+        """
+        with cls._lock:
+            if cls._buffer is None:
+                cls._buffer = Buffer()
+            if cls._listener is None:
+                cls._set_listener_node(node)
+            cls._nodes.append(node)
+            return cls._buffer
+
+    @classmethod
+    def release(cls, node: Node) -> None:
+        """
+        Unregister a node using the TF buffer, the listener is moved if created on this node and the buffer is dropped on the last release
+
+        :param node: ROS node using the TF buffer
+        :type node: Node
+        """
+        with cls._lock:
+            if node not in cls._nodes:
+                return
+            cls._nodes.remove(node)
+            if node is cls._listener_node and node not in cls._nodes:
+                cls._listener.unregister()
+                cls._listener = None
+                cls._listener_node = None
+                if cls._nodes:
+                    cls._set_listener_node(cls._nodes[0])
+            if not cls._nodes:
+                cls._buffer = None
+
+    @classmethod
+    def _set_listener_node(cls, node: Node) -> None:
+        """
+        Creates the shared transform listener on the given node
+
+        :param node: ROS node
+        :type node: Node
+        """
+        cls._listener = TransformListener(
+            buffer=cls._buffer, node=node, spin_thread=False
+        )
+        cls._listener_node = node
+
+
+class _TFListenerBase(ABC):
+    """
+    Base of the ROS TF listeners: TF buffer and listener setup, lookup timer and transforms lookup
     """
 
     def __init__(
         self,
-        tf_config: Optional[TFListenerConfig] = None,
+        tf_config: Union[TFListenerConfig, MultiTFListenerConfig],
         node_name: Optional[str] = "",
+        shared: bool = False,
+        node: Optional[Node] = None,
     ) -> None:
         """
-        Sets up a transform listener in ros
+        Sets up the TF buffer of the listener
 
-        :param node: ROS node using the transform
-        :type node: Node
-        :param tf_config: Lookup config, defaults to TFListenerConfig()
-        :type tf_config: TFListenerConfig, optional
-        """
-        if not tf_config:
-            tf_config = TFListenerConfig()
+        :param tf_config: Lookup config
+        :type tf_config: Union[TFListenerConfig, MultiTFListenerConfig]
+        :param node_name: Name of the node using the transforms, defaults to ""
+        :type node_name: Optional[str], optional
+        :param shared: Use the process-wide shared TF buffer and listener. If False, a new buffer is created and a listener should be set using 'set_listener', defaults to False
+        :type shared: bool, optional
+        :param node: ROS node using the transforms, required to use the shared listener, defaults to None
+        :type node: Optional[Node], optional
 
-        self._tf_buffer = Buffer()
+        :raises ValueError: If the shared listener is requested without a node
+        """
         self.node_name = node_name
         self.config = tf_config
 
         self._tf_listener = None
+        self._shared_node: Optional[Node] = None
+        if shared:
+            if node is None:
+                raise ValueError("A node is required to use the shared TF listener")
+            self._tf_buffer = _SharedTFListener.acquire(node)
+            self._shared_node = node
+        else:
+            self._tf_buffer = Buffer()
 
-        self._timer = None  # timer to lookup the transform with given rate
-
-        # result
-        self.transform = None
-        self.got_transform = False
+        self._timer = None  # timer to lookup the transforms with given rate
 
     @property
     def tf_buffer(self):
@@ -100,23 +256,135 @@ class TFListener:
         """
         self._timer = node_timer
 
+    def _lookup(self, source_frame: str, goal_frame: str) -> Optional[TransformStamped]:
+        """
+        Lookup the latest transform from source frame to goal frame
+
+        :param source_frame: Source frame
+        :type source_frame: str
+        :param goal_frame: Goal frame
+        :type goal_frame: str
+
+        :return: Transform, None if the transform is not found
+        :rtype: Optional[TransformStamped]
+        """
+        try:
+            return self._tf_buffer.lookup_transform(goal_frame, source_frame, Time())
+        except (LookupException, ConnectivityException, ExtrapolationException):
+            get_logger(self.node_name).debug(
+                f"Failed to get transform from {source_frame} to {goal_frame}"
+            )
+            return None
+
+    def _stop_lookup(self) -> None:
+        """
+        Stops the lookup timer (used once static transforms are found)
+        """
+        if self._timer:
+            self._timer.cancel()
+
+    def _is_listening(self) -> bool:
+        """
+        Check if a transform listener is feeding the TF buffer
+
+        :return: Listener is set
+        :rtype: bool
+        """
+        return self._shared_node is not None or self._tf_listener is not None
+
+    def release(self) -> None:
+        """
+        Release the TF buffer: the shared buffer is dropped when released by all the TF listeners of the process
+        """
+        if self._shared_node is not None:
+            _SharedTFListener.release(self._shared_node)
+            self._shared_node = None
+        self._tf_listener = None
+
+    @abstractmethod
     def timer_callback(self):
         """
-        Timer callback to performe the requested transformation lookup
+        Timer callback to performe the requested transformations lookup
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def check_tf(self) -> bool:
+        """
+        Check if the requested transforms are found
+
+        :return: Transforms lookup found
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+
+class TFListener(_TFListenerBase):
+    """
+    ROS TF listener class to lookup a transformation and execute it
+    """
+
+    def __init__(
+        self,
+        tf_config: Optional[TFListenerConfig] = None,
+        node_name: Optional[str] = "",
+        shared: bool = False,
+        node: Optional[Node] = None,
+    ) -> None:
+        """
+        Sets up a transform listener in ros
+
+        :param tf_config: Lookup config, defaults to TFListenerConfig()
+        :type tf_config: TFListenerConfig, optional
+        :param node_name: Name of the node using the transform, defaults to ""
+        :type node_name: Optional[str], optional
+        :param shared: Use the process-wide shared TF buffer and listener. If False, a new buffer is created and a listener should be set using 'set_listener', defaults to False
+        :type shared: bool, optional
+        :param node: ROS node using the transform, required to use the shared listener, defaults to None
+        :type node: Optional[Node], optional
+        """
+        super().__init__(
+            tf_config=tf_config or TFListenerConfig(),
+            node_name=node_name,
+            shared=shared,
+            node=node,
+        )
+
+        # result
+        self.transform: Optional[TransformStamped] = None
+        self.got_transform = False
+        self._matrix: Optional[np.ndarray] = None
+
+    @property
+    def transform_matrix(self) -> Optional[np.ndarray]:
+        """
+        Last found transform as a 4x4 homogeneous transformation matrix
+
+        :return: Transformation matrix, None if the transform is not found
+        :rtype: Optional[np.ndarray]
+        """
+        if self.transform is None:
+            return None
+        if self._matrix is None:
+            self._matrix = transform_to_matrix(self.transform)
+        return self._matrix
+
+    def timer_callback(self):
+        """
+        Timer callback to performe the requested transformation lookup. For a static transform, the lookup stops once the transform is found
         """
         # Lookup transform if the listener is set
-        if self._tf_listener:
-            try:
-                # update the transform if found
-                self.transform = self._tf_buffer.lookup_transform(
-                    self.config.goal_frame, self.config.source_frame, Time()
-                )
-                self.got_transform = True
-
-            except (LookupException, ConnectivityException):
-                get_logger(self.node_name).debug(
-                    f"Failed to get transform from {self.config.source_frame} to {self.config.goal_frame}"
-                )
+        if self._is_listening():
+            transform = self._lookup(self.config.source_frame, self.config.goal_frame)
+            if transform is None:
+                return
+            # update the transform if found
+            self.transform = transform
+            self._matrix = None
+            self.got_transform = True
+            if self.config.static_tf:
+                # Static transform is cached
+                self._stop_lookup()
 
     def check_tf(self) -> bool:
         """
@@ -126,3 +394,119 @@ class TFListener:
         :rtype: bool
         """
         return self.got_transform
+
+
+class MultiTFListener(_TFListenerBase):
+    """
+    ROS TF listener class to lookup multiple transformations (frame pairs) in each lookup timer tick
+    """
+
+    def __init__(
+        self,
+        tf_config: Optional[MultiTFListenerConfig] = None,
+        node_name: Optional[str] = "",
+        shared: bool = False,
+        node: Optional[Node] = None,
+    ) -> None:
+        """
+        Sets up a multiple transforms listener in ros
+
+        :param tf_config: Lookup config, defaults to MultiTFListenerConfig()
+        :type tf_config: MultiTFListenerConfig, optional
+        :param node_name: Name of the node using the transforms, defaults to ""
+        :type node_name: Optional[str], optional
+        :param shared: Use the process-wide shared TF buffer and listener, defaults to False
+        :type shared: bool, optional
+        :param node: ROS node using the transforms, required to use the shared listener, defaults to None
+        :type node: Optional[Node], optional
+        """
+        super().__init__(
+            tf_config=tf_config or MultiTFListenerConfig(),
+            node_name=node_name,
+            shared=shared,
+            node=node,
+        )
+        # (source_frame, goal_frame): transform
+        self.transforms: Dict[Tuple[str, str], TransformStamped] = {}
+        self._matrices: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def timer_callback(self):
+        """
+        Timer callback to performe the requested transformations lookup. For static transforms, found transforms are cached and the lookup stops once all the transforms are found
+        """
+        if not self._is_listening():
+            return
+        for pair in self.config.frame_pairs:
+            if self.config.static_tf and pair in self.transforms:
+                continue
+            transform = self._lookup(*pair)
+            if transform is None:
+                continue
+            self.transforms[pair] = transform
+            self._matrices.pop(pair, None)
+        if self.config.static_tf and self.check_tf():
+            self._stop_lookup()
+
+    def check_tf(self) -> bool:
+        """
+        Check if all the transforms are found
+
+        :return: Transforms lookup found
+        :rtype: bool
+        """
+        return all(pair in self.transforms for pair in self.config.frame_pairs)
+
+    def get_transform(
+        self, source_frame: str, goal_frame: str
+    ) -> Optional[TransformStamped]:
+        """
+        Get the last found transform of a frame pair
+
+        :param source_frame: Source frame
+        :type source_frame: str
+        :param goal_frame: Goal frame
+        :type goal_frame: str
+
+        :return: Transform, None if the transform is not found
+        :rtype: Optional[TransformStamped]
+        """
+        return self.transforms.get((source_frame, goal_frame))
+
+    def get_matrix(self, source_frame: str, goal_frame: str) -> Optional[np.ndarray]:
+        """
+        Get the last found transform of a frame pair as a 4x4 homogeneous transformation matrix
+
+        :param source_frame: Source frame
+        :type source_frame: str
+        :param goal_frame: Goal frame
+        :type goal_frame: str
+
+        :return: Transformation matrix, None if the transform is not found
+        :rtype: Optional[np.ndarray]
+        """
+        pair = (source_frame, goal_frame)
+        if pair not in self.transforms:
+            return None
+        if pair not in self._matrices:
+            self._matrices[pair] = transform_to_matrix(self.transforms[pair])
+        return self._matrices[pair]
+
+    def get_matrices(
+        self, frame_pairs: Optional[List[Tuple[str, str]]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Get the last found transforms of a set of frame pairs as a stack of 4x4 homogeneous transformation matrices, to apply the transforms vectorized
+
+        :param frame_pairs: (source_frame, goal_frame) pairs, defaults to all the config frame pairs
+        :type frame_pairs: Optional[List[Tuple[str, str]]], optional
+
+        :return: Transformation matrices of shape (N, 4, 4) in the frame pairs order, None if a transform is not found
+        :rtype: Optional[np.ndarray]
+        """
+        matrices = []
+        for source_frame, goal_frame in frame_pairs or self.config.frame_pairs:
+            matrix = self.get_matrix(source_frame, goal_frame)
+            if matrix is None:
+                return None
+            matrices.append(matrix)
+        return np.stack(matrices) if matrices else np.empty((0, 4, 4))